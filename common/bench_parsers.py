@@ -0,0 +1,88 @@
+"""HTML 파서 백엔드 비교 - 저장된 페이지별 파싱 시간과 최대 메모리
+
+html_parser.make_soup이 고를 수 있는 BeautifulSoup 트리 빌더(html.parser, lxml)와,
+설치되어 있으면 selectolax(BeautifulSoup API가 아니라 참고용)를 같은 페이지로 비교한다.
+
+    python bench_parsers.py [--fixtures 디렉터리] [HTML 파일 ...] [--repeat N]
+
+각 앱 디렉터리에서 그 앱의 저장된 페이지로 실행한다.
+
+    cd deepen1 && python ../common/bench_parsers.py --fixtures fixtures youtube_mobile.html
+    cd first/web2 && python ../../common/bench_parsers.py --fixtures fixtures
+
+메모리는 tracemalloc 기준 (lxml/selectolax의 C 라이브러리 내부 할당은 포함되지 않음).
+"""
+import argparse
+import glob
+import os
+import time
+import tracemalloc
+
+from html_parser import PARSER, PARSER_PREFERENCE, is_available, make_soup
+
+
+def _selectolax_parse(html):
+    from selectolax.lexbor import LexborHTMLParser
+    return LexborHTMLParser(html)
+
+
+def backends():
+    """(이름, 파싱 함수) 목록 - 설치된 것만"""
+    # html.parser(기준)부터
+    available = [(name, lambda html, name=name: make_soup(html, name))
+                 for name in reversed(PARSER_PREFERENCE) if is_available(name)]
+    try:
+        import selectolax.lexbor  # noqa: F401
+        available.append(('selectolax (참고)', _selectolax_parse))
+    except ImportError:
+        pass
+    return available
+
+
+def measure(parse, html, repeat):
+    """평균 파싱 시간(초)과 최대 메모리(바이트)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse(html)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    tree = parse(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return sum(timings) / len(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 백엔드 비교')
+    parser.add_argument('pages', nargs='*', help='HTML 파일')
+    parser.add_argument('--fixtures', help='이 디렉터리의 *.html 전체')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    pages = list(args.pages)
+    if args.fixtures:
+        pages = sorted(glob.glob(os.path.join(args.fixtures, '*.html'))) + pages
+    if not pages:
+        parser.error('--fixtures 또는 HTML 파일을 지정하세요')
+
+    print(f"현재 기본 파서: {PARSER} (HTML_PARSER 환경변수로 변경)")
+    for path in pages:
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        print("\n" + "=" * 64)
+        print(f"{os.path.basename(path)} ({len(html.encode('utf-8')) / 1024:.0f}KB), {args.repeat}회 평균")
+        print("=" * 64)
+
+        baseline = None
+        for name, parse in backends():
+            seconds, peak = measure(parse, html, args.repeat)
+            baseline = baseline or seconds
+            print(f"  {name:<18} {seconds * 1000:8.1f}ms  최대 메모리 {peak / 1024 / 1024:6.1f}MB  "
+                  f"(html.parser 대비 {baseline / seconds:.1f}배)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+HTML 파서 백엔드 선택
+
+추출 코드는 BeautifulSoup API(find_all, select 등)를 그대로 쓰고, 트리 빌더만
+설치된 것 중 가장 빠른 것으로 고른다 (lxml > html.parser).
+HTML_PARSER 환경변수로 고정할 수 있다 ('auto', 'lxml', 'html.parser').
+"""
+import os
+
+from bs4 import BeautifulSoup
+
+# 빠른 순서 (lxml은 선택 설치: pip install lxml)
+PARSER_PREFERENCE = ('lxml', 'html.parser')
+
+
+def is_available(backend):
+    """트리 빌더 사용 가능 여부"""
+    if backend == 'lxml':
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            return False
+    return backend in PARSER_PREFERENCE
+
+
+def choose_parser(preferred=None):
+    """사용할 파서 이름 (지정한 파서가 없으면 자동 선택)"""
+    preferred = preferred or os.getenv('HTML_PARSER', 'auto')
+    if preferred != 'auto':
+        if is_available(preferred):
+            return preferred
+        print(f"[HTML 파서] {preferred} 사용 불가, 자동 선택")
+    for backend in PARSER_PREFERENCE:
+        if is_available(backend):
+            return backend
+    return 'html.parser'
+
+
+PARSER = choose_parser()
+
+
+def make_soup(markup, parser=None, parse_only=None):
+    """BeautifulSoup 객체 생성 (기본: PARSER, parse_only: 필요한 부분만 파싱할 SoupStrainer)"""
+    return BeautifulSoup(markup, parser or PARSER, parse_only=parse_only)
@@ -0,0 +1,171 @@
+"""
+JSON 응답 (빠른 인코더, 필드 선택, gzip/brotli 압축, 엔드포인트별 통계)
+deepen1과 first/web2가 함께 사용 (각 앱이 이 폴더를 sys.path에 추가)
+
+    return json_response(data)                               # jsonify 대신
+    return json_response(data, fields=requested_fields())    # 목록 API (?fields= 적용)
+    return bytes_response(body, etag=etag)                   # 미리 직렬화한 본문 (ETag가 같으면 304)
+
+- 직렬화: orjson이 설치되어 있으면 사용 (pip install orjson), 없으면 Flask 기본 JSON (JSON_ENCODER)
+- ?fields=title,url: fields를 넘긴 목록 API에서만, 결과 목록(딕셔너리 리스트)의 항목마다 해당 키만 남김
+  (화면에 안 쓰는 컬럼 제외, 오류 응답이나 다른 API에는 적용하지 않음)
+- 압축: Accept-Encoding에 br/gzip이 있고 본문이 COMPRESS_MIN_BYTES 이상이면 압축
+  (br은 brotli 설치 시, pip install brotli), ETag가 있는 본문은 압축 결과를 재사용
+- 엔드포인트별 요청 수, 원본/전송 바이트, 직렬화/압축 시간 → stats(), 응답마다 Server-Timing 헤더
+"""
+import gzip
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Response, current_app, request
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 압축 설정 (환경변수로 조정)
+COMPRESS_MIN_BYTES = int(os.getenv('COMPRESS_MIN_BYTES', '1024'))  # 이보다 작은 본문은 압축 안 함
+GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', '6'))
+BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', '5'))  # 기본값 11은 압축이 매우 느림
+COMPRESSED_CACHE_SIZE = 32  # ETag별 압축 결과 보관 수
+
+# JSON_ENCODER=json이면 orjson이 설치되어 있어도 Flask 기본 JSON (비교용)
+ENCODER = 'orjson' if orjson is not None and os.getenv('JSON_ENCODER', 'orjson') != 'json' else 'json'
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+_lock = threading.Lock()
+_stats = {}  # 엔드포인트 -> 누적 통계
+_compressed = OrderedDict()  # (ETag, 인코딩) -> 압축 본문, 오래 쓰지 않은 순서
+
+
+def dumps(data):
+    """JSON 직렬화 (bytes, UTF-8)"""
+    if ENCODER == 'orjson':
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return current_app.json.dumps(data).encode('utf-8')
+
+
+def requested_fields(args=None):
+    """?fields= 값 (없으면 None)"""
+    value = (args if args is not None else request.args).get('fields', '')
+    fields = tuple(field.strip() for field in value.split(',') if field.strip())
+    return fields or None
+
+
+def project(data, fields):
+    """결과 목록(딕셔너리 리스트)의 항목마다 fields에 있는 키만 남김 (중첩된 목록도, 나머지 값은 그대로)"""
+    if not fields:
+        return data
+    if isinstance(data, dict):
+        return {key: project(value, fields) for key, value in data.items()}
+    if isinstance(data, list) and data and isinstance(data[0], dict):
+        return [{key: item[key] for key in fields if key in item} for item in data]
+    return data
+
+
+def json_response(data, status=200, fields=None):
+    """직렬화한 JSON 응답 (fields: 목록 항목마다 남길 키, 없으면 그대로)"""
+    started = time.perf_counter()
+    body = dumps(project(data, fields))
+    return bytes_response(body, status=status, serialize_seconds=time.perf_counter() - started)
+
+
+def bytes_response(body, status=200, etag=None, cache_control=None, serialize_seconds=0.0):
+    """JSON 본문 응답 (압축 협상, ETag가 있으면 If-None-Match 확인 후 304)"""
+    encoding = choose_encoding(len(body))
+    headers = {'Vary': 'Accept-Encoding'}
+    if cache_control:
+        headers['Cache-Control'] = cache_control
+
+    if etag:
+        # 인코딩마다 본문이 다르므로 강한 ETag도 다르게
+        etag = f'{etag}-{encoding}' if encoding else etag
+        if request.if_none_match.contains(etag):
+            response = Response(status=304, headers=headers)
+            response.set_etag(etag)
+            _record(len(body), 0, serialize_seconds, 0.0, response)
+            return response
+
+    started = time.perf_counter()
+    sent = compress(body, encoding, etag) if encoding else body
+    compress_seconds = time.perf_counter() - started
+
+    response = Response(sent, status=status, mimetype='application/json', headers=headers)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if etag:
+        response.set_etag(etag)
+    _record(len(body), len(sent), serialize_seconds, compress_seconds, response)
+    return response
+
+
+def choose_encoding(size):
+    """요청의 Accept-Encoding에서 사용할 압축 (압축 안 하면 None)"""
+    if size < COMPRESS_MIN_BYTES:
+        return None
+    for encoding in ENCODINGS:
+        if request.accept_encodings[encoding]:
+            return encoding
+    return None
+
+
+def compress(body, encoding, etag=None):
+    """본문 압축 (ETag가 있으면 같은 본문의 압축 결과 재사용)"""
+    key = (etag, encoding)
+    if etag:
+        with _lock:
+            cached = _compressed.get(key)
+            if cached is not None:
+                _compressed.move_to_end(key)
+                return cached
+
+    if encoding == 'br':
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+    if etag:
+        with _lock:
+            _compressed[key] = compressed
+            while len(_compressed) > COMPRESSED_CACHE_SIZE:
+                _compressed.popitem(last=False)
+    return compressed
+
+
+def _record(raw_bytes, sent_bytes, serialize_seconds, compress_seconds, response):
+    """엔드포인트별 통계 누적, Server-Timing 헤더 (브라우저 개발자 도구 Timing 탭에 표시)"""
+    response.headers['Server-Timing'] = (f'serialize;dur={serialize_seconds * 1000:.2f}, '
+                                         f'compress;dur={compress_seconds * 1000:.2f}')
+    endpoint = request.endpoint or request.path
+    with _lock:
+        stats = _stats.setdefault(endpoint, {
+            'requests': 0, 'not_modified': 0, 'compressed': 0,
+            'raw_bytes': 0, 'sent_bytes': 0, 'serialize_seconds': 0.0, 'compress_seconds': 0.0,
+        })
+        stats['requests'] += 1
+        stats['not_modified'] += response.status_code == 304
+        stats['compressed'] += 'Content-Encoding' in response.headers
+        stats['raw_bytes'] += raw_bytes
+        stats['sent_bytes'] += sent_bytes
+        stats['serialize_seconds'] += serialize_seconds
+        stats['compress_seconds'] += compress_seconds
+
+
+def stats():
+    """엔드포인트별 응답 통계 (평균 직렬화/압축 시간은 밀리초)"""
+    with _lock:
+        snapshot = {endpoint: dict(values) for endpoint, values in _stats.items()}
+    for values in snapshot.values():
+        requests = values['requests']
+        values['serialize_ms_avg'] = round(values.pop('serialize_seconds') / requests * 1000, 3)
+        values['compress_ms_avg'] = round(values.pop('compress_seconds') / requests * 1000, 3)
+        values['ratio'] = round(values['sent_bytes'] / values['raw_bytes'], 3) if values['raw_bytes'] else None
+    return {'encoder': ENCODER, 'encodings': list(ENCODINGS), 'endpoints': snapshot}
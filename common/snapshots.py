@@ -0,0 +1,227 @@
+"""
+크롤링한 원본 페이지 스냅샷 저장소
+
+가져온 페이지(HTML, continuation JSON)를 gzip으로 압축해 provider/날짜별 폴더에 저장한다.
+선택자가 바뀌어 파싱이 깨져도 다시 크롤링하지 않고 저장된 페이지로 재파싱할 수 있다
+(replay_snapshots.py). 전체 크기가 한도를 넘으면 오래된 스냅샷부터 삭제한다.
+저장 폴더는 앱마다 다르므로 각 앱의 snapshot_store.py가 SnapshotStore(폴더)를 만든다.
+
+파일 이름: <provider>/<YYYYMMDD>/<UTC 시각>_<run>_<page>_<키워드 해시>.json.gz
+한 번의 크롤링(run)에서 가져온 페이지들은 같은 run 값을 가진다.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+
+# 스냅샷 설정 (환경변수로 조정, 저장 폴더 SNAPSHOT_DIR은 각 앱의 snapshot_store.py)
+SNAPSHOT_ENABLED = os.getenv('SNAPSHOTS', '1') == '1'
+SNAPSHOT_MAX_MB = int(os.getenv('SNAPSHOT_MAX_MB', '500'))  # 전체 크기 한도 (압축 후)
+
+TIMESTAMP_FORMAT = '%Y%m%dT%H%M%S%fZ'
+PRUNE_TARGET = 0.9  # 한도를 넘으면 한도의 90%까지 삭제
+RESCAN_EVERY = 100  # N회 저장마다 디스크 사용량 다시 계산 (다른 프로세스가 저장한 분 반영)
+
+
+def new_run_id():
+    """크롤링 1회를 묶는 ID"""
+    return uuid.uuid4().hex[:12]
+
+
+def keyword_key(keyword):
+    """파일 이름용 키워드 해시 (원래 키워드는 파일 안에 저장)"""
+    return hashlib.sha1(keyword.encode('utf-8')).hexdigest()[:10]
+
+
+class Snapshot:
+    """스냅샷 파일 하나 (파일 이름만으로 알 수 있는 정보, 내용은 load()로)"""
+
+    def __init__(self, path, provider):
+        self.path = path
+        self.provider = provider
+        name = os.path.basename(path)[:-len('.json.gz')]
+        timestamp, self.run, page, self.keyword_key = name.split('_')
+        self.fetched_at = datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+        self.page = int(page)
+
+    def load(self):
+        """{'provider', 'keyword', 'url', 'fetched_at', 'run', 'page', 'kind', 'content', ...}"""
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def __repr__(self):
+        return f"<Snapshot {self.provider} {self.fetched_at:%Y-%m-%d %H:%M:%S} run={self.run} page={self.page}>"
+
+
+class SnapshotStore:
+    """gzip 스냅샷 저장/조회/정리"""
+
+    def __init__(self, root, max_bytes=SNAPSHOT_MAX_MB * 1024 * 1024, enabled=SNAPSHOT_ENABLED):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._usage = None  # 디스크 사용량 (처음 저장할 때 계산)
+        self._saves = 0
+
+    def save(self, provider, keyword, content, url='', run=None, page=0, kind='html', **meta):
+        """
+        페이지 저장 (저장 실패는 크롤링에 영향을 주지 않도록 경고만 출력)
+
+        Args:
+            provider: 'google', 'youtube', 'google_news', 'naver_news', 'article' 등
+            keyword: 검색 키워드
+            content: 페이지 HTML 또는 JSON 문자열
+            run: new_run_id() 값 (같은 크롤링의 페이지를 묶음)
+            page: 크롤링 안에서의 페이지 순서
+            kind: 'html' 또는 'json'
+            meta: 그 밖의 정보 (source='browser' 등)
+
+        Returns:
+            str: 저장한 파일 경로 (비활성화/실패 시 None)
+        """
+        if not self.enabled or not content:
+            return None
+
+        fetched_at = datetime.utcnow()
+        run = run or new_run_id()
+        directory = os.path.join(self.root, provider, fetched_at.strftime('%Y%m%d'))
+        name = f"{fetched_at.strftime(TIMESTAMP_FORMAT)}_{run}_{page:03d}_{keyword_key(keyword)}.json.gz"
+        path = os.path.join(directory, name)
+
+        record = dict(meta, provider=provider, keyword=keyword, url=url,
+                      fetched_at=fetched_at.isoformat(), run=run, page=page, kind=kind, content=content)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with gzip.open(path, 'wt', encoding='utf-8', compresslevel=6) as f:
+                json.dump(record, f, ensure_ascii=False)
+            size = os.path.getsize(path)
+        except OSError as e:
+            print(f"[스냅샷] 저장 실패: {e}")
+            return None
+
+        with self._lock:
+            self._saves += 1
+            if self._usage is None or self._saves % RESCAN_EVERY == 0:
+                self._usage = self._scan_usage()
+            else:
+                self._usage += size
+            over_limit = self.max_bytes and self._usage > self.max_bytes
+        if over_limit:
+            self.prune()
+        return path
+
+    def list(self, provider=None, keyword=None, run=None):
+        """조건에 맞는 스냅샷 목록 (오래된 순)"""
+        key = keyword_key(keyword) if keyword is not None else None
+        snapshots = []
+        providers = [provider] if provider else self._providers()
+        for name in providers:
+            for path in self._files(name):
+                try:
+                    snapshot = Snapshot(path, name)
+                except ValueError:
+                    continue
+                if key is not None and snapshot.keyword_key != key:
+                    continue
+                if run is not None and snapshot.run != run:
+                    continue
+                snapshots.append(snapshot)
+        snapshots.sort(key=lambda s: (s.fetched_at, s.page))
+        return snapshots
+
+    def runs(self, provider=None, keyword=None):
+        """{run: [스냅샷, ...] (페이지 순)} - 크롤링 시작 시각 순"""
+        grouped = {}
+        for snapshot in self.list(provider, keyword):
+            grouped.setdefault(snapshot.run, []).append(snapshot)
+        for pages in grouped.values():
+            pages.sort(key=lambda s: s.page)
+        return dict(sorted(grouped.items(), key=lambda item: item[1][0].fetched_at))
+
+    def run_pages(self, provider, run):
+        """크롤링 하나(run)의 페이지들 (페이지 순, 정리되어 없으면 빈 리스트)"""
+        return sorted(self.list(provider, run=run), key=lambda s: s.page)
+
+    def latest_run(self, provider, keyword, before=None):
+        """
+        키워드의 가장 최근 크롤링 페이지들
+
+        Args:
+            before: 이 시각(UTC) 이전에 시작한 크롤링만 (검색 기록과 맞출 때)
+        """
+        latest = []
+        for pages in self.runs(provider, keyword).values():
+            if before is None or pages[0].fetched_at <= before:
+                latest = pages
+        return latest
+
+    def usage(self):
+        """전체 스냅샷 크기 (바이트)"""
+        return self._scan_usage()
+
+    def prune(self):
+        """한도를 넘으면 오래된 스냅샷부터 삭제, 삭제한 파일 수 반환"""
+        with self._lock:
+            files = []
+            for provider in self._providers():
+                for path in self._files(provider):
+                    try:
+                        files.append((os.path.basename(path), path, os.path.getsize(path)))
+                    except OSError:
+                        continue
+            usage = sum(size for _, _, size in files)
+            target = self.max_bytes * PRUNE_TARGET
+            deleted = 0
+            # 파일 이름이 UTC 시각으로 시작하므로 이름순 = 오래된 순
+            for _, path, size in sorted(files):
+                if usage <= target:
+                    break
+                try:
+                    os.remove(path)
+                    usage -= size
+                    deleted += 1
+                except OSError:
+                    continue
+                try:
+                    os.rmdir(os.path.dirname(path))  # 비어 있는 날짜 폴더 정리
+                except OSError:
+                    pass
+            self._usage = usage
+        if deleted:
+            print(f"[스냅샷] 용량 한도 초과, 오래된 스냅샷 {deleted}개 삭제 ({usage / 1024 / 1024:.1f}MB)")
+        return deleted
+
+    def _providers(self):
+        try:
+            return sorted(entry.name for entry in os.scandir(self.root) if entry.is_dir())
+        except OSError:
+            return []
+
+    def _files(self, provider):
+        base = os.path.join(self.root, provider)
+        try:
+            days = sorted(entry.path for entry in os.scandir(base) if entry.is_dir())
+        except OSError:
+            return
+        for day in days:
+            try:
+                names = sorted(os.listdir(day))
+            except OSError:
+                continue
+            for name in names:
+                if name.endswith('.json.gz'):
+                    yield os.path.join(day, name)
+
+    def _scan_usage(self):
+        total = 0
+        for provider in self._providers():
+            for path in self._files(provider):
+                try:
+                    total += os.path.getsize(path)
+                except OSError:
+                    continue
+        return total
@@ -0,0 +1,37 @@
+"""
+SQLite 연결 PRAGMA - deepen1(SQLAlchemy)과 web2(sqlite3)의 모든 연결에 같은 설정 적용
+
+    WAL             읽기가 크롤링/스케줄러의 쓰기를 기다리지 않음 (쓰기는 여전히 한 번에 하나)
+    synchronous     NORMAL: WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않음 (전원 차단 시 마지막 커밋만 유실 가능)
+    cache/mmap      페이지 캐시와 메모리 매핑 크기
+    busy_timeout    다른 연결이 쓰는 중이면 바로 "database is locked"를 내지 않고 기다림
+    foreign_keys    ON DELETE CASCADE 등 외래 키 제약 적용 (SQLite 기본은 꺼짐)
+
+연결을 만드는 방법은 앱마다 다르므로 각 앱의 sqlite_tuning.py가 apply_pragmas를 호출한다
+(deepen1: install(engine), web2: connect(path)).
+"""
+import os
+
+# SQLite 설정 (환경변수로 조정)
+SQLITE_WAL = os.getenv('SQLITE_WAL', '1') == '1'  # 네트워크 드라이브 등 WAL을 못 쓰는 곳이면 0
+SQLITE_CACHE_MB = int(os.getenv('SQLITE_CACHE_MB', '16'))  # 연결당 페이지 캐시
+SQLITE_MMAP_MB = int(os.getenv('SQLITE_MMAP_MB', '128'))  # 메모리 매핑 크기 (0이면 사용 안 함)
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '10000'))  # 잠금 대기 시간
+
+PRAGMAS = (
+    f"PRAGMA journal_mode={'WAL' if SQLITE_WAL else 'DELETE'}",
+    'PRAGMA synchronous=NORMAL',
+    f'PRAGMA cache_size=-{SQLITE_CACHE_MB * 1024}',  # 음수면 KB 단위
+    f'PRAGMA mmap_size={SQLITE_MMAP_MB * 1024 * 1024}',
+    f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}',
+    'PRAGMA foreign_keys=ON',
+    'PRAGMA temp_store=MEMORY',
+)
+
+
+def apply_pragmas(conn):
+    """연결에 PRAGMA 적용 (연결을 연 직후, 트랜잭션 밖에서)"""
+    cursor = conn.cursor()
+    for pragma in PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
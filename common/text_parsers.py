@@ -0,0 +1,127 @@
+"""
+검색 결과 텍스트 파싱 (게시 시각, 조회수)
+
+"3시간 전", "2 weeks ago", "2025. 7. 2." 같은 시각 표현과 "조회수 1.5천회", "1.2M views" 같은
+조회수 표현을 변환한다. 형식마다 미리 컴파일한 정규식 하나와 단위 표(한국어/영어)로 처리하며,
+결과 목록을 한 번에 변환하는 함수는 같은 기준 시각(now) 하나를 사용한다.
+변환할 수 없으면 None을 반환한다 (현재 시각이나 0으로 대신하지 않음).
+"""
+import re
+from datetime import datetime, timedelta
+
+# 상대 시각 단위 (영어는 소문자, 복수형 s 제거 후 조회)
+RELATIVE_UNITS = {
+    '초': timedelta(seconds=1),
+    '분': timedelta(minutes=1),
+    '시간': timedelta(hours=1),
+    '일': timedelta(days=1),
+    '주': timedelta(weeks=1),
+    '개월': timedelta(days=30),
+    '달': timedelta(days=30),
+    '년': timedelta(days=365),
+    'sec': timedelta(seconds=1),
+    'second': timedelta(seconds=1),
+    'min': timedelta(minutes=1),
+    'minute': timedelta(minutes=1),
+    'hr': timedelta(hours=1),
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+    'year': timedelta(days=365),
+}
+
+# 숫자 없는 표현
+RELATIVE_WORDS = {
+    '방금': timedelta(0),
+    'just now': timedelta(0),
+    '어제': timedelta(days=1),
+    'yesterday': timedelta(days=1),
+}
+
+# 조회수 단위
+VIEW_UNITS = {
+    '천': 1_000,
+    '만': 10_000,
+    '억': 100_000_000,
+    'k': 1_000,
+    'm': 1_000_000,
+    'b': 1_000_000_000,
+}
+
+# "3시간 전", "3시간전", "3 hours ago"
+_RELATIVE_PATTERN = re.compile(
+    r'(\d+)\s*(초|분|시간|일|주|개월|달|년|secs?|seconds?|mins?|minutes?|hrs?|hours?|days?|weeks?|months?|years?)\s*(?:전|ago)',
+    re.IGNORECASE
+)
+_RELATIVE_WORD_PATTERN = re.compile('|'.join(RELATIVE_WORDS), re.IGNORECASE)
+# "2025. 7. 2.", "2025.07.02", "2025-07-02", "2025년 7월 2일"
+_DATE_PATTERN = re.compile(r'(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})')
+# "조회수 1,234회", "1.5천회", "140만회", "1.2K views"
+_VIEW_PATTERN = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*(천|만|억|[kmb](?![a-z]))?', re.IGNORECASE)
+
+
+def parse_relative_time(text, now=None):
+    """
+    게시 시각 텍스트를 datetime으로 변환
+
+    Args:
+        text: "3시간 전", "2 weeks ago", "어제", "2025. 7. 2." 등
+        now: 상대 시각의 기준 (없으면 현재 시각)
+
+    Returns:
+        datetime: 변환 결과 (변환할 수 없으면 None)
+    """
+    if not text:
+        return None
+
+    match = _RELATIVE_PATTERN.search(text)
+    if match:
+        unit = match.group(2).lower()
+        delta = RELATIVE_UNITS.get(unit) or RELATIVE_UNITS[unit.rstrip('s')]
+        return (now or datetime.now()) - int(match.group(1)) * delta
+
+    match = _RELATIVE_WORD_PATTERN.search(text)
+    if match:
+        return (now or datetime.now()) - RELATIVE_WORDS[match.group(0).lower()]
+
+    match = _DATE_PATTERN.search(text)
+    if match:
+        try:
+            return datetime(*(int(part) for part in match.groups()))
+        except ValueError:
+            return None
+    return None
+
+
+def parse_relative_times(texts, now=None):
+    """게시 시각 텍스트 목록을 한 번에 변환 (모두 같은 기준 시각 사용)"""
+    now = now or datetime.now()
+    return [parse_relative_time(text, now) for text in texts]
+
+
+def parse_view_count(text):
+    """
+    조회수 텍스트를 숫자로 변환
+
+    Args:
+        text: "조회수 1.5천회", "조회수 1,234회", "1.2M views" 등
+
+    Returns:
+        int: 조회수 (숫자가 없으면 None)
+    """
+    if not text:
+        return None
+    match = _VIEW_PATTERN.search(text)
+    if not match:
+        return None
+    number = float(match.group(1).replace(',', ''))
+    unit = match.group(2)
+    if unit:
+        number *= VIEW_UNITS[unit.lower()]
+    return int(round(number))
+
+
+def parse_view_counts(texts):
+    """조회수 텍스트 목록을 한 번에 변환"""
+    return [parse_view_count(text) for text in texts]
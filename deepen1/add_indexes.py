@@ -0,0 +1,39 @@
+"""기존 데이터베이스에 models.py에 선언된 인덱스 추가 (검색 기록/결과 조회, 정렬용)
+
+db.create_all()은 이미 있는 테이블에 인덱스를 추가하지 않으므로 한 번 실행한다.
+이미 있는 인덱스는 건너뛰고, 끝나면 ANALYZE로 쿼리 플래너 통계를 갱신한다.
+결과가 많으면 인덱스 생성에 시간이 걸릴 수 있다 (서버를 끄고 실행).
+
+    python add_indexes.py
+"""
+from app import app, db
+from sqlalchemy import inspect, text
+
+with app.app_context():
+    try:
+        existing = set()
+        inspector = inspect(db.engine)
+        for table in db.metadata.sorted_tables:
+            existing.update(index['name'] for index in inspector.get_indexes(table.name))
+
+        with db.engine.connect() as conn:
+            for table in db.metadata.sorted_tables:
+                for index in sorted(table.indexes, key=lambda index: index.name):
+                    if index.name in existing:
+                        print(f"✓ {index.name} 인덱스가 이미 존재합니다")
+                        continue
+                    index.create(conn)
+                    conn.commit()
+                    print(f"✓ {index.name} 인덱스 추가 완료 ({table.name}: {', '.join(c.name for c in index.columns)})")
+
+            # 쿼리 플래너 통계 갱신 (인덱스 선택에 사용)
+            conn.execute(text("ANALYZE"))
+            conn.commit()
+            print("✓ ANALYZE 완료")
+
+        print("\n✅ 인덱스 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
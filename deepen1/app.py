@@ -1,10 +1,23 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for
-from models import db, SearchHistory, GoogleResult, YouTubeResult
-from crawler import crawl_all
-from datetime import datetime
+import common_path  # noqa: F401 - 저장소 최상위 common/ 모듈 경로 (json_response 등)
+from flask import Flask, Response, render_template, request, redirect, url_for
+from models import db, SearchHistory, SearchPayload, SearchSnapshotRun, GoogleResult, YouTubeResult
+from crawler import crawl_all, run_engine
+from crawler_worker import crawler_worker
+from job_queue import CrawlJobQueue
+from crawl_events import CrawlEvents, format_event
+from crawl_log import CrawlLogger, install as install_crawl_log
+from sqlite_tuning import install as install_sqlite_pragmas
+from result_query import (ResultFilters, google_query, youtube_query, fetch_page, count_rows,
+                          history_query, parse_limit, HISTORY_SORT, HISTORY_PAGE_SIZE)
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from ttl_store import TTLStore
+from json_response import (json_response, bytes_response, dumps, project, requested_fields,
+                           stats as response_stats)
+import hashlib
 import os
 import sys
-import threading
+import time
 
 # Windows 콘솔 UTF-8 인코딩 설정 (이모지 및 특수문자 지원)
 if sys.platform == 'win32':
@@ -12,20 +25,40 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# 크롤링 중 print 출력을 크롤링별 로그로 (crawl_log.py)
+install_crawl_log()
+
 app = Flask(__name__)
 
 # 데이터베이스 설정
 basedir = os.path.abspath(os.path.dirname(__file__))
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(basedir, 'database.db')
+app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.getenv('DATABASE_PATH', os.path.join(basedir, 'database.db'))
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = 'your-secret-key-here-change-in-production'
 
-# 데이터베이스 초기화
+# 크롤링을 상주 브라우저 워커 프로세스에서 실행 (CRAWLER_WORKER=0 이면 요청마다 브라우저 실행)
+app.config['CRAWLER_WORKER_ENABLED'] = os.getenv('CRAWLER_WORKER', '1') == '1'
+# 구글/유튜브를 병렬로 크롤링 (엔진별 타임아웃, 초)
+app.config['CRAWL_CONCURRENT'] = os.getenv('CRAWL_CONCURRENT', '1') == '1'
+app.config['CRAWL_ENGINE_TIMEOUT'] = int(os.getenv('CRAWL_ENGINE_TIMEOUT', '180'))
+# 진행 스트림(/crawl-events)에서 새 이벤트가 없을 때 연결 유지 신호를 보내는 주기 (초)
+app.config['CRAWL_EVENTS_KEEPALIVE'] = int(os.getenv('CRAWL_EVENTS_KEEPALIVE', '10'))
+# 필터를 적용한 /api/results 응답 캐시 크기 (항목 수)와 마지막 사용 후 보관 시간 (초)
+app.config['RESULTS_CACHE_SIZE'] = int(os.getenv('RESULTS_CACHE_SIZE', '256'))
+app.config['RESULTS_CACHE_TTL'] = int(os.getenv('RESULTS_CACHE_TTL', '600'))
+
+# 데이터베이스 초기화 (모든 연결에 WAL, busy_timeout, foreign_keys 등 적용, sqlite_tuning.py)
 db.init_app(app)
+with app.app_context():
+    install_sqlite_pragmas(db.engine)
 
-# 크롤링 상태 및 로그 저장
-crawling_status = {}
-crawling_logs = {}  # 크롤링 로그 저장
+# 필터를 적용한 /api/results 응답 캐시 (필터 값별 직렬화 본문, 개수/시간 제한 LRU)
+results_cache = TTLStore(max_entries=app.config['RESULTS_CACHE_SIZE'], ttl=app.config['RESULTS_CACHE_TTL'])
+# 키워드를 수정하면 본문이 바뀌므로 브라우저는 매번 ETag로 확인 (바뀌지 않았으면 304)
+RESULTS_CACHE_CONTROL = 'no-cache'
+
+# 크롤링 진행 이벤트 (상태 변경, 로그) - 작업 상태 자체는 crawl_jobs 테이블 (job_queue.py)
+crawl_events = CrawlEvents()
 
 
 @app.route('/')
@@ -41,36 +74,91 @@ def search():
     keyword = data.get('keyword', '').strip()
     
     if not keyword:
-        return jsonify({'error': '키워드를 입력해주세요.'}), 400
+        return json_response({'error': '키워드를 입력해주세요.'}), 400
     
-    # 크롤링 시작
     try:
-        # 크롤링 ID 생성
-        crawl_id = f"{keyword}_{datetime.now().timestamp()}"
-        crawling_status[crawl_id] = {'status': 'running', 'progress': 0}
-        
-        # 백그라운드에서 크롤링 실행
-        thread = threading.Thread(target=perform_crawling, args=(keyword, crawl_id))
-        thread.start()
+        priority = int(data.get('priority', 0))
+    except (TypeError, ValueError):
+        return json_response({'error': 'priority는 정수여야 합니다.'}), 400
+    
+    # 크롤링 작업을 대기열에 추가 (워커 스레드가 우선순위 순서로 실행)
+    try:
+        crawl_id = job_queue.submit(keyword, priority=priority)
+        status = job_queue.status(crawl_id)
         
-        return jsonify({
+        return json_response({
             'message': '크롤링을 시작했습니다.',
-            'crawl_id': crawl_id
+            'crawl_id': crawl_id,
+            'status': STATUS_NAMES[status['state']],
+            'queue_position': status['queue_position'],
+            'eta_seconds': status['eta_seconds']
         })
         
     except Exception as e:
-        return jsonify({'error': f'오류 발생: {str(e)}'}), 500
+        return json_response({'error': f'오류 발생: {str(e)}'}), 500
+
+
+def bulk_insert(model, rows):
+    """
+    행 목록을 INSERT 한 번(executemany)으로 세션에 추가 (ORM 객체를 만들지 않음, 커밋은 호출한 쪽에서)
+    
+    Returns:
+        int: 추가한 행 수
+    """
+    if not rows:
+        return 0
+    db.session.execute(model.__table__.insert(), rows)
+    return len(rows)
+
+
+def add_google_results(search_id, results):
+    """구글 크롤링 결과를 한 번에 추가, 추가한 행 수 반환 (커밋은 호출한 쪽에서)"""
+    return bulk_insert(GoogleResult, [{
+        'search_id': search_id,
+        'title': result['title'],
+        'url': result['url'],
+        'snippet': result.get('snippet', ''),
+        'source': result.get('source', ''),
+        'thumbnail': result.get('thumbnail', ''),
+        'position': result.get('position', 0),
+        'result_type': result.get('result_type', '일반'),
+        'published_date': result.get('published_date', ''),
+        'is_ad': result.get('is_ad', False)
+    } for result in results])
+
+
+def add_youtube_results(search_id, results):
+    """유튜브 크롤링 결과를 한 번에 추가, 추가한 행 수 반환 (커밋은 호출한 쪽에서)"""
+    return bulk_insert(YouTubeResult, [{
+        'search_id': search_id,
+        'title': result['title'],
+        'url': result['url'],
+        'video_id': result.get('video_id', ''),
+        'thumbnail': result.get('thumbnail', ''),
+        'channel_name': result.get('channel_name', ''),
+        'view_count': result.get('view_count', ''),
+        'view_count_numeric': result.get('view_count_numeric', 0),
+        'upload_date': result.get('upload_date', ''),
+        'upload_timestamp': result.get('upload_timestamp'),
+        'like_count': result.get('like_count', ''),
+        'duration': result.get('duration', ''),
+        'position': result.get('position', 0),
+        'is_short': result.get('is_short', False),
+        'short_shelf_index': result.get('short_shelf_index'),
+        'position_in_shelf': result.get('position_in_shelf')
+    } for result in results])
 
 
 def perform_crawling(keyword, crawl_id):
-    """실제 크롤링 수행 (백그라운드)"""
-    # 로그 초기화
-    crawling_logs[crawl_id] = []
+    """
+    실제 크롤링 수행 (작업 큐 워커 스레드에서 실행)
     
-    def add_log(message):
-        """로그 추가"""
-        crawling_logs[crawl_id].append(message)
-        print(message)
+    Returns:
+        int: 저장한 검색 기록 ID (실패하면 예외, 재시도 여부는 작업 큐에서 결정)
+    """
+    # 이 크롤링의 로그 (진행 스트림으로 한 줄씩 바로 전송)
+    logger = CrawlLogger(lambda line: crawl_events.publish(crawl_id, 'log', {'line': line}))
+    add_log = logger.log
     
     try:
         add_log(f"=" * 50)
@@ -78,41 +166,46 @@ def perform_crawling(keyword, crawl_id):
         add_log(f"[DEBUG] crawl_id: {crawl_id}")
         add_log(f"=" * 50)
         
-        crawling_status[crawl_id]['progress'] = 10
+        job_queue.update(crawl_id, progress=10)
         add_log(f"[진행] 진행률: 10%")
         
         add_log(f"")
         add_log(f"[1/3] 구글 검색 시작...")
         add_log(f"- URL: https://www.google.com/search?q={keyword}")
         
-        # 크롤링 실행
-        import sys
-        import io
-        
-        # 표준 출력 캡처
-        old_stdout = sys.stdout
-        sys.stdout = captured_output = io.StringIO()
-        
-        try:
-            results = crawl_all(keyword)
-            
-            # 캡처된 출력 가져오기
-            output = captured_output.getvalue()
-            sys.stdout = old_stdout
-            
-            # 캡처된 로그를 라인별로 추가
-            for line in output.split('\n'):
-                if line.strip():
-                    add_log(line)
-        except Exception as e:
-            sys.stdout = old_stdout
-            raise e
+        # 크롤링 실행 (크롤러의 print 출력은 이 크롤링의 로그로, 다른 크롤링과 섞이지 않음)
+        runner = crawler_worker.run_engine if app.config['CRAWLER_WORKER_ENABLED'] else run_engine
+        with logger.bind():
+            results = crawl_all(
+                keyword,
+                runner=runner,
+                concurrent=app.config['CRAWL_CONCURRENT'],
+                engine_timeout=app.config['CRAWL_ENGINE_TIMEOUT']
+            )
         
         add_log(f"")
-        add_log(f"[완료] 구글 크롤링 완료: {len(results['google'])}개 결과")
-        add_log(f"[완료] 유튜브 크롤링 완료: {len(results['youtube'])}개 결과")
-        
-        crawling_status[crawl_id]['progress'] = 60
+        timings = results.get('timings', {})
+        add_log(f"[완료] 구글 크롤링 완료: {len(results['google'])}개 결과 ({timings.get('google', 0)}초)")
+        add_log(f"[완료] 유튜브 크롤링 완료: {len(results['youtube'])}개 결과 ({timings.get('youtube', 0)}초)")
+        for engine, error in results.get('errors', {}).items():
+            add_log(f"[경고] {engine} 크롤링 실패 (부분 결과 저장): {error}")
+        google_stats = results.get('stats', {}).get('google', {})
+        if google_stats.get('page_bytes'):
+            add_log(f"[통계] 구글 {google_stats['fetcher']} 방식 {google_stats['pages']}페이지 "
+                    f"{google_stats['page_bytes'] / 1024:.0f}KB, 파싱 {google_stats['parse_seconds']}초")
+        youtube_stats = results.get('stats', {}).get('youtube', {})
+        if youtube_stats.get('page_bytes'):
+            add_log(f"[통계] 유튜브 페이지 {youtube_stats['page_bytes'] / 1024:.0f}KB, "
+                    f"파싱 {youtube_stats['parse_seconds']}초, 스크롤 {youtube_stats['scrolls']}회")
+        snapshot_runs = {engine: stats['snapshot_run'] for engine, stats in results.get('stats', {}).items()
+                         if stats.get('snapshot_run')}
+        if snapshot_runs:
+            add_log(f"[스냅샷] " + ", ".join(f"{engine} run={run}" for engine, run in snapshot_runs.items()))
+        job_queue.update(crawl_id, progress=60, details={
+            'timings': timings,
+            'stats': results.get('stats', {}),
+            'errors': results.get('errors', {})
+        })
         add_log(f"[진행] 진행률: 60%")
         
         add_log(f"")
@@ -121,74 +214,45 @@ def perform_crawling(keyword, crawl_id):
         with app.app_context():
             # 검색 기록 생성
             search_history = SearchHistory(keyword=keyword)
+            # 재파싱할 때 키워드/시각이 아니라 이 크롤링의 스냅샷을 그대로 찾도록 저장
+            search_history.snapshot_runs = [SearchSnapshotRun(engine=engine, run=run)
+                                            for engine, run in snapshot_runs.items()]
             db.session.add(search_history)
             db.session.flush()  # ID 생성
             
             # 구글 결과 저장
-            for result in results['google']:
-                google_result = GoogleResult(
-                    search_id=search_history.id,
-                    title=result['title'],
-                    url=result['url'],
-                    snippet=result.get('snippet', ''),
-                    source=result.get('source', ''),
-                    thumbnail=result.get('thumbnail', ''),
-                    position=result.get('position', 0),
-                    result_type=result.get('result_type', '일반'),
-                    published_date=result.get('published_date', ''),
-                    is_ad=result.get('is_ad', False)
-                )
-                db.session.add(google_result)
-            
-            crawling_status[crawl_id]['progress'] = 80
+            google_saved = add_google_results(search_history.id, results['google'])
             
             # 유튜브 결과 저장
-            for result in results['youtube']:
-                youtube_result = YouTubeResult(
-                    search_id=search_history.id,
-                    title=result['title'],
-                    url=result['url'],
-                    video_id=result.get('video_id', ''),
-                    thumbnail=result.get('thumbnail', ''),
-                    channel_name=result.get('channel_name', ''),
-                    view_count=result.get('view_count', ''),
-                    view_count_numeric=result.get('view_count_numeric', 0),
-                    upload_date=result.get('upload_date', ''),
-                    upload_timestamp=result.get('upload_timestamp'),
-                    like_count=result.get('like_count', ''),
-                    duration=result.get('duration', ''),
-                    position=result.get('position', 0),
-                    is_short=result.get('is_short', False),
-                    short_shelf_index=result.get('short_shelf_index'),
-                    position_in_shelf=result.get('position_in_shelf')
-                )
-                db.session.add(youtube_result)
+            youtube_saved = add_youtube_results(search_history.id, results['youtube'])
+            
+            # 필터 없는 결과 응답을 미리 직렬화 (/api/results가 그대로 전송)
+            store_results_payload(search_history)
             
             db.session.commit()
             
             add_log(f"[완료] 데이터베이스 저장 완료!")
             add_log(f"  - 검색 ID: {search_history.id}")
-            add_log(f"  - 구글 결과: {len(results['google'])}개")
-            add_log(f"  - 유튜브 결과: {len(results['youtube'])}개")
+            add_log(f"  - 구글 결과: {google_saved}개")
+            add_log(f"  - 유튜브 결과: {youtube_saved}개")
             
-            crawling_status[crawl_id]['progress'] = 80
+            job_queue.update(crawl_id, progress=80)
             add_log(f"[진행] 진행률: 80%")
             
             add_log(f"")
             add_log(f"[3/3] 상태 업데이트 중...")
-            crawling_status[crawl_id]['progress'] = 100
-            crawling_status[crawl_id]['status'] = 'completed'
-            crawling_status[crawl_id]['search_id'] = search_history.id
+            search_id = search_history.id
             
             add_log(f"[DEBUG] 최종 상태:")
-            add_log(f"  - status: {crawling_status[crawl_id]['status']}")
-            add_log(f"  - search_id: {crawling_status[crawl_id]['search_id']}")
-            add_log(f"  - progress: {crawling_status[crawl_id]['progress']}%")
+            add_log(f"  - status: completed")
+            add_log(f"  - search_id: {search_id}")
+            add_log(f"  - progress: 100%")
             
             add_log(f"")
             add_log(f"=" * 50)
             add_log(f"[성공] 크롤링 완료!")
             add_log(f"=" * 50)
+        return search_id
             
     except Exception as e:
         import traceback
@@ -200,23 +264,109 @@ def perform_crawling(keyword, crawl_id):
                 add_log(f"  {line}")
         print(error_msg)
         print(traceback.format_exc())
-        crawling_status[crawl_id]['status'] = 'error'
-        crawling_status[crawl_id]['error'] = str(e)
+        raise
+
+
+# 작업 큐 상태 → 기존 API 상태 이름 (main.js가 completed/error로 판단)
+STATUS_NAMES = {'queued': 'queued', 'running': 'running', 'done': 'completed', 'failed': 'error'}
+FINISHED_STATES = ('done', 'failed')
+
+
+def publish_status(crawl_id, status):
+    """작업 상태/진행률이 바뀔 때마다 진행 스트림으로 전송"""
+    status['status'] = STATUS_NAMES[status['state']]
+    crawl_events.publish(crawl_id, 'status', status)
+
+
+# 크롤링 작업 큐 (고정 개수 워커 스레드, 작업 상태는 DB에 저장)
+# 워커가 쉬는 동안 보관 시간이 지난 진행 이벤트 정리 (새 이벤트가 없어도 메모리/로그 파일 정리)
+job_queue = CrawlJobQueue(app, perform_crawling, listener=publish_status, on_idle=crawl_events.prune)
 
 
 @app.route('/crawl-status/<crawl_id>')
 def crawl_status(crawl_id):
-    """크롤링 상태 확인"""
-    status = crawling_status.get(crawl_id, {'status': 'not_found'})
-    print(f"[API] /crawl-status/{crawl_id} 호출 - 응답: {status}")
-    return jsonify(status)
+    """크롤링 상태 확인 (대기 중이면 대기 순서 queue_position, 예상 남은 시간 eta_seconds 포함)"""
+    status = job_queue.status(crawl_id)
+    if status is None:
+        status = {'status': 'not_found'}
+    else:
+        status['status'] = STATUS_NAMES[status['state']]
+    return json_response(status)
+
+
+@app.route('/crawl-events/<crawl_id>')
+def crawl_events_stream(crawl_id):
+    """
+    크롤링 진행 스트림 (Server-Sent Events)
+    
+    이벤트:
+        status: 작업 상태 (/crawl-status 응답과 같은 형식), 상태/진행률이 바뀔 때마다
+        log: 로그 한 줄 {"line": ...}
+    작업이 끝나면(completed/error) 마지막 status 이벤트를 보내고 연결 종료.
+    재연결 시 Last-Event-ID 헤더 이후 이벤트부터 전송.
+    """
+    last_id = request.headers.get('Last-Event-ID', 0, type=int)
+    keepalive = app.config['CRAWL_EVENTS_KEEPALIVE']
+    
+    def stream():
+        status = crawl_events.last(crawl_id, 'status')
+        if status is None:
+            # 서버 재시작 등으로 이벤트가 없으면 DB의 현재 상태부터
+            status = job_queue.status(crawl_id)
+            if status is None:
+                yield format_event('status', {'status': 'not_found'})
+                return
+            status['status'] = STATUS_NAMES[status['state']]
+            yield format_event('status', status)
+        
+        seen = last_id
+        while True:
+            for event_id, event, data in crawl_events.since(crawl_id, seen):
+                yield format_event(event, data, event_id)
+                seen = event_id
+                if event == 'status':
+                    status = data
+            if status['state'] in FINISHED_STATES:
+                return
+            if not crawl_events.wait(crawl_id, seen, keepalive):
+                if status['state'] == 'queued':
+                    # 앞선 작업이 끝나면 대기 순서/예상 시간이 바뀜
+                    status = job_queue.status(crawl_id)
+                    status['status'] = STATUS_NAMES[status['state']]
+                    yield format_event('status', status)
+                else:
+                    yield ': keepalive\n\n'
+    
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # nginx 등 프록시가 버퍼링하지 않도록
+    })
 
 
 @app.route('/api/logs/<crawl_id>')
 def get_logs(crawl_id):
     """크롤링 로그 조회"""
-    logs = crawling_logs.get(crawl_id, [])
-    return jsonify({'logs': logs})
+    return json_response({'logs': crawl_events.logs(crawl_id)})
+
+
+@app.route('/api/worker-status')
+def worker_status():
+    """크롤러 워커 상태 확인"""
+    if not app.config['CRAWLER_WORKER_ENABLED']:
+        return json_response({'enabled': False})
+    try:
+        status = crawler_worker.ping()
+    except Exception as e:
+        status = {'ok': False, 'error': str(e)}
+    status['enabled'] = True
+    status['restarts'] = crawler_worker.restarts
+    return json_response(status)
+
+
+@app.route('/api/response-stats')
+def response_stats_api():
+    """JSON 응답 통계 (엔드포인트별 요청 수, 원본/전송 바이트, 평균 직렬화/압축 시간)"""
+    return json_response(response_stats())
 
 
 @app.route('/results/<int:search_id>')
@@ -226,75 +376,123 @@ def results(search_id):
     return render_template('results.html', search=search)
 
 
+def build_results(search, filters, engine='', cursors=None):
+    """
+    검색 결과 응답 데이터 (필터링/정렬은 SQL로, result_query.py)
+    
+    Raises:
+        ValueError: 잘못된 필터/커서
+    """
+    cursors = cursors or {}
+    data = {
+        'keyword': search.keyword,
+        'search_date': search.search_date.strftime('%Y-%m-%d %H:%M:%S')
+    }
+    for name, query, sort in (('google', google_query(search.id, filters), filters.google_sort),
+                              ('youtube', youtube_query(search.id, filters), filters.youtube_sort)):
+        if engine and engine != name:
+            continue
+        rows, next_cursor = fetch_page(query, sort, filters.limit, cursors.get(name))
+        data[f'{name}_results'] = [r.to_dict() for r in rows]
+        if filters.limit:
+            data[f'{name}_next_cursor'] = next_cursor
+        if filters.count:
+            data[f'{name}_total'] = count_rows(query)
+    return data
+
+
+def serialize(data):
+    """JSON 본문과 강한 ETag (json_response.py의 인코더)"""
+    body = dumps(data)
+    return body, hashlib.sha256(body).hexdigest()[:32]
+
+
+def store_results_payload(search):
+    """필터 없는 결과 응답을 직렬화해 저장 (커밋은 호출한 쪽에서)"""
+    body, etag = serialize(build_results(search, ResultFilters()))
+    if search.payload is None:
+        search.payload = SearchPayload(body=body, etag=etag)
+    else:
+        search.payload.body = body
+        search.payload.etag = etag
+    return search.payload
+
+
 @app.route('/api/results/<int:search_id>')
 def api_results(search_id):
-    """검색 결과 API (필터링 지원)"""
-    search = SearchHistory.query.get_or_404(search_id)
+    """
+    검색 결과 API
     
-    # 필터 파라미터
-    keyword_filter = request.args.get('keyword', '').strip().lower()
-    date_from = request.args.get('date_from', '')
-    date_to = request.args.get('date_to', '')
-    sort_by = request.args.get('sort_by', '')  # 'view_asc', 'view_desc', 'date_asc', 'date_desc'
+    keyword, date_from, date_to, sort_by: 필터/정렬 ('view_asc', 'view_desc', 'date_asc', 'date_desc')
+    limit: 엔진별 한 페이지 행 수 (없으면 전체), google_cursor / youtube_cursor: 이전 응답의 다음 페이지 커서
+    engine: google / youtube 중 하나만 조회 (다음 페이지를 한쪽만 받을 때), count=1: 필터 적용 전체 수 포함
+    fields: 결과마다 남길 키 (예: title,url)
     
-    # 구글 결과 필터링
-    google_results = search.google_results
-    if keyword_filter:
-        google_results = [r for r in google_results 
-                         if keyword_filter in r.title.lower() or 
-                            keyword_filter in r.snippet.lower()]
-    
-    # 유튜브 결과 필터링
-    youtube_results = search.youtube_results
-    
-    # 키워드 필터
-    if keyword_filter:
-        youtube_results = [r for r in youtube_results 
-                          if keyword_filter in r.title.lower() or 
-                             keyword_filter in r.channel_name.lower()]
-    
-    # 날짜 필터
-    if date_from or date_to:
-        filtered = []
-        for r in youtube_results:
-            if r.upload_timestamp:
-                if date_from and r.upload_timestamp < datetime.strptime(date_from, '%Y-%m-%d'):
-                    continue
-                if date_to and r.upload_timestamp > datetime.strptime(date_to, '%Y-%m-%d'):
-                    continue
-                filtered.append(r)
-        youtube_results = filtered
+    필터가 없으면 저장해 둔 본문(search_payloads)을 그대로, 필터가 있으면 LRU 캐시(results_cache)에서
+    """
+    payload = db.session.get(SearchPayload, search_id)
+    if payload is None:
+        # 저장 본문이 없는 이전 검색 기록은 처음 요청할 때 한 번 생성
+        payload = store_results_payload(SearchHistory.query.get_or_404(search_id))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # 동시에 들어온 다른 요청이 먼저 저장함
+            db.session.rollback()
+            payload = db.session.get(SearchPayload, search_id)
     
-    # 정렬
-    if sort_by == 'view_asc':
-        youtube_results = sorted(youtube_results, key=lambda x: x.view_count_numeric)
-    elif sort_by == 'view_desc':
-        youtube_results = sorted(youtube_results, key=lambda x: x.view_count_numeric, reverse=True)
-    elif sort_by == 'date_asc':
-        youtube_results = sorted(youtube_results, key=lambda x: x.upload_timestamp or datetime.min)
-    elif sort_by == 'date_desc':
-        youtube_results = sorted(youtube_results, key=lambda x: x.upload_timestamp or datetime.min, reverse=True)
+    try:
+        filters = ResultFilters.from_args(request.args)
+        engine = request.args.get('engine', '')
+        if engine not in ('', 'google', 'youtube'):
+            raise ValueError(f'지원하지 않는 엔진입니다: {engine}')
+        cursors = {name: request.args.get(f'{name}_cursor', '') for name in ('google', 'youtube')}
+        fields = requested_fields()
+        
+        if filters.key() == ResultFilters().key() and not engine and not any(cursors.values()) and not fields:
+            return bytes_response(payload.body, etag=payload.etag, cache_control=RESULTS_CACHE_CONTROL)
+        
+        # 키에 저장 본문의 ETag를 넣어 키워드 수정/결과 교체 후에는 이전 캐시를 쓰지 않음
+        key = (search_id, payload.etag, filters.key(), engine, cursors['google'], cursors['youtube'], fields)
+        cached = results_cache.get(key)
+        serialize_seconds = 0.0
+        if cached is None:
+            data = build_results(db.session.get(SearchHistory, search_id), filters, engine, cursors)
+            started = time.perf_counter()
+            cached = serialize(project(data, fields))
+            serialize_seconds = time.perf_counter() - started
+            results_cache.set(key, cached)
+    except ValueError as e:
+        return json_response({'error': str(e)}), 400
     
-    return jsonify({
-        'keyword': search.keyword,
-        'search_date': search.search_date.strftime('%Y-%m-%d %H:%M:%S'),
-        'google_results': [r.to_dict() for r in google_results],
-        'youtube_results': [r.to_dict() for r in youtube_results]
-    })
+    body, etag = cached
+    return bytes_response(body, etag=etag, cache_control=RESULTS_CACHE_CONTROL, serialize_seconds=serialize_seconds)
 
 
 @app.route('/history')
 def history():
-    """검색 기록 페이지"""
-    searches = SearchHistory.query.order_by(SearchHistory.search_date.desc()).all()
-    return render_template('history.html', searches=searches)
+    """검색 기록 페이지 (목록은 /api/history로 불러옴)"""
+    return render_template('history.html')
 
 
 @app.route('/api/history')
 def api_history():
-    """검색 기록 API"""
-    searches = SearchHistory.query.order_by(SearchHistory.search_date.desc()).all()
-    return jsonify([s.to_dict() for s in searches])
+    """
+    검색 기록 API (최신순, 결과 수는 같은 쿼리에서 계산)
+    
+    limit: 한 페이지 기록 수 (기본 HISTORY_PAGE_SIZE), cursor: 이전 응답의 next_cursor, count=1: 전체 수 포함
+    fields: 기록마다 남길 키 (예: id,keyword)
+    """
+    try:
+        limit = parse_limit(request.args.get('limit', ''), HISTORY_PAGE_SIZE)
+        searches, next_cursor = fetch_page(history_query(), HISTORY_SORT, limit, request.args.get('cursor'))
+    except ValueError as e:
+        return json_response({'error': str(e)}), 400
+    
+    response = {'searches': [s.to_dict() for s in searches], 'next_cursor': next_cursor}
+    if request.args.get('count', '') in ('1', 'true'):
+        response['total'] = db.session.scalar(select(func.count()).select_from(SearchHistory))
+    return json_response(response, fields=requested_fields())
 
 
 @app.route('/api/history/<int:search_id>', methods=['DELETE'])
@@ -303,7 +501,7 @@ def delete_history(search_id):
     search = SearchHistory.query.get_or_404(search_id)
     db.session.delete(search)
     db.session.commit()
-    return jsonify({'message': '삭제되었습니다.'})
+    return json_response({'message': '삭제되었습니다.'})
 
 
 @app.route('/api/history/<int:search_id>', methods=['PUT'])
@@ -315,10 +513,11 @@ def update_history(search_id):
     new_keyword = data.get('keyword', '').strip()
     if new_keyword:
         search.keyword = new_keyword
+        store_results_payload(search)  # 저장 본문에 키워드가 들어 있으므로 다시 생성
         db.session.commit()
-        return jsonify({'message': '수정되었습니다.'})
+        return json_response({'message': '수정되었습니다.'})
     
-    return jsonify({'error': '키워드를 입력해주세요.'}), 400
+    return json_response({'error': '키워드를 입력해주세요.'}), 400
 
 
 # 데이터베이스 테이블 생성
@@ -332,6 +531,9 @@ if __name__ == '__main__':
     print("브라우저에서 http://localhost:5000 으로 접속하세요")
     print("=" * 50)
     
+    # 디버그 리로더의 감시 프로세스에서는 워커를 띄우지 않음 (실제 서버 프로세스에서만 시작)
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        job_queue.start()
     app.run(debug=True, host='0.0.0.0', port=5000)
 
 
@@ -0,0 +1,95 @@
+"""크롤링 종단간 벤치마크 - 로컬 픽스처 서버(fixture_server.py) 상대로 지연 시간/처리량 측정
+
+실제 구글/유튜브 대신 픽스처 서버에 HTTP 방식(구글)과 ytInitialData 방식(유튜브)으로 크롤링한다.
+요청 → 응답 → 파싱까지 포함한 크롤링 1회의 시간을 재므로 네트워크 없는 환경에서도 결과가 재현된다.
+브라우저 방식으로 전환되는 경우(오류 응답 등)는 브라우저를 띄우지 않고 실패로 집계한다.
+
+    python bench_crawl.py [--engine all] [--runs 20] [--concurrency 4] [--latency-ms 50] [--error-rate 0.05]
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault('SNAPSHOTS', '0')  # 벤치마크 페이지는 스냅샷으로 저장하지 않음
+
+from crawler import CRAWLERS, YOUTUBE_OPTIONS  # noqa: E402
+from fixture_server import start_server  # noqa: E402
+
+KEYWORD = '벤치마크'
+
+
+class NoBrowser:
+    """브라우저 방식으로 전환되면 바로 실패 (벤치마크 중 Chrome을 띄우지 않음)"""
+
+    def __getattr__(self, name):
+        raise RuntimeError('벤치마크에서는 브라우저를 사용하지 않음')
+
+
+def crawl_once(engine, base_url):
+    """크롤링 1회, (소요 초, 결과 수)"""
+    crawler = CRAWLERS[engine](driver=NoBrowser(), polite_delay=(0, 0))
+    if engine == 'google':
+        crawler.fetcher = 'http'
+        crawler.GOOGLE_BASE_URL = base_url
+        options = {}
+    else:
+        crawler.extractor = 'json'
+        crawler.YOUTUBE_BASE_URL = base_url
+        options = YOUTUBE_OPTIONS
+    started = time.perf_counter()
+    results = crawler.crawl(KEYWORD, **options)
+    return time.perf_counter() - started, len(results)
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def run_engine(engine, base_url, runs, concurrency):
+    # 크롤러 로그는 숨김 (stdout 교체는 프로세스 전체에 적용되므로 스레드 밖에서 한 번만)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = list(executor.map(lambda _: crawl_once(engine, base_url), range(runs)))
+    elapsed = time.perf_counter() - started
+
+    timings = [seconds for seconds, _ in outcomes]
+    failures = sum(1 for _, count in outcomes if not count)
+    counts = sorted({count for _, count in outcomes if count})
+    print(f"[{engine}] {runs}회 (동시 {concurrency}), 전체 {elapsed:.2f}초 → {runs / elapsed:.1f}회/초")
+    print(f"  지연 p50 {percentile(timings, 50) * 1000:.0f}ms  p95 {percentile(timings, 95) * 1000:.0f}ms  "
+          f"최대 {max(timings) * 1000:.0f}ms")
+    print(f"  결과 수 {counts or '-'}, 실패 {failures}회")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤링 종단간 벤치마크 (로컬 픽스처 서버)')
+    parser.add_argument('--engine', choices=['google', 'youtube', 'all'], default='all')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--latency-ms', type=float, default=50)
+    parser.add_argument('--jitter-ms', type=float, default=20)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--pages', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    server, base_url = start_server(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                    error_rate=args.error_rate, pages=args.pages, seed=args.seed)
+    print(f"픽스처 서버 {base_url} (지연 {args.latency_ms}+{args.jitter_ms}ms, 오류 {args.error_rate:.0%})\n")
+    try:
+        engines = ['google', 'youtube'] if args.engine == 'all' else [args.engine]
+        for engine in engines:
+            run_engine(engine, base_url, args.runs, args.concurrency)
+        print(f"\n서버 요청 통계: {server.state.stats()}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
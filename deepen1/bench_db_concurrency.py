@@ -0,0 +1,149 @@
+"""DB 동시 접근 확인 - 작업 큐 쓰기와 /api 읽기를 섞어 실행하고 잠금 오류 수를 센다
+
+쓰기 스레드는 작업 큐가 작업 하나를 처리할 때의 쓰기(crawl_jobs 추가 → 가져가기 → 진행률 저장 → 완료),
+읽기 스레드는 테스트 클라이언트로 /api/results(저장 본문, 필터)와 /api/history를 반복 요청한다.
+모든 연결은 app.py와 같이 SQLAlchemy connect 리스너(sqlite_tuning.install)로 PRAGMA가 적용된다.
+임시 DB(DATABASE_PATH)를 쓰므로 database.db는 바뀌지 않는다. 잠금 오류가 있으면 종료 코드 1.
+
+    python bench_db_concurrency.py [--seconds 5] [--readers 8] [--writers 4]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+DB_DIR = tempfile.TemporaryDirectory()
+os.environ['DATABASE_PATH'] = os.path.join(DB_DIR.name, 'bench.db')
+os.environ.setdefault('SNAPSHOTS', '0')
+os.environ.setdefault('RESULTS_CACHE_SIZE', '1')  # 필터 응답도 매번 DB에서 읽도록
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from app import app, add_google_results, add_youtube_results, store_results_payload  # noqa: E402
+from bench_inserts import make_results  # noqa: E402
+from job_queue import CrawlJobQueue  # noqa: E402
+from models import db, CrawlJob, SearchHistory  # noqa: E402
+import sqlite_tuning  # noqa: E402
+
+SEARCHES = 20
+RESULTS_PER_ENGINE = 200
+
+
+def seed():
+    """검색 기록 SEARCHES개 (구글/유튜브 결과 RESULTS_PER_ENGINE건씩, 저장 본문 포함), search_id 목록"""
+    google, youtube = make_results(RESULTS_PER_ENGINE)
+    search_ids = []
+    with app.app_context():
+        for i in range(SEARCHES):
+            search = SearchHistory(keyword=f'벤치마크 {i}')
+            db.session.add(search)
+            db.session.flush()
+            add_google_results(search.id, google)
+            add_youtube_results(search.id, youtube)
+            store_results_payload(search)
+            search_ids.append(search.id)
+        db.session.commit()
+    return search_ids
+
+
+def process_job(queue, worker, counter, search_ids):
+    """작업 하나를 처리할 때의 작업 큐 쓰기 (submit()은 워커 스레드를 시작하므로 같은 INSERT만)"""
+    with app.app_context():
+        db.session.add(CrawlJob(crawl_id=uuid.uuid4().hex[:16], keyword=f'벤치마크 {worker}-{counter}'))
+        db.session.commit()
+    claimed = queue._claim()
+    if claimed is None:
+        return  # 다른 쓰기 스레드가 먼저 가져감
+    crawl_id, _ = claimed
+    queue.update(crawl_id, progress=60, details={'google': {'count': RESULTS_PER_ENGINE}})
+    queue._finish(crawl_id, search_ids[counter % len(search_ids)])
+
+
+def read_api(client, counter, search_ids):
+    search_id = search_ids[counter % len(search_ids)]
+    for url in (f'/api/results/{search_id}',
+                f'/api/results/{search_id}?sort_by=view_desc&limit=50&count=1&keyword=영상 {counter % 50}',
+                '/api/history?count=1'):
+        response = client.get(url)
+        if response.status_code != 200:
+            raise RuntimeError(f'{url}: {response.status_code}')
+
+
+def run_mixed(search_ids, seconds, readers, writers):
+    """{'reads', 'writes', 'locked', 'other_errors'}"""
+    stats = {'reads': 0, 'writes': 0, 'locked': 0, 'other_errors': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+    queue = CrawlJobQueue(app, handler=None)
+
+    def loop(worker, operation, counted):
+        counter = 0
+        while time.perf_counter() < deadline:
+            counter += 1
+            try:
+                operation(worker, counter)
+                key = counted
+            except OperationalError as e:
+                key = 'locked' if 'locked' in str(e) or 'busy' in str(e) else 'other_errors'
+                if key == 'other_errors':
+                    print(f"  오류: {e}")
+            except Exception as e:
+                key = 'other_errors'
+                print(f"  오류: {e}")
+            with lock:
+                stats[key] += 1
+
+    def write(worker, counter):
+        process_job(queue, worker, counter, search_ids)
+
+    clients = {}
+
+    def read(worker, counter):
+        client = clients.setdefault(worker, app.test_client())
+        read_api(client, counter, search_ids)
+
+    threads = [threading.Thread(target=loop, args=(i, write, 'writes')) for i in range(writers)]
+    threads += [threading.Thread(target=loop, args=(writers + i, read, 'reads')) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DB 동시 접근 확인 (작업 큐 쓰기 / API 읽기 혼합)')
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=4)
+    args = parser.parse_args()
+
+    app.config['TESTING'] = True  # 라우트의 예외를 500 응답 대신 그대로 받아 잠금 오류로 셈
+    try:
+        search_ids = seed()
+        with app.app_context():
+            applied = {name: db.session.execute(text(f'PRAGMA {name}')).scalar()
+                       for name in ('journal_mode', 'busy_timeout', 'foreign_keys')}
+        print(f"읽기 스레드 {args.readers}개, 쓰기 스레드 {args.writers}개, {args.seconds}초")
+        print(f"PRAGMA: {', '.join(pragma.split(' ', 1)[1] for pragma in sqlite_tuning.PRAGMAS)}")
+        print(f"연결 확인: {', '.join(f'{name}={value}' for name, value in applied.items())}\n")
+
+        stats = run_mixed(search_ids, args.seconds, args.readers, args.writers)
+        with app.app_context():
+            done = CrawlJob.query.filter_by(status='done').count()
+            db.engine.dispose()
+        print(f"읽기 {stats['reads'] / args.seconds:,.0f}회/초 (요청 3개씩), "
+              f"작업 처리 {stats['writes'] / args.seconds:,.0f}회/초 (완료 {done}개), "
+              f"잠금 오류 {stats['locked']}회, 기타 오류 {stats['other_errors']}회")
+        if stats['locked']:
+            sys.exit(1)
+    finally:
+        DB_DIR.cleanup()
+
+
+if __name__ == '__main__':
+    main()
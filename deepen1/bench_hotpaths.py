@@ -0,0 +1,198 @@
+"""결과 1건마다 실행되는 함수(핫패스) 마이크로 벤치마크
+
+저장된 페이지(youtube_mobile.html, fixtures/google_mobile.html)로 다음 함수를 반복 실행해
+초당 실행 횟수, 호출당 지연 백분위, 호출당 최대 메모리 할당을 측정하고 기준값(bench_baseline.json)과 비교한다.
+
+    YouTubeMobileCrawler._parse_view_count, _parse_upload_date, _parse_video, _parse_shorts_shelf,
+    text_parsers 배치 함수 (parse_view_counts, parse_relative_times),
+    _parse_video_json, _parse_shorts_shelf_json, GoogleMobileCrawler.parse_results
+
+    python bench_hotpaths.py                 # 측정 후 기준값과 비교
+    python bench_hotpaths.py --save          # 현재 결과를 기준값으로 저장
+    python bench_hotpaths.py --check         # 기준값보다 --tolerance 배 이상 느려진 항목이 있으면 종료 코드 1
+
+기준값은 측정한 장비에 따라 다르므로 같은 장비에서 비교한다 (파일에 측정 환경 기록).
+메모리는 tracemalloc 기준 (lxml 등 C 라이브러리 내부 할당은 포함되지 않음).
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('SNAPSHOTS', '0')  # 벤치마크 중 스냅샷 저장 안 함
+
+from crawler import GoogleMobileCrawler, YouTubeMobileCrawler  # noqa: E402
+import common_path  # noqa: E402,F401
+from html_parser import PARSER, make_soup  # noqa: E402
+from text_parsers import parse_relative_times, parse_view_counts  # noqa: E402
+from youtube_data import extract_initial_data, find_search_items  # noqa: E402
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BASE_DIR, 'bench_baseline.json')
+
+VIEW_COUNTS = [
+    '조회수 69회', '조회수 1,342회', '조회수 7.7천회', '조회수 4.6만회', '조회수 140만회', '조회수 882만회',
+    '조회수 7,196,920회', '조회수 없음', '1.2K views', '3.4M views',
+]
+UPLOAD_DATES = [
+    '9시간 전', '2개월 전', '4개월 전', '2년 전', '3일 전', '1주 전', '15분 전', '방금 전',
+    '5 hours ago', '2 weeks ago', '최초 공개: 2024. 1. 5.',
+]
+
+
+def _read(path):
+    with open(os.path.join(BASE_DIR, path), encoding='utf-8') as f:
+        return f.read()
+
+
+def cases():
+    """{이름: 인자 없는 호출 함수} - 입력 준비(파싱 등)는 측정에서 제외"""
+    youtube = YouTubeMobileCrawler()
+    google = GoogleMobileCrawler()
+
+    youtube_html = _read('youtube_mobile.html')
+    soup = make_soup(youtube_html)
+    contents = soup.find('div', id='contents') or soup.find('body')
+    items = contents.find_all(class_='item')
+    videos = [element for element in items if element.name == 'ytm-video-with-context-renderer']
+    shelves = [element for element in items if element.name in ('ytm-reel-shelf-renderer', 'grid-shelf-view-model')]
+
+    json_items, _ = find_search_items(extract_initial_data(youtube_html))
+    json_videos = [renderer for item in json_items for name, renderer in item.items()
+                   if name in YouTubeMobileCrawler.JSON_VIDEO_RENDERERS]
+    json_shelves = [renderer for item in json_items for name, renderer in item.items()
+                    if name in YouTubeMobileCrawler.JSON_SHELF_RENDERERS]
+
+    google_html = _read(os.path.join('fixtures', 'google_mobile.html'))
+
+    view_counts = itertools.cycle(VIEW_COUNTS)
+    upload_dates = itertools.cycle(UPLOAD_DATES)
+    video_elements = itertools.cycle(videos)
+    shelf_elements = itertools.cycle(shelves)
+    video_renderers = itertools.cycle(json_videos)
+    shelf_renderers = itertools.cycle(json_shelves)
+    # 처리된 ID 집합은 호출마다 새로 (중복 제외로 건너뛰지 않도록)
+    return {
+        '_parse_view_count': lambda: youtube._parse_view_count(next(view_counts)),
+        '_parse_upload_date': lambda: youtube._parse_upload_date(next(upload_dates)),
+        f'parse_view_counts ({len(VIEW_COUNTS)}개 배치)': lambda: parse_view_counts(VIEW_COUNTS),
+        f'parse_relative_times ({len(UPLOAD_DATES)}개 배치)': lambda: parse_relative_times(UPLOAD_DATES),
+        '_parse_video (DOM)': lambda: youtube._parse_video(next(video_elements), set()),
+        '_parse_shorts_shelf (DOM, 5개)': lambda: youtube._parse_shorts_shelf(next(shelf_elements), set(), 5),
+        '_parse_video_json': lambda: youtube._parse_video_json(next(video_renderers), set()),
+        '_parse_shorts_shelf_json (5개)': lambda: youtube._parse_shorts_shelf_json(next(shelf_renderers), set(), 5),
+        'google parse_results (1페이지)': lambda: google.parse_results(google_html),
+    }
+
+
+def measure(func, min_seconds, min_calls):
+    """호출 하나씩 시간 측정 (min_seconds 이상, min_calls회 이상), 이후 tracemalloc으로 할당 측정"""
+    for _ in range(min(min_calls, 10)):
+        func()  # 워밍업
+
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < min_calls or time.perf_counter() - started < min_seconds:
+        call_started = time.perf_counter_ns()
+        func()
+        timings.append(time.perf_counter_ns() - call_started)
+    total = sum(timings) / 1e9
+
+    peaks = []
+    tracemalloc.start()
+    for _ in range(min(len(timings), 50)):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'calls': len(timings),
+        'ops_per_sec': round(len(timings) / total, 1),
+        'p50_us': round(_percentile(timings, 50) / 1000, 2),
+        'p95_us': round(_percentile(timings, 95) / 1000, 2),
+        'p99_us': round(_percentile(timings, 99) / 1000, 2),
+        'peak_alloc_bytes': int(sum(peaks) / len(peaks)),
+    }
+
+
+def _percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))]
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'html_parser': PARSER,
+    }
+
+
+def load_baseline():
+    try:
+        with open(BASELINE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='핫패스 마이크로 벤치마크')
+    parser.add_argument('--seconds', type=float, default=1.0, help='항목당 최소 측정 시간 (초)')
+    parser.add_argument('--calls', type=int, default=200, help='항목당 최소 호출 수')
+    parser.add_argument('--save', action='store_true', help='결과를 기준값 파일로 저장')
+    parser.add_argument('--check', action='store_true', help='느려진 항목이 있으면 종료 코드 1')
+    parser.add_argument('--tolerance', type=float, default=1.5, help='느려짐 판정 배수 (p50 기준)')
+    parser.add_argument('--filter', default='', help='이름에 이 문자열이 있는 항목만')
+    args = parser.parse_args()
+
+    baseline = load_baseline()
+    base_results = (baseline or {}).get('results', {})
+    results = {}
+    regressions = []
+
+    print(f"HTML 파서: {PARSER}, 기준값: {'있음' if baseline else '없음'} ({os.path.basename(BASELINE_PATH)})")
+    print(f"{'항목':<34} {'ops/s':>10} {'p50 µs':>9} {'p95 µs':>9} {'p99 µs':>9} {'할당 KB':>9}  기준 대비")
+    for name, func in cases().items():
+        if args.filter not in name:
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = measure(func, args.seconds, args.calls)
+        results[name] = result
+
+        compared = ''
+        base = base_results.get(name)
+        if base:
+            ratio = result['p50_us'] / base['p50_us'] if base['p50_us'] else 1.0
+            compared = f"{ratio:.2f}배"
+            if ratio > args.tolerance:
+                compared += ' (느려짐)'
+                regressions.append(name)
+        print(f"{name:<34} {result['ops_per_sec']:>10.0f} {result['p50_us']:>9.1f} {result['p95_us']:>9.1f} "
+              f"{result['p99_us']:>9.1f} {result['peak_alloc_bytes'] / 1024:>9.1f}  {compared}")
+
+    if args.save:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            # --filter로 일부만 측정한 경우 나머지 항목의 기준값은 유지
+            json.dump({'environment': environment(), 'results': dict(base_results, **results)},
+                      f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"\n기준값 저장: {BASELINE_PATH}")
+
+    if regressions:
+        print(f"\n기준값보다 {args.tolerance}배 이상 느려진 항목: {', '.join(regressions)}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
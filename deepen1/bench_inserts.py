@@ -0,0 +1,106 @@
+"""크롤링 결과 저장 벤치마크 - 행마다 ORM 객체 + session.add vs add_*_results (executemany)
+
+임시 DB에 구글/유튜브 결과 N건을 저장하며 초당 저장 행 수를 비교한다.
+
+    python bench_inserts.py                  # 1,000건 / 100,000건
+    python bench_inserts.py --sizes 5000
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+
+os.environ.setdefault('SNAPSHOTS', '0')
+
+from flask import Flask  # noqa: E402
+
+from app import add_google_results, add_youtube_results  # noqa: E402
+from models import db, SearchHistory, GoogleResult, YouTubeResult  # noqa: E402
+
+
+def make_results(count):
+    """구글/유튜브 결과 count건씩"""
+    google = [{
+        'title': f'벤치마크 결과 {i}',
+        'url': f'https://example.com/page/{i}',
+        'snippet': '브랜드 신제품 출시 소식과 후기',
+        'source': 'example',
+        'position': i + 1,
+    } for i in range(count)]
+    youtube = [{
+        'title': f'벤치마크 영상 {i}',
+        'url': f'https://m.youtube.com/watch?v=video{i:07d}',
+        'video_id': f'video{i:07d}',
+        'channel_name': '예시 채널',
+        'view_count': '조회수 1.5만회',
+        'view_count_numeric': 15000,
+        'upload_date': '3일 전',
+        'upload_timestamp': datetime(2025, 7, 2),
+        'position': i + 1,
+    } for i in range(count)]
+    return google, youtube
+
+
+def add_each(search_id, google, youtube):
+    """기존 방식: 결과마다 ORM 객체를 만들어 session.add"""
+    for result in google:
+        db.session.add(GoogleResult(search_id=search_id, title=result['title'], url=result['url'],
+                                    snippet=result.get('snippet', ''), source=result.get('source', ''),
+                                    thumbnail=result.get('thumbnail', ''), position=result.get('position', 0),
+                                    result_type=result.get('result_type', '일반'),
+                                    published_date=result.get('published_date', ''),
+                                    is_ad=result.get('is_ad', False)))
+    for result in youtube:
+        db.session.add(YouTubeResult(search_id=search_id, title=result['title'], url=result['url'],
+                                     video_id=result.get('video_id', ''), thumbnail=result.get('thumbnail', ''),
+                                     channel_name=result.get('channel_name', ''),
+                                     view_count=result.get('view_count', ''),
+                                     view_count_numeric=result.get('view_count_numeric', 0),
+                                     upload_date=result.get('upload_date', ''),
+                                     upload_timestamp=result.get('upload_timestamp'),
+                                     like_count=result.get('like_count', ''), duration=result.get('duration', ''),
+                                     position=result.get('position', 0), is_short=result.get('is_short', False),
+                                     short_shelf_index=result.get('short_shelf_index'),
+                                     position_in_shelf=result.get('position_in_shelf')))
+    return len(google) + len(youtube)
+
+
+def add_bulk(search_id, google, youtube):
+    return add_google_results(search_id, google) + add_youtube_results(search_id, youtube)
+
+
+def run(method, google, youtube):
+    """빈 DB에 저장 후 커밋, (초, 저장 행 수)"""
+    with tempfile.TemporaryDirectory() as directory:
+        bench_app = Flask(__name__)
+        bench_app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(directory, 'bench.db')
+        db.init_app(bench_app)
+        with bench_app.app_context():
+            db.create_all()
+            search = SearchHistory(keyword='벤치마크')
+            db.session.add(search)
+            db.session.flush()
+            started = time.perf_counter()
+            saved = method(search.id, google, youtube)
+            db.session.commit()
+            elapsed = time.perf_counter() - started
+            db.engine.dispose()
+    return elapsed, saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤링 결과 저장 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000], help='엔진별 결과 수')
+    args = parser.parse_args()
+
+    print(f"{'행 수':>8} {'방식':<22} {'초':>8} {'행/초':>12}")
+    for size in args.sizes:
+        google, youtube = make_results(size)
+        for name, method in (('행마다 session.add', add_each), ('add_*_results (일괄)', add_bulk)):
+            elapsed, saved = run(method, google, youtube)
+            print(f"{saved:>8} {name:<22} {elapsed:>8.3f} {saved / elapsed:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
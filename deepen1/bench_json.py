@@ -0,0 +1,96 @@
+"""JSON 응답 벤치마크 - 인코더(Flask 기본 JSON / orjson)별 직렬화 시간, 압축별 전송 크기
+
+/api/results와 같은 형식의 결과 응답(구글/유튜브 결과 N건씩)을 만들어 비교한다.
+?fields=로 일부 키만 받는 경우의 크기도 함께 출력한다.
+
+    python bench_json.py                 # 결과 100 / 1,000 / 10,000건씩
+    python bench_json.py --sizes 5000 --repeat 20
+"""
+import argparse
+import gzip
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+import common_path  # noqa: F401
+import json_response
+from json_response import project
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+FIELDS = ('title', 'url')  # 목록 화면에 필요한 키만 받는 경우
+
+
+def make_payload(count):
+    """/api/results 응답 형식 (구글/유튜브 결과 count건씩)"""
+    base = datetime(2025, 1, 1)
+    return {
+        'keyword': '벤치마크',
+        'search_date': '2025-01-01 00:00:00',
+        'google_results': [{
+            'id': i, 'title': f'벤치마크 결과 {i}', 'url': f'https://example.com/page/{i}',
+            'snippet': '브랜드 신제품 출시 소식과 후기', 'source': 'example', 'position': i + 1,
+        } for i in range(count)],
+        'youtube_results': [{
+            'id': i, 'title': f'벤치마크 영상 {i}', 'url': f'https://m.youtube.com/watch?v={i}',
+            'channel_name': '예시 채널', 'view_count': f'조회수 {i * 37:,}회', 'view_count_numeric': i * 37,
+            'upload_date': '1일 전', 'upload_timestamp': (base + timedelta(hours=i)).strftime('%Y-%m-%d %H:%M:%S'),
+            'position': i + 1,
+        } for i in range(count)],
+    }
+
+
+def time_call(func, repeat):
+    """(결과, 호출당 중앙값 밀리초)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON 응답 직렬화/압축 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    encoders = [('json', lambda data: app.json.dumps(data).encode('utf-8'))]
+    if json_response.orjson is not None:
+        orjson = json_response.orjson
+        encoders.append(('orjson', lambda data: orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)))
+    else:
+        print("orjson이 설치되어 있지 않아 Flask 기본 JSON만 측정합니다 (pip install orjson)\n")
+
+    compressors = [('gzip', lambda body: gzip.compress(body, compresslevel=json_response.GZIP_LEVEL, mtime=0))]
+    if brotli is not None:
+        compressors.append(('br', lambda body: brotli.compress(body, quality=json_response.BROTLI_QUALITY)))
+
+    with app.app_context():
+        for size in args.sizes:
+            data = make_payload(size)
+            print(f"[결과 {size:,}건씩]")
+            for name, dumps in encoders:
+                body, elapsed = time_call(lambda: dumps(data), args.repeat)
+                json.loads(body)
+                print(f"    {name:7s} 직렬화 {elapsed:8.2f}ms, {len(body):,} bytes")
+
+            body = encoders[-1][1](data)
+            projected = encoders[-1][1](project(data, FIELDS))
+            print(f"    fields={','.join(FIELDS)}: {len(projected):,} bytes ({len(projected) / len(body):.0%})")
+            for name, compress in compressors:
+                compressed, elapsed = time_call(lambda: compress(body), args.repeat)
+                print(f"    {name:7s} 압축 {elapsed:8.2f}ms, {len(compressed):,} bytes ({len(compressed) / len(body):.1%})")
+            print()
+
+
+if __name__ == '__main__':
+    main()
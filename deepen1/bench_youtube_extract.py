@@ -0,0 +1,72 @@
+"""유튜브 결과 추출 방식 비교 - DOM(BeautifulSoup) vs ytInitialData(JSON)
+
+샘플 페이지(youtube_mobile.html)를 두 방식으로 파싱해 소요 시간과 결과 일치 여부를 비교한다.
+브라우저/네트워크 없이 실행된다.
+
+    python bench_youtube_extract.py [HTML 파일] [반복 횟수]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+from crawler import YouTubeMobileCrawler
+from youtube_data import extract_initial_data
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure(func, repeat):
+    """func를 repeat회 실행 (크롤러 로그 출력은 숨김), (마지막 결과, 평균 초) 반환"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = func()
+        timings.append(time.perf_counter() - started)
+    return result, sum(timings) / len(timings)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(BASE_DIR, 'youtube_mobile.html')
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with open(path, encoding='utf-8') as f:
+        html = f.read()
+
+    crawler = YouTubeMobileCrawler(extractor='dom')
+    dom_results, dom_time = measure(lambda: crawler.parse_page(html), repeat)
+    json_results, json_time = measure(lambda: crawler.parse_initial_data(extract_initial_data(html)), repeat)
+
+    print("=" * 60)
+    print(f"샘플: {os.path.basename(path)} ({len(html.encode('utf-8')) / 1024:.0f}KB), {repeat}회 평균")
+    print("=" * 60)
+    print(f"DOM  (BeautifulSoup): {dom_time * 1000:8.1f}ms, 결과 {len(dom_results)}개")
+    print(f"JSON (ytInitialData): {json_time * 1000:8.1f}ms, 결과 {len(json_results)}개")
+    if json_time:
+        print(f"속도 향상: {dom_time / json_time:.1f}배")
+
+    dom_ids = [r['video_id'] for r in dom_results]
+    json_ids = [r['video_id'] for r in json_results]
+    print(f"\n순서까지 동일: {'예' if dom_ids == json_ids else '아니오'}")
+    print(f"공통 영상: {len(set(dom_ids) & set(json_ids))}개, "
+          f"DOM에만 {len(set(dom_ids) - set(json_ids))}개, JSON에만 {len(set(json_ids) - set(dom_ids))}개")
+
+    # 같은 영상의 필드 비교 (JSON 방식에만 있는 재생 시간 등 확인용)
+    json_by_id = {r['video_id']: r for r in json_results}
+    different = {}
+    for dom_item in dom_results:
+        json_item = json_by_id.get(dom_item['video_id'])
+        if not json_item:
+            continue
+        for key, value in dom_item.items():
+            if key != 'upload_timestamp' and json_item.get(key) != value:
+                different[key] = different.get(key, 0) + 1
+    if different:
+        print("값이 다른 필드: " + ", ".join(f"{key} {count}개" for key, count in different.items()))
+
+
+if __name__ == '__main__':
+    main()
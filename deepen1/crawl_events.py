@@ -0,0 +1,142 @@
+"""
+크롤링 진행 이벤트 (Server-Sent Events 스트림용)
+
+작업 상태 변경(status)과 로그 한 줄(log)을 크롤링 ID별로 순번을 붙여 쌓아 두고,
+/crawl-events/<crawl_id> 스트림이 새 이벤트가 생길 때까지 기다렸다가 바로 보낸다.
+연결이 끊겨 다시 연결하면 브라우저가 보내는 Last-Event-ID 이후 이벤트부터 이어서 보낸다.
+
+메모리 사용량 제한:
+    크롤링 하나당 최근 MAX_EVENTS개만 보관 (링 버퍼, 오래된 로그부터 버림)
+    크롤링은 최대 MAX_CRAWLS개, 마지막 이벤트 후 EVENTS_TTL초까지 보관 (ttl_store.TTLStore)
+    만료된 크롤링은 새 이벤트를 추가할 때와 prune() 호출 때 정리 (app.py는 작업 큐 워커가 쉴 때 호출)
+    메모리에서 버리는 크롤링의 로그는 LOG_DIR/<crawl_id>.log 로 저장 (LOG_DIR이 빈 값이면 저장 안 함)
+"""
+import json
+import os
+import threading
+from collections import deque
+
+from ttl_store import TTLStore
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 보관 설정 (환경변수로 조정)
+MAX_EVENTS = int(os.getenv('CRAWL_LOG_LINES', '2000'))  # 크롤링 하나당 보관할 최대 이벤트 수 (대부분 로그 줄)
+MAX_CRAWLS = int(os.getenv('CRAWL_EVENTS_MAX', '200'))  # 메모리에 보관할 최대 크롤링 수
+EVENTS_TTL = int(os.getenv('CRAWL_EVENTS_TTL', '3600'))  # 마지막 이벤트 후 메모리에 보관하는 시간 (초)
+LOG_DIR = os.getenv('CRAWL_LOG_DIR', os.path.join(BASE_DIR, 'crawl_logs'))
+
+
+class _CrawlStream:
+    """크롤링 하나의 이벤트"""
+
+    def __init__(self, max_events):
+        self.events = deque(maxlen=max_events)  # [(순번, 이벤트 이름, 데이터), ...]
+        self.next_id = 1
+        self.last = {}  # 이벤트 이름 -> 가장 최근 데이터 (링 버퍼에서 밀려나도 유지)
+
+
+class CrawlEvents:
+    """크롤링 ID별 이벤트 목록 (요청 스레드와 작업 큐 워커 스레드가 공유)"""
+
+    def __init__(self, max_events=MAX_EVENTS, max_crawls=MAX_CRAWLS, ttl=EVENTS_TTL, log_dir=LOG_DIR):
+        self.max_events = max_events
+        self.log_dir = log_dir
+        self._changed = threading.Condition()
+        self._streams = TTLStore(max_entries=max_crawls, ttl=ttl, on_evict=self._evicted)
+        # 잠금 안(publish)에서 버린 크롤링, 잠금을 푼 뒤 파일로 저장 (디스크 쓰기 동안 스트림이 멈추지 않도록)
+        self._to_archive = deque()
+
+    def publish(self, crawl_id, event, data):
+        """이벤트 추가 후 기다리는 스트림을 깨움, 순번 반환"""
+        with self._changed:
+            stream = self._streams.setdefault(crawl_id, lambda: _CrawlStream(self.max_events))
+            event_id = stream.next_id
+            stream.next_id += 1
+            stream.events.append((event_id, event, data))
+            stream.last[event] = data
+            self._changed.notify_all()
+        self._archive_evicted()
+        return event_id
+
+    def since(self, crawl_id, last_id=0):
+        """순번이 last_id보다 큰 이벤트 목록"""
+        with self._changed:
+            stream = self._streams.peek(crawl_id)
+            if stream is None:
+                return []
+            return [item for item in stream.events if item[0] > last_id]
+
+    def wait(self, crawl_id, last_id, timeout):
+        """last_id 이후 이벤트가 생길 때까지 최대 timeout초 대기, 생겼으면 True"""
+        with self._changed:
+            return self._changed.wait_for(lambda: self._latest_id(crawl_id) > last_id, timeout)
+
+    def last(self, crawl_id, event):
+        """해당 이름의 가장 최근 이벤트 데이터 (없으면 None)"""
+        with self._changed:
+            stream = self._streams.peek(crawl_id)
+            return stream.last.get(event) if stream is not None else None
+
+    def logs(self, crawl_id):
+        """로그 줄 목록 (메모리에 없으면 저장된 로그 파일에서)"""
+        with self._changed:
+            stream = self._streams.peek(crawl_id)
+            if stream is not None:
+                return [data['line'] for _, event, data in stream.events if event == 'log']
+        return self._load_archive(crawl_id)
+
+    def prune(self):
+        """보관 시간이 지난 크롤링 정리 (로그는 파일로)"""
+        pruned = self._streams.prune()
+        self._archive_evicted()
+        return pruned
+
+    def _latest_id(self, crawl_id):
+        stream = self._streams.peek(crawl_id)
+        return stream.next_id - 1 if stream is not None else 0
+
+    def _archive_path(self, crawl_id):
+        # crawl_id는 작업 큐가 만든 16자리 hex, 그 밖의 값은 파일 이름으로 쓰지 않음
+        if not self.log_dir or not crawl_id.isalnum():
+            return None
+        return os.path.join(self.log_dir, f'{crawl_id}.log')
+
+    def _evicted(self, crawl_id, stream):
+        self._to_archive.append((crawl_id, stream))
+
+    def _archive_evicted(self):
+        while True:
+            try:
+                crawl_id, stream = self._to_archive.popleft()
+            except IndexError:
+                return
+            try:
+                self._archive(crawl_id, stream)
+            except Exception as e:
+                print(f"[이벤트] 로그 저장 오류 ({crawl_id}): {e}")
+
+    def _archive(self, crawl_id, stream):
+        """메모리에서 버리는 크롤링의 로그를 파일로 저장"""
+        path = self._archive_path(crawl_id)
+        lines = [data['line'] for _, event, data in stream.events if event == 'log']
+        if path is None or not lines:
+            return
+        os.makedirs(self.log_dir, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def _load_archive(self, crawl_id):
+        path = self._archive_path(crawl_id)
+        if path is None or not os.path.exists(path):
+            return []
+        with open(path, encoding='utf-8') as f:
+            return f.read().splitlines()
+
+
+def format_event(event, data, event_id=None):
+    """SSE 형식 문자열 (event_id가 있으면 재연결 시 Last-Event-ID로 돌아옴)"""
+    lines = [f'id: {event_id}'] if event_id is not None else []
+    lines.append(f'event: {event}')
+    lines.append('data: ' + json.dumps(data, ensure_ascii=False, default=str))
+    return '\n'.join(lines) + '\n\n'
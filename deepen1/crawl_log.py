@@ -0,0 +1,111 @@
+"""
+크롤링별 로그 캡처
+
+크롤러 코드는 print로 로그를 남긴다. install()이 sys.stdout/sys.stderr를 한 번 CrawlOutput으로 바꿔 두고,
+크롤링을 실행하는 동안 컨텍스트 변수(current_log)에 그 크롤링의 CrawlLogger를 묶어 두면
+같은 컨텍스트(작업 스레드, crawl_all이 복사해 넘긴 엔진 스레드)에서 출력한 줄만 그 크롤링의 로그로 간다.
+sys.stdout을 작업마다 바꾸지 않으므로 동시에 실행되는 크롤링의 로그가 섞이거나 사라지지 않고,
+한 줄이 끝날 때마다 바로 진행 스트림으로 전달된다.
+
+    logger = CrawlLogger(publish)
+    with logger.bind():
+        crawl_all(...)  # 이 안의 print는 logger로
+"""
+import contextvars
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+# 크롤링 로그를 서버 콘솔에도 출력 (0이면 크롤링 로그/진행 스트림으로만)
+LOG_ECHO = os.getenv('CRAWL_LOG_ECHO', '1') == '1'
+
+# 현재 컨텍스트에서 실행 중인 크롤링의 로거 (없으면 None)
+current_log = contextvars.ContextVar('current_log', default=None)
+
+
+class CrawlLogger:
+    """크롤링 하나의 로그 (완성된 줄마다 publish(line) 호출)"""
+
+    def __init__(self, publish, echo=None):
+        """
+        Args:
+            publish: publish(line) - 로그 한 줄 저장/전송
+            echo: 서버 콘솔에도 출력 (없으면 LOG_ECHO)
+        """
+        self.publish = publish
+        self.echo = LOG_ECHO if echo is None else echo
+        self._lock = threading.Lock()
+        self._pending = {}  # 스레드별로 아직 줄바꿈이 오지 않은 출력
+
+    def log(self, message):
+        """로그 한 줄 추가"""
+        self.publish(message)
+        if self.echo:
+            _console(sys.stdout).write(message + '\n')
+
+    def write(self, text):
+        """print 출력을 줄 단위로 나눠 추가 (print는 내용과 줄바꿈을 따로 씀)"""
+        thread_id = threading.get_ident()
+        with self._lock:
+            text = self._pending.pop(thread_id, '') + text
+            *lines, rest = text.split('\n')
+            if rest:
+                self._pending[thread_id] = rest
+        for line in lines:
+            if line.strip():
+                self.publish(line)
+
+    def flush_pending(self):
+        """줄바꿈 없이 끝난 출력 정리"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for line in pending.values():
+            if line.strip():
+                self.publish(line)
+
+    @contextmanager
+    def bind(self):
+        """with 블록 안(같은 컨텍스트)의 print 출력을 이 로그로"""
+        token = current_log.set(self)
+        try:
+            yield self
+        finally:
+            current_log.reset(token)
+            self.flush_pending()
+
+
+class CrawlOutput:
+    """sys.stdout/sys.stderr 대체 - 현재 컨텍스트에 크롤링 로그가 있으면 그쪽으로, 없으면 원래 스트림으로"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        log = current_log.get()
+        if log is None:
+            return self._stream.write(text)
+        log.write(text)
+        if log.echo:
+            self._stream.write(text)
+        return len(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        # encoding, isatty, fileno 등은 원래 스트림 그대로
+        return getattr(self._stream, name)
+
+
+def _console(stream):
+    """CrawlOutput이면 그 뒤의 원래 스트림"""
+    return stream._stream if isinstance(stream, CrawlOutput) else stream
+
+
+def install():
+    """sys.stdout/sys.stderr를 CrawlOutput으로 교체 (여러 번 호출해도 한 번만)"""
+    if not isinstance(sys.stdout, CrawlOutput):
+        sys.stdout = CrawlOutput(sys.stdout)
+    if not isinstance(sys.stderr, CrawlOutput):
+        sys.stderr = CrawlOutput(sys.stderr)
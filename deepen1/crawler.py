@@ -2,66 +2,133 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+import contextvars
+import json
+import os
 import time
 import re
-from datetime import datetime, timedelta
+import requests
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from urllib.parse import urlparse
 from dateutil import parser
+from bs4 import SoupStrainer
+import common_path  # noqa: F401 - 저장소 최상위 common/ 모듈 경로 (html_parser, text_parsers 등)
+from html_parser import make_soup
+from page_waits import PageWaiter
+from snapshot_store import snapshot_store, new_run_id
+from text_parsers import parse_relative_time, parse_relative_times, parse_view_count
+from youtube_data import (YOUTUBE_BASE_URL, extract_initial_data, extract_innertube_config, find_search_items,
+                          fetch_search_page, fetch_continuation)
+
+
+MOBILE_USER_AGENT = "Mozilla/5.0 (Linux; Android 13; SM-S908B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.144 Mobile Safari/537.36"
+
+
+def create_mobile_driver():
+    """모바일 User-Agent로 Chrome 드라이버 생성"""
+    chrome_options = Options()
+    
+    # User-Agent 설정 (안드로이드 모바일)
+    user_agent = MOBILE_USER_AGENT
+    chrome_options.add_argument(f'user-agent={user_agent}')
+    
+    # 기타 옵션
+    # chrome_options.add_argument('--headless=new')  # 헤드리스 모드 (디버깅용 비활성화)
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_argument('--start-maximized')  # 최대화 창으로 시작
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # 봇 감지 우회
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-software-rasterizer')
+    
+    # 화면 크기 설정 (안드로이드 모바일)
+    chrome_options.add_argument('--window-size=412,915')  # Galaxy S22 Ultra 크기
+    
+    # 모바일 에뮬레이션 설정
+    mobile_emulation = {
+        "deviceMetrics": {"width": 412, "height": 915, "pixelRatio": 3.0},
+        "userAgent": user_agent
+    }
+    chrome_options.add_experimental_option("mobileEmulation", mobile_emulation)
+    
+    service = Service(ChromeDriverManager().install())
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+
+def _no_log(*args, **kwargs):
+    """상세 로그 생략용"""
+
+
+def _json_text(node):
+    """ytInitialData 텍스트 노드 (runs / simpleText / content)를 문자열로"""
+    if not node:
+        return ''
+    if 'simpleText' in node:
+        return node['simpleText']
+    if 'runs' in node:
+        return ''.join(run.get('text', '') for run in node['runs'])
+    return node.get('content', '')
 
 
 class MobileCrawler:
     """모바일 환경 크롤링을 위한 기본 클래스"""
     
-    def __init__(self):
-        self.driver = None
+    # 페이지 준비 신호와 별개로 요청 사이에 두는 최소 딜레이 (차단 방지, 초)
+    POLITE_DELAY = (0.5, 1.0)
+    # 결과 1건마다 남기는 상세 로그 (파싱 루프마다 출력 비용이 들어 기본은 끔)
+    ITEM_LOGS = os.getenv('CRAWL_ITEM_LOGS', '0') == '1'
+    
+    def __init__(self, driver=None, polite_delay=None):
+        # driver를 넘겨받으면 (워커의 상주 브라우저) 재사용만 하고 종료하지 않음
+        # 함수를 넘기면 브라우저가 처음 필요할 때 호출 (HTTP/JSON 방식으로 끝나면 브라우저를 띄우지 않음)
+        self._driver_factory = driver if callable(driver) else None
+        self.driver = None if self._driver_factory else driver
+        self._owns_driver = driver is None
+        self.polite_delay_range = polite_delay if polite_delay is not None else self.POLITE_DELAY
+        self.stats = {}
+        # 이번 크롤링에서 가져온 페이지를 묶는 스냅샷 ID
+        self.snapshot_run = new_run_id()
         
     def setup_driver(self):
         """모바일 User-Agent로 Chrome 드라이버 설정"""
-        chrome_options = Options()
-        
-        # User-Agent 설정 (안드로이드 모바일)
-        user_agent = "Mozilla/5.0 (Linux; Android 13; SM-S908B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.144 Mobile Safari/537.36"
-        chrome_options.add_argument(f'user-agent={user_agent}')
-        
-        # 기타 옵션
-        # chrome_options.add_argument('--headless=new')  # 헤드리스 모드 (디버깅용 비활성화)
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--start-maximized')  # 최대화 창으로 시작
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option("detach", True)  # 브라우저 유지
-        
-        # 봇 감지 우회
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-software-rasterizer')
-        
-        # 화면 크기 설정 (안드로이드 모바일)
-        chrome_options.add_argument('--window-size=412,915')  # Galaxy S22 Ultra 크기
-        
-        # 모바일 에뮬레이션 설정
-        mobile_emulation = {
-            "deviceMetrics": {"width": 412, "height": 915, "pixelRatio": 3.0},
-            "userAgent": user_agent
-        }
-        chrome_options.add_experimental_option("mobileEmulation", mobile_emulation)
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        if self.driver is not None:
+            return
+        if self._driver_factory is not None:
+            self.driver = self._driver_factory()
+            return
+        self.driver = create_mobile_driver()
+        self._owns_driver = True
         
     def close_driver(self):
-        """드라이버 종료"""
-        if self.driver:
-            self.driver.quit()
+        """드라이버 종료 (직접 띄운 드라이버만)"""
+        if self.driver and self._owns_driver:
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
             
     def random_delay(self, min_sec=1, max_sec=3):
         """랜덤 딜레이 (차단 방지)"""
         import random
         time.sleep(random.uniform(min_sec, max_sec))
+    
+    def polite_delay(self):
+        """최소 예의 딜레이 (polite_delay=(0, 0)이면 대기 없음)"""
+        min_sec, max_sec = self.polite_delay_range
+        if max_sec > 0:
+            self.random_delay(min_sec, max_sec)
+    
+    def save_snapshot(self, provider, keyword, content, url='', page=0, kind='html', source=''):
+        """가져온 원본 페이지를 스냅샷으로 저장 (재파싱용)"""
+        if snapshot_store.save(provider, keyword, content, url=url, run=self.snapshot_run,
+                               page=page, kind=kind, source=source):
+            self.stats['snapshot_run'] = self.snapshot_run
 
 
 class GoogleMobileCrawler(MobileCrawler):
@@ -74,6 +141,30 @@ class GoogleMobileCrawler(MobileCrawler):
         r'sponsored',
     ]
     
+    # 페이지 준비 조건: 일반 결과 또는 이미지 섹션
+    READY_SELECTOR = 'div.kb0PBd, div[data-attrid="images universal"]'
+    # 스크롤 후 새 결과를 기다리는 최대 시간 (초)
+    SCROLL_TIMEOUT = 3
+    
+    # 페이지 요청 방식: 'http' (브라우저 없이 요청, 결과 블록이 없으면 브라우저로 전환) 또는 'browser'
+    FETCHER = os.getenv('GOOGLE_FETCHER', 'http')
+    # 검색 요청 주소 (GOOGLE_BASE_URL 환경변수, 로컬 픽스처 서버로 바꿀 때)
+    GOOGLE_BASE_URL = os.getenv('GOOGLE_BASE_URL', 'https://www.google.com')
+    # HTTP 방식에서 요청할 최대 페이지 수 (스크롤로 불러오던 다음 결과는 start 파라미터로 요청)
+    HTTP_MAX_PAGES = 5
+    HTTP_PAGE_SIZE = 10
+    HTTP_TIMEOUT = 10
+    # HTTP 응답에 이 표시가 하나도 없으면 (자바스크립트 필요 페이지, 차단 등) 브라우저로 전환
+    RESULT_MARKERS = ('class="kb0PBd', 'data-attrid="images universal"')
+    # 파싱할 범위 (div 하위 트리만)
+    RESULT_STRAINER = SoupStrainer('div')
+    # 이미지 링크 상세 로그 개수
+    IMAGE_DEBUG_LOGS = 10
+    
+    def __init__(self, driver=None, polite_delay=None, fetcher=None):
+        super().__init__(driver=driver, polite_delay=polite_delay)
+        self.fetcher = fetcher or self.FETCHER
+    
     def crawl(self, keyword):
         """
         구글 모바일 검색 결과 크롤링 (스크롤 끝까지)
@@ -86,24 +177,32 @@ class GoogleMobileCrawler(MobileCrawler):
         """
         results = []
         
+        if self.fetcher == 'http':
+            try:
+                results = self._crawl_http(keyword)
+            except Exception as e:
+                print(f"[구글 크롤링] HTTP 방식 오류: {e}")
+                results = []
+            if results:
+                return results
+            print("[구글 크롤링] HTTP 응답에 결과 블록이 없음, 브라우저 방식으로 전환")
+        
         try:
             self.setup_driver()
             
             # 구글 검색 (모바일 버전)
-            search_url = f"https://www.google.com/search?q={keyword}&hl=ko"
+            search_url = f"{self.GOOGLE_BASE_URL}/search?q={keyword}&hl=ko"
             self.driver.get(search_url)
             print(f"[구글 크롤링] URL: {search_url}")
             
-            # 페이지 로딩 대기
+            # 페이지 로딩 대기 (결과 블록이 나타나면 바로 진행)
             print("[구글 크롤링] 페이지 로딩 대기 중...")
-            self.random_delay(3, 5)
-            
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-            except:
-                pass
+            waiter = PageWaiter(self.driver)
+            waiter.ready(timeout=10)
+            if not waiter.selector(self.READY_SELECTOR, timeout=10):
+                print("[구글 크롤링] 결과 블록 대기 시간 초과, 현재 상태로 진행")
+            waiter.dom_quiet(quiet_ms=300, timeout=3)
+            self.polite_delay()
             
             # 스크롤하여 모든 결과 로드
             print("[구글 크롤링] 페이지 스크롤 중...")
@@ -112,285 +211,355 @@ class GoogleMobileCrawler(MobileCrawler):
             max_scrolls = 10
             
             while scroll_count < max_scrolls:
-                # 스크롤 다운
+                # 스크롤 다운 후 새 결과가 붙을 때까지 대기 (높이 증가 + DOM 안정)
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                self.random_delay(2, 3)
-                
-                # 새로운 높이 확인
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
+                new_height = waiter.count_increase(
+                    "return document.body.scrollHeight", last_height, timeout=self.SCROLL_TIMEOUT
+                )
+                if new_height > last_height:
+                    waiter.dom_quiet(quiet_ms=300, timeout=2)
+                    new_height = self.driver.execute_script("return document.body.scrollHeight")
                 
-                if new_height == last_height:
+                if new_height <= last_height:
                     # 더 이상 로드할 내용이 없으면 종료
                     break
                 
                 last_height = new_height
                 scroll_count += 1
                 print(f"  [스크롤] {scroll_count}회 완료")
+                self.polite_delay()
             
             print("[구글 크롤링] 페이지 파싱 시작...")
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            started = time.perf_counter()
+            page_source = self.driver.page_source
+            self.save_snapshot('google', keyword, page_source, url=search_url, source='browser')
+            results = self.parse_results(page_source)
+            self.stats.update({
+                'fetcher': 'browser',
+                'pages': 1,
+                'scrolls': scroll_count,
+                'page_bytes': len(page_source.encode('utf-8')),
+                'parse_seconds': round(time.perf_counter() - started, 3),
+            })
             
-            # 검색 결과 수집
-            processed_urls = {}  # {(url, position): result_type} 형태로 저장 (URL+position 조합)
-            position = 1
-            general_results = []
-            image_results = []
+        except Exception as e:
+            print(f"[구글 크롤링 오류] {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            self.close_driver()  # 직접 띄운 브라우저는 종료 (프로세스 누수 방지)
+        
+        return results
+    
+    def _crawl_http(self, keyword):
+        """브라우저 없이 모바일 User-Agent로 검색 결과 페이지들을 요청해 파싱"""
+        session = requests.Session()
+        headers = {'User-Agent': MOBILE_USER_AGENT, 'Accept-Language': 'ko-KR,ko;q=0.9'}
+        page_sources = []
+        page_bytes = 0
+        
+        for page in range(self.HTTP_MAX_PAGES):
+            if page:
+                self.polite_delay()
+            params = {'q': keyword, 'hl': 'ko'}
+            if page:
+                params['start'] = page * self.HTTP_PAGE_SIZE
+            response = session.get(f"{self.GOOGLE_BASE_URL}/search", params=params,
+                                   headers=headers, timeout=self.HTTP_TIMEOUT)
+            if page == 0:
+                print(f"[구글 크롤링] URL: {response.url} (HTTP 방식)")
+            if response.status_code != 200 or not self._has_results(response.text):
+                # 첫 페이지가 실패하면 브라우저로 전환, 이후 페이지는 결과 끝으로 판단
+                if page == 0:
+                    print(f"[구글 크롤링] HTTP 응답 {response.status_code}, 결과 블록 없음")
+                break
+            page_sources.append(response.text)
+            self.save_snapshot('google', keyword, response.text, url=response.url, page=page, source='http')
+            page_bytes += len(response.content)
+            print(f"  [페이지] {page + 1}페이지 수신 ({len(response.content) / 1024:.0f}KB)")
+        
+        if not page_sources:
+            return []
+        
+        print("[구글 크롤링] 페이지 파싱 시작...")
+        started = time.perf_counter()
+        results = self.parse_results(page_sources)
+        self.stats.update({
+            'fetcher': 'http',
+            'pages': len(page_sources),
+            'scrolls': 0,
+            'page_bytes': page_bytes,
+            'parse_seconds': round(time.perf_counter() - started, 3),
+        })
+        return results
+    
+    def parse_snapshot(self, records):
+        """
+        저장된 스냅샷(같은 run)으로 다시 파싱 (replay_snapshots.py)
+        브라우저 방식으로 전환된 크롤링은 브라우저 페이지만 사용
+        """
+        browser_pages = [record for record in records if record.get('source') == 'browser']
+        pages = browser_pages or sorted(records, key=lambda record: record['page'])
+        return self.parse_results([record['content'] for record in pages])
+    
+    def _has_results(self, html):
+        """검색 결과 블록 표시가 있는지 (파싱 전 빠른 확인)"""
+        return any(marker in html for marker in self.RESULT_MARKERS)
+    
+    def parse_results(self, page_sources):
+        """
+        검색 결과 HTML 파싱 (브라우저 page_source와 HTTP 응답에 같은 코드 사용)
+        
+        Args:
+            page_sources: HTML 문자열 또는 페이지 순서대로의 HTML 리스트 (HTTP 방식의 다음 페이지들)
             
-            # 1단계: 일반 링크 수집
-            print("[구글 크롤링] 1단계: 일반 링크 수집 중...")
-            all_items = soup.find_all('div', class_='kb0PBd')
-            print(f"  → {len(all_items)}개 아이템 발견")
+        Returns:
+            list: 검색 결과 딕셔너리 리스트
+        """
+        if isinstance(page_sources, str):
+            page_sources = [page_sources]
+        
+        results = []
+        processed_urls = {}  # {(url, position): result_type} 형태로 저장 (URL+position 조합)
+        position = 1
+        general_results = []
+        image_results = []
+        
+        for page_source in page_sources:
+            # 결과/이미지 블록은 모두 div 안에 있으므로 최상위 script/style 등은 트리로 만들지 않음
+            soup = make_soup(page_source, parse_only=self.RESULT_STRAINER)
+            page_general = []
+            page_images = []
+            position = self._collect_general(soup, processed_urls, position, page_general)
+            position = self._collect_images(soup, processed_urls, position, page_images)
             
-            for item in all_items:
+            # 다음 페이지에서 이전 페이지와 같은 URL은 제외
+            seen_urls = {result['url'] for result in general_results + image_results}
+            general_results.extend(result for result in page_general if result['url'] not in seen_urls)
+            image_results.extend(result for result in page_images if result['url'] not in seen_urls)
+        
+        # 3단계: 결과 합치기 (일반 + 이미지)
+        print("[구글 크롤링] 3단계: 결과 합치기...")
+        all_results = general_results + image_results
+        
+        # 최종 순위는 1부터 (일반 → 이미지 순)
+        position = 1
+        for result in all_results:
+            result['position'] = position
+            results.append(result)
+            position += 1
+        
+        print(f"[구글 크롤링 완료] 총 {len(results)}개 결과 (일반 {len(general_results)}개 + 이미지 {len(image_results)}개)")
+        
+        return results
+    
+    def _collect_general(self, soup, processed_urls, position, general_results):
+        """1단계: 일반 링크 수집 (다음 position 반환)"""
+        print("[구글 크롤링] 1단계: 일반 링크 수집 중...")
+        
+        # 결과 블록, 링크, 출처를 한 번의 순회로 수집한 뒤
+        # 상위 요소 → 그 안의 첫 링크/출처 맵을 만들어 결과마다 하위 트리를 다시 검색하지 않음
+        all_items = []
+        links = []
+        sources = []
+        for node in soup.find_all(self._is_result_node):
+            if node.name == 'a':
+                links.append(node)
+            elif node.get('data-snf') == 'dqs64d':
+                sources.append(node)
+            else:
+                all_items.append(node)
+        link_by_container = self._first_descendant_map(links)
+        source_by_container = self._first_descendant_map(sources)
+        print(f"  → {len(all_items)}개 아이템 발견")
+        
+        for item in all_items:
+            try:
+                # 일반 링크 확인 (data-snf="GuLy6c")
+                title_container = item.find('div', {'data-snf': 'GuLy6c'})
+                if not title_container:
+                    continue
+                
+                title_elem = title_container.find('span')
+                if not title_elem:
+                    continue
+                title = title_elem.get_text(strip=True)
+                
+                # URL 찾기 (가장 가까운 상위 요소부터 그 안의 a.rTyHce)
+                parent = item.find_parent(['div', 'a'])
+                link_elem = None
+                while parent and not link_elem:
+                    link_elem = link_by_container.get(id(parent))
+                    if not link_elem:
+                        parent = parent.find_parent(['div'])
+                
+                if not link_elem:
+                    continue
+                
+                url = link_elem.get('href', '')
+                
+                # URL 정제
+                if url.startswith('/url?q='):
+                    url = url.split('/url?q=')[1].split('&')[0]
+                
+                # 유효성 검사
+                if not url.startswith('http'):
+                    continue
+                
+                # 중복 체크: 같은 URL + position 조합이 이미 있으면 제외
+                key = (url, position)
+                if key in processed_urls:
+                    continue
+                
+                # 광고 필터링
+                if self._is_ad(url, item):
+                    continue
+                
+                # 출처 찾기 (data-snf="dqs64d")
+                source = ''
+                source_container = source_by_container.get(id(item.find_parent(['div'])))
+                if source_container:
+                    source_elem = source_container.find('div', class_='GkAmnd')
+                    if source_elem:
+                        source = source_elem.get_text(strip=True)
+                
+                processed_urls[key] = '일반'
+                
+                general_results.append({
+                    'title': title,
+                    'url': url,
+                    'snippet': source,
+                    'source': source,
+                    'thumbnail': '',
+                    'position': position,
+                    'result_type': '일반',
+                    'published_date': '',
+                    'is_ad': False
+                })
+                
+                if self.ITEM_LOGS:
+                    print(f"  [일반] {len(general_results)}. {source} - {title[:40]}...")
+                position += 1
+                
+            except Exception as e:
+                continue
+        
+        print(f"[1단계 완료] 일반 링크 {len(general_results)}개 수집")
+        
+        return position
+    
+    @staticmethod
+    def _is_result_node(tag):
+        """1단계에서 필요한 요소: 결과 블록(div.kb0PBd), 링크(a.rTyHce), 출처(div[data-snf=dqs64d])"""
+        if tag.name == 'div':
+            return 'kb0PBd' in tag.get('class', ()) or tag.get('data-snf') == 'dqs64d'
+        return tag.name == 'a' and 'rTyHce' in tag.get('class', ()) and tag.has_attr('href')
+    
+    @staticmethod
+    def _first_descendant_map(elements):
+        """{id(상위 요소): 그 안에서 문서 순서상 첫 번째 요소} (element.find와 같은 결과)"""
+        first = {}
+        for element in elements:
+            for ancestor in element.parents:
+                if id(ancestor) in first:
+                    # 더 위쪽 상위 요소도 이미 앞선 요소로 채워져 있음
+                    break
+                first[id(ancestor)] = element
+        return first
+    
+    def _collect_images(self, soup, processed_urls, position, image_results):
+        """2단계: 이미지 링크 수집 (다음 position 반환)"""
+        print("[구글 크롤링] 2단계: 이미지 링크 수집 중...")
+        
+        # 모든 이미지 섹션 찾기 (data-attrid="images universal")
+        image_sections = soup.find_all('div', attrs={'data-attrid': 'images universal'})
+        
+        if not image_sections:
+            print("  → 이미지 섹션을 찾을 수 없음")
+        else:
+            print(f"  → {len(image_sections)}개 이미지 섹션 발견")
+            
+            # 모든 섹션에서 aria-label이 있는 <a> 태그 수집
+            image_links = []
+            for section in image_sections:
+                links = section.find_all('a', attrs={'aria-label': True, 'href': True})
+                image_links.extend(links)
+            
+            print(f"  → 총 {len(image_links)}개 이미지 링크 발견")
+            
+            for img_count, link in enumerate(image_links, 1):
+                # 처음 10개만 상세 로그
+                log = print if self.ITEM_LOGS and img_count <= self.IMAGE_DEBUG_LOGS else _no_log
+                if self.ITEM_LOGS and img_count == self.IMAGE_DEBUG_LOGS + 1:
+                    print(f"  [디버그] {self.IMAGE_DEBUG_LOGS}개 이상 처리됨, 상세 로그 생략...")
                 try:
-                    # 일반 링크 확인 (data-snf="GuLy6c")
-                    title_container = item.find('div', {'data-snf': 'GuLy6c'})
-                    if not title_container:
-                        continue
-                    
-                    title_elem = title_container.find('span')
-                    if not title_elem:
-                        continue
-                    title = title_elem.get_text(strip=True)
+                    # 제목은 aria-label
+                    title = link.get('aria-label', '').strip()
+                    url = link.get('href', '')
                     
-                    # URL 찾기 (부모에서)
-                    parent = item.find_parent(['div', 'a'])
-                    link_elem = None
-                    while parent and not link_elem:
-                        link_elem = parent.find('a', class_='rTyHce', href=True)
-                        if not link_elem:
-                            parent = parent.find_parent(['div'])
+                    log(f"  [디버그 {img_count}] title={title[:50]}")
+                    log(f"    → 원본 URL: {url[:80]}...")
                     
-                    if not link_elem:
+                    if not title or len(title) < 2:
+                        log(f"    → 제목이 너무 짧아서 제외")
                         continue
                     
-                    url = link_elem.get('href', '')
-                    
                     # URL 정제
                     if url.startswith('/url?q='):
                         url = url.split('/url?q=')[1].split('&')[0]
+                        log(f"    → 정제된 URL: {url[:80]}...")
                     
                     # 유효성 검사
                     if not url.startswith('http'):
+                        log(f"    → http로 시작하지 않음")
+                        continue
+                    
+                    # 출처는 URL에서 추출
+                    source = urlparse(url).netloc.replace('www.', '')
+                    log(f"    → 출처: {source}")
+                    
+                    if not source:
+                        log(f"    → 출처가 없어서 제외")
                         continue
                     
                     # 중복 체크: 같은 URL + position 조합이 이미 있으면 제외
                     key = (url, position)
                     if key in processed_urls:
+                        log(f"    → 중복 URL+position (이미지)")
                         continue
                     
-                    # 광고 필터링
-                    if self._is_ad(url, item):
-                        continue
-                    
-                    # 출처 찾기 (data-snf="dqs64d")
-                    source = ''
-                    source_container = item.find_parent(['div']).find('div', {'data-snf': 'dqs64d'})
-                    if source_container:
-                        source_elem = source_container.find('div', class_='GkAmnd')
-                        if source_elem:
-                            source = source_elem.get_text(strip=True)
+                    processed_urls[key] = '이미지'
                     
-                    processed_urls[key] = '일반'
+                    # 썸네일 이미지 찾기 (같은 부모 안에서)
+                    thumbnail = ''
+                    parent = link.find_parent()
+                    if parent:
+                        img_elem = parent.find('img')
+                        if img_elem:
+                            thumbnail = img_elem.get('src', '')
                     
-                    general_results.append({
+                    image_results.append({
                         'title': title,
                         'url': url,
                         'snippet': source,
                         'source': source,
-                        'thumbnail': '',
+                        'thumbnail': thumbnail,
                         'position': position,
-                        'result_type': '일반',
+                        'result_type': '이미지',
                         'published_date': '',
                         'is_ad': False
                     })
                     
-                    print(f"  [일반] {len(general_results)}. {source} - {title[:40]}...")
+                    log(f"  ✅ [이미지 {len(image_results)}] {source} - {title[:40]}...")
                     position += 1
                     
                 except Exception as e:
+                    log(f"    → 예외 발생: {e}")
                     continue
-            
-            print(f"[1단계 완료] 일반 링크 {len(general_results)}개 수집")
-            
-            # 2단계: 이미지 링크 수집
-            print("[구글 크롤링] 2단계: 이미지 링크 수집 중...")
-            
-            # 모든 이미지 섹션 찾기 (data-attrid="images universal")
-            image_sections = soup.find_all('div', attrs={'data-attrid': 'images universal'})
-            
-            if not image_sections:
-                print("  → 이미지 섹션을 찾을 수 없음")
-            else:
-                print(f"  → {len(image_sections)}개 이미지 섹션 발견")
-                
-                # 모든 섹션에서 aria-label이 있는 <a> 태그 수집
-                image_links = []
-                for section in image_sections:
-                    links = section.find_all('a', attrs={'aria-label': True, 'href': True})
-                    image_links.extend(links)
-                
-                print(f"  → 총 {len(image_links)}개 이미지 링크 발견")
-                
-                img_count = 0
-                for link in image_links:
-                    try:
-                        img_count += 1
-                        
-                        # 제목은 aria-label
-                        title = link.get('aria-label', '').strip()
-                        url = link.get('href', '')
-                        
-                        print(f"  [디버그 {img_count}] title={title[:50]}")
-                        print(f"    → 원본 URL: {url[:80]}...")
-                        
-                        if not title or len(title) < 2:
-                            print(f"    → 제목이 너무 짧아서 제외")
-                            continue
-                        
-                        # URL 정제
-                        if url.startswith('/url?q='):
-                            url = url.split('/url?q=')[1].split('&')[0]
-                            print(f"    → 정제된 URL: {url[:80]}...")
-                        
-                        # 유효성 검사
-                        if not url.startswith('http'):
-                            print(f"    → http로 시작하지 않음")
-                            continue
-                        
-                        # 출처는 URL에서 추출
-                        from urllib.parse import urlparse
-                        source = ''
-                        try:
-                            parsed = urlparse(url)
-                            source = parsed.netloc.replace('www.', '')
-                            print(f"    → 출처: {source}")
-                        except Exception as e:
-                            print(f"    → 출처 추출 실패: {e}")
-                            source = ''
-                        
-                        if not source:
-                            print(f"    → 출처가 없어서 제외")
-                            continue
-                        
-                        # 중복 체크: 같은 URL + position 조합이 이미 있으면 제외
-                        key = (url, position)
-                        if key in processed_urls:
-                            print(f"    → 중복 URL+position (이미지)")
-                            continue
-                        
-                        processed_urls[key] = '이미지'
-                        
-                        # 썸네일 이미지 찾기 (같은 부모 안에서)
-                        thumbnail = ''
-                        parent = link.find_parent()
-                        if parent:
-                            img_elem = parent.find('img')
-                            if img_elem:
-                                thumbnail = img_elem.get('src', '')
-                        
-                        image_results.append({
-                            'title': title,
-                            'url': url,
-                            'snippet': source,
-                            'source': source,
-                            'thumbnail': thumbnail,
-                            'position': position,
-                            'result_type': '이미지',
-                            'published_date': '',
-                            'is_ad': False
-                        })
-                        
-                        print(f"  ✅ [이미지 {len(image_results)}] {source} - {title[:40]}...")
-                        position += 1
-                        
-                        # 처음 10개만 상세 로그
-                        if img_count >= 10:
-                            print(f"  [디버그] 10개 이상 처리됨, 상세 로그 생략...")
-                            break
-                        
-                    except Exception as e:
-                        print(f"    → 예외 발생: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        continue
-                
-                # 나머지 이미지도 조용히 처리
-                if img_count >= 10:
-                    for link in image_links[10:]:
-                        try:
-                            title = link.get('aria-label', '').strip()
-                            url = link.get('href', '')
-                            
-                            if not title or len(title) < 2:
-                                continue
-                            
-                            if url.startswith('/url?q='):
-                                url = url.split('/url?q=')[1].split('&')[0]
-                            
-                            if not url.startswith('http'):
-                                continue
-                            
-                            from urllib.parse import urlparse
-                            source = ''
-                            try:
-                                parsed = urlparse(url)
-                                source = parsed.netloc.replace('www.', '')
-                            except:
-                                source = ''
-                            
-                            if not source:
-                                continue
-                            
-                            # 중복 체크: 같은 URL + position 조합이 이미 있으면 제외
-                            key = (url, position)
-                            if key in processed_urls:
-                                continue
-                            
-                            processed_urls[key] = '이미지'
-                            
-                            thumbnail = ''
-                            parent = link.find_parent()
-                            if parent:
-                                img_elem = parent.find('img')
-                                if img_elem:
-                                    thumbnail = img_elem.get('src', '')
-                            
-                            image_results.append({
-                                'title': title,
-                                'url': url,
-                                'snippet': source,
-                                'source': source,
-                                'thumbnail': thumbnail,
-                                'result_type': '이미지',
-                                'published_date': '',
-                                'is_ad': False
-                            })
-                            
-                        except Exception as e:
-                            continue
-            
-            print(f"[2단계 완료] 이미지 링크 {len(image_results)}개 수집")
-            
-            # 3단계: 결과 합치기 (일반 + 이미지)
-            print("[구글 크롤링] 3단계: 결과 합치기...")
-            all_results = general_results + image_results
-            
-            for result in all_results:
-                result['position'] = position
-                results.append(result)
-                position += 1
-            
-            print(f"[구글 크롤링 완료] 총 {len(results)}개 결과 (일반 {len(general_results)}개 + 이미지 {len(image_results)}개)")
-            
-        except Exception as e:
-            print(f"[구글 크롤링 오류] {e}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            pass  # 드라이버를 유지하여 연속 크롤링 가능
         
-        return results
+        print(f"[2단계 완료] 이미지 링크 {len(image_results)}개 수집")
+        
+        return position
     
     def _is_ad(self, url, element):
         """광고 여부 확인"""
@@ -404,28 +573,69 @@ class GoogleMobileCrawler(MobileCrawler):
 class YouTubeMobileCrawler(MobileCrawler):
     """유튜브 모바일 검색 크롤러 (일반 동영상 + Shorts)"""
     
+    # 페이지 준비 조건: 일반 영상 또는 Shorts 구간
+    READY_SELECTOR = 'ytm-video-with-context-renderer, ytm-reel-shelf-renderer, grid-shelf-view-model'
+    ITEM_COUNT_JS = f"return document.querySelectorAll({READY_SELECTOR!r}).length;"
+    # 목표 개수 확인용 카운터 (파싱 단계와 같은 컨테이너/아이템 기준): [일반 영상 수, Shorts 구간 수]
+    TARGET_COUNT_JS = """
+        var root = document.querySelector('div#contents')
+            || document.querySelector('ytm-item-section-renderer')
+            || document.querySelector('div[role="main"]')
+            || document.body;
+        if (!root) { return [0, 0]; }
+        return [
+            root.querySelectorAll('ytm-video-with-context-renderer.item').length,
+            root.querySelectorAll('ytm-reel-shelf-renderer.item, grid-shelf-view-model.item').length
+        ];
+    """
+    # 스크롤 후 새 아이템을 기다리는 최대 시간 (초)
+    SCROLL_TIMEOUT = 4
+    
+    # ytInitialData 렌더러 이름 (모바일/데스크톱)
+    JSON_VIDEO_RENDERERS = ('videoWithContextRenderer', 'videoRenderer')
+    JSON_SHELF_RENDERERS = ('reelShelfRenderer', 'gridShelfViewModel')
+    
+    # 결과 추출 방식: 'json' (ytInitialData, 브라우저 없음, 실패 시 DOM으로 전환) 또는 'dom'
+    EXTRACTOR = os.getenv('YOUTUBE_EXTRACTOR', 'json')
+    # JSON 방식에서 추가로 불러올 최대 페이지 수 (DOM 방식의 최대 스크롤 횟수와 동일)
+    MAX_CONTINUATIONS = 10
+    # 검색/continuation 요청 주소 (YOUTUBE_BASE_URL 환경변수, 로컬 픽스처 서버로 바꿀 때)
+    YOUTUBE_BASE_URL = YOUTUBE_BASE_URL
+    
+    def __init__(self, driver=None, polite_delay=None, extractor=None):
+        super().__init__(driver=driver, polite_delay=polite_delay)
+        self.extractor = extractor or self.EXTRACTOR
+    
     def crawl(self, keyword, max_regular=15, max_shorts_shelves=2, shorts_per_shelf=5):
         """유튜브 모바일 검색 결과 크롤링 (실제 화면 순서대로)"""
         results = []
         
         try:
+            if self.extractor == 'json':
+                try:
+                    results = self._crawl_initial_data(keyword, max_regular, max_shorts_shelves, shorts_per_shelf)
+                except Exception as e:
+                    print(f"[유튜브 크롤링] JSON 방식 오류: {e}")
+                    results = []
+                if results:
+                    return results
+                print("[유튜브 크롤링] ytInitialData 추출 실패, 브라우저(DOM) 방식으로 전환")
+            
             self.setup_driver()
-            search_url = f"https://m.youtube.com/results?search_query={keyword}"
+            search_url = f"{self.YOUTUBE_BASE_URL}/results?search_query={keyword}"
             self.driver.get(search_url)
             print(f"[유튜브 크롤링] URL: {search_url}")
             
-            # 페이지 로딩 대기 (증가)
+            # 페이지 로딩 대기 (첫 결과 아이템이 렌더링되면 바로 진행)
             print("[유튜브 크롤링] 페이지 로딩 대기 중...")
-            print(f"[디버그] 브라우저 창이 열렸습니다!")
-            print(f"[디버그] URL: {search_url}")
-            self.random_delay(10, 12)
-            try:
-                WebDriverWait(self.driver, 30).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
+            waiter = PageWaiter(self.driver)
+            waiter.ready(timeout=30)
+            if waiter.selector(self.READY_SELECTOR, timeout=30):
+                waiter.dom_quiet(quiet_ms=500, timeout=5)
                 print(f"[디버그] 페이지 제목: {self.driver.title}")
-            except Exception as e:
-                print(f"[경고] 페이지 로딩 대기 중 오류: {e}")
+            else:
+                print(f"[경고] 결과 아이템 대기 시간 초과, 현재 상태로 진행")
+            self.polite_delay()
             
             # 스마트 스크롤: 목표 개수에 도달할 때까지만 스크롤
             print("[유튜브 크롤링] 스마트 스크롤 시작...")
@@ -440,33 +650,23 @@ class YouTubeMobileCrawler(MobileCrawler):
                 # 현재 페이지 높이
                 current_height = self.driver.execute_script("return document.body.scrollHeight")
                 
-                # 스크롤 실행
+                # 스크롤 실행 후 아이템이 늘어날 때까지 대기 (늘어나면 DOM 안정까지)
+                item_count = self.driver.execute_script(self.ITEM_COUNT_JS) or 0
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                 scroll_count += 1
                 print(f"  [스크롤 {scroll_count}회] 높이: {current_height}")
-                self.random_delay(1.5, 2)
+                if waiter.count_increase(self.ITEM_COUNT_JS, item_count, timeout=self.SCROLL_TIMEOUT) > item_count:
+                    waiter.dom_quiet(quiet_ms=300, timeout=2)
+                self.polite_delay()
                 
-                # 현재까지 수집된 아이템 개수 체크
-                soup_temp = BeautifulSoup(self.driver.page_source, 'html.parser')
-                contents_temp = soup_temp.find('div', id='contents')
-                if not contents_temp:
-                    contents_temp = soup_temp.find('ytm-item-section-renderer')
-                if not contents_temp:
-                    contents_temp = soup_temp.find('div', {'role': 'main'})
-                if not contents_temp:
-                    contents_temp = soup_temp.find('body')
+                # 현재까지 수집된 아이템 개수 체크 (브라우저 안에서 세기, 페이지 전송/파싱 없음)
+                video_count, shorts_count = self.driver.execute_script(self.TARGET_COUNT_JS)
+                print(f"    → 현재: 일반 {video_count}개, Shorts {shorts_count}개 발견")
                 
-                if contents_temp:
-                    items_temp = contents_temp.find_all(class_='item')
-                    video_count = sum(1 for item in items_temp if item.name == 'ytm-video-with-context-renderer')
-                    shorts_count = sum(1 for item in items_temp if item.name in ['ytm-reel-shelf-renderer', 'grid-shelf-view-model'])
-                    
-                    print(f"    → 현재: 일반 {video_count}개, Shorts {shorts_count}개 발견")
-                    
-                    # 목표 개수 도달 확인
-                    if video_count >= target_videos and shorts_count >= target_shorts:
-                        print(f"  ✅ 목표 달성! (일반 {target_videos}개, Shorts {target_shorts}개)")
-                        break
+                # 목표 개수 도달 확인
+                if video_count >= target_videos and shorts_count >= target_shorts:
+                    print(f"  ✅ 목표 달성! (일반 {target_videos}개, Shorts {target_shorts}개)")
+                    break
                 
                 # 더 이상 스크롤되지 않으면 중단
                 new_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -477,122 +677,349 @@ class YouTubeMobileCrawler(MobileCrawler):
             
             print(f"[스크롤 완료] 총 {scroll_count}회 스크롤")
             
+            # 스크롤이 끝난 뒤 페이지를 한 번만 가져와 파싱
             print("[유튜브 크롤링] 페이지 파싱 시작...")
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
-            # 1단계: 순서 맵 생성
-            order_map = []
-            
-            # 다양한 방법으로 컨테이너 찾기
-            contents = soup.find('div', id='contents')
-            if not contents:
-                print("[시도 1] id='contents' 찾기 실패, 다른 방법 시도 중...")
-                contents = soup.find('ytm-item-section-renderer')
-            if not contents:
-                print("[시도 2] ytm-item-section-renderer 찾기 실패, 다른 방법 시도 중...")
-                contents = soup.find('div', {'role': 'main'})
-            if not contents:
-                print("[시도 3] role='main' 찾기 실패, body 전체 사용...")
-                contents = soup.find('body')
-            
-            if not contents:
-                print("[오류] 어떤 컨테이너도 찾을 수 없습니다.")
-                return []
+            started = time.perf_counter()
+            page_source = self.driver.page_source
+            fetched = time.perf_counter()
+            self.save_snapshot('youtube', keyword, page_source, url=search_url, source='dom')
+            results = self.parse_page(page_source, max_regular, max_shorts_shelves, shorts_per_shelf)
+            parsed = time.perf_counter()
             
-            print(f"[성공] 컨테이너 발견: {contents.name}")
+            page_bytes = len(page_source.encode('utf-8'))
+            self.stats.update({
+                'extractor': 'dom',
+                'scrolls': scroll_count,
+                'page_bytes': page_bytes,
+                'serialize_seconds': round(fetched - started, 3),
+                'parse_seconds': round(parsed - fetched, 3),
+            })
+            print(f"[유튜브 크롤링] 페이지 {page_bytes / 1024:.0f}KB 전송 {self.stats['serialize_seconds']}초, "
+                  f"파싱 {self.stats['parse_seconds']}초 (스크롤마다 파싱하던 방식이면 약 {page_bytes * (scroll_count + 1) / 1024:.0f}KB)")
             
-            print("[1단계] 요소 순서 스캔 중...")
-            # class="item"인 모든 요소 찾기
-            items = contents.find_all(class_='item')
-            print(f"  [디버그] 총 {len(items)}개 item 발견")
-            
-            for element in items:
-                if not element.name:
-                    continue
-                if element.name == 'ytm-video-with-context-renderer':
-                    order_map.append(('video', element))
+        except Exception as e:
+            print(f"[유튜브 크롤링 오류] {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            self.close_driver()  # 직접 띄운 브라우저는 종료 (프로세스 누수 방지)
+        
+        return results
+    
+    def parse_page(self, page_source, max_regular=15, max_shorts_shelves=2, shorts_per_shelf=5):
+        """렌더링된 검색 결과 HTML 파싱 (DOM 방식)"""
+        soup = make_soup(page_source)
+        
+        # 1단계: 순서 맵 생성
+        order_map = []
+        
+        # 다양한 방법으로 컨테이너 찾기
+        contents = soup.find('div', id='contents')
+        if not contents:
+            print("[시도 1] id='contents' 찾기 실패, 다른 방법 시도 중...")
+            contents = soup.find('ytm-item-section-renderer')
+        if not contents:
+            print("[시도 2] ytm-item-section-renderer 찾기 실패, 다른 방법 시도 중...")
+            contents = soup.find('div', {'role': 'main'})
+        if not contents:
+            print("[시도 3] role='main' 찾기 실패, body 전체 사용...")
+            contents = soup.find('body')
+        
+        if not contents:
+            print("[오류] 어떤 컨테이너도 찾을 수 없습니다.")
+            return []
+        
+        print(f"[성공] 컨테이너 발견: {contents.name}")
+        
+        print("[1단계] 요소 순서 스캔 중...")
+        # class="item"인 모든 요소 찾기
+        items = contents.find_all(class_='item')
+        print(f"  [디버그] 총 {len(items)}개 item 발견")
+        
+        for element in items:
+            if not element.name:
+                continue
+            if element.name == 'ytm-video-with-context-renderer':
+                order_map.append(('video', element))
+                if self.ITEM_LOGS:
                     print(f"  [디버그] 일반 영상 발견")
-                elif element.name == 'ytm-reel-shelf-renderer':
-                    order_map.append(('reel', element))
+            elif element.name == 'ytm-reel-shelf-renderer':
+                order_map.append(('reel', element))
+                if self.ITEM_LOGS:
                     print(f"  [디버그] Shorts 구간 발견 (ytm-reel-shelf-renderer)")
-                elif element.name == 'grid-shelf-view-model':
-                    order_map.append(('reel', element))
+            elif element.name == 'grid-shelf-view-model':
+                order_map.append(('reel', element))
+                if self.ITEM_LOGS:
                     print(f"  [디버그] Shorts 구간 발견 (grid-shelf-view-model)")
-            
-            print(f"[1단계 완료] 총 {len(order_map)}개 요소 발견 (일반/Shorts 합계)")
-            
-            # 2단계: 데이터 수집
-            print("[2단계] 데이터 수집 중...")
-            videos = []
-            shorts_shelves = []
-            processed_video_ids = set()
-            
-            # 일반 영상 수집
-            video_count = 0
-            for item_type, element in order_map:
-                if item_type == 'video' and video_count < max_regular:
-                    try:
-                        video_data = self._parse_video(element, processed_video_ids)
-                        if video_data:
-                            videos.append(video_data)
-                            video_count += 1
+        
+        print(f"[1단계 완료] 총 {len(order_map)}개 요소 발견 (일반/Shorts 합계)")
+        
+        return self._assemble(order_map, self._parse_video, self._parse_shorts_shelf,
+                              max_regular, max_shorts_shelves, shorts_per_shelf)
+    
+    def _assemble(self, order_map, parse_video, parse_shelf, max_regular, max_shorts_shelves, shorts_per_shelf):
+        """
+        순서 맵 [('video'|'reel', 요소), ...]에서 결과 조립 (DOM/JSON 방식 공통)
+        parse_video(요소, 처리된 ID 집합), parse_shelf(요소, 처리된 ID 집합, 구간당 개수)
+        """
+        results = []
+        
+        # 2단계: 데이터 수집
+        print("[2단계] 데이터 수집 중...")
+        videos = []
+        shorts_shelves = []
+        processed_video_ids = set()
+        
+        # 일반 영상 수집
+        video_count = 0
+        for item_type, element in order_map:
+            if item_type == 'video' and video_count < max_regular:
+                try:
+                    video_data = parse_video(element, processed_video_ids)
+                    if video_data:
+                        videos.append(video_data)
+                        video_count += 1
+                        if self.ITEM_LOGS:
                             print(f"  [일반 영상 {video_count}/{max_regular}] {video_data['title'][:30]}...")
-                    except Exception as e:
-                        print(f"  [일반 영상 파싱 오류] {e}")
-                        continue
-            
-            # Shorts 구간 수집
-            shorts_count = 0
-            for item_type, element in order_map:
-                if item_type == 'reel' and shorts_count < max_shorts_shelves:
-                    try:
-                        shelf_data = self._parse_shorts_shelf(element, processed_video_ids, shorts_per_shelf)
-                        if shelf_data:
-                            shorts_shelves.append(shelf_data)
-                            shorts_count += 1
-                            print(f"  [Shorts 구간 {shorts_count}/{max_shorts_shelves}] {len(shelf_data)}개 수집")
-                    except Exception as e:
-                        print(f"  [Shorts 구간 파싱 오류] {e}")
-                        continue
+                except Exception as e:
+                    print(f"  [일반 영상 파싱 오류] {e}")
+                    continue
+        
+        # Shorts 구간 수집
+        shorts_count = 0
+        for item_type, element in order_map:
+            if item_type == 'reel' and shorts_count < max_shorts_shelves:
+                try:
+                    shelf_data = parse_shelf(element, processed_video_ids, shorts_per_shelf)
+                    if shelf_data:
+                        shorts_shelves.append(shelf_data)
+                        shorts_count += 1
+                        print(f"  [Shorts 구간 {shorts_count}/{max_shorts_shelves}] {len(shelf_data)}개 수집")
+                except Exception as e:
+                    print(f"  [Shorts 구간 파싱 오류] {e}")
+                    continue
+        
+        print(f"[2단계 완료] 일반 {len(videos)}개, Shorts 구간 {len(shorts_shelves)}개")
+        
+        # 업로드 날짜는 모아서 한 번에 변환 (같은 기준 시각)
+        collected = videos + [short for shelf in shorts_shelves for short in shelf]
+        for item, timestamp in zip(collected, parse_relative_times(item['upload_date'] for item in collected)):
+            item['upload_timestamp'] = timestamp
+        
+        # 3단계: 순서대로 조립
+        print("[3단계] 결과 조립 중...")
+        video_idx = 0
+        reel_idx = 0
+        overall_position = 1
+        
+        for item_type, _ in order_map:
+            if item_type == 'video' and video_idx < len(videos):
+                video = videos[video_idx]
+                video['position'] = overall_position
+                results.append(video)
+                overall_position += 1
+                video_idx += 1
+        
+            elif item_type == 'reel' and reel_idx < len(shorts_shelves):
+                shelf = shorts_shelves[reel_idx]
+                reel_idx += 1
+        
+                for position_in_shelf, short in enumerate(shelf, 1):
+                    short['position'] = overall_position
+                    short['short_shelf_index'] = reel_idx
+                    short['position_in_shelf'] = position_in_shelf
+                    results.append(short)
+                    overall_position += 1
+        
+        print(f"[3단계 완료] 총 {len(results)}개 결과 조립")
+        print(f"[유튜브 크롤링 완료] 일반 {video_idx}개 + Shorts {sum(len(s) for s in shorts_shelves)}개 = 총 {len(results)}개")
+        
+        return results
+    
+    def _crawl_initial_data(self, keyword, max_regular, max_shorts_shelves, shorts_per_shelf):
+        """ytInitialData JSON 방식 크롤링 (브라우저 없이 HTTP 요청만 사용)"""
+        session = requests.Session()
+        response = fetch_search_page(keyword, MOBILE_USER_AGENT, base_url=self.YOUTUBE_BASE_URL, session=session)
+        print(f"[유튜브 크롤링] URL: {response.url} (ytInitialData 방식)")
+        page_bytes = len(response.content)
+        self.save_snapshot('youtube', keyword, response.text, url=response.url, source='json')
+        
+        started = time.perf_counter()
+        data = extract_initial_data(response.text)
+        parse_seconds = time.perf_counter() - started
+        if not data:
+            return []
+        config = extract_innertube_config(response.text)
+        items, token = find_search_items(data)
+        
+        # 목표 개수에 도달할 때까지 다음 페이지 요청 (스크롤 대신)
+        pages = 0
+        while token and pages < self.MAX_CONTINUATIONS:
+            video_count, shorts_count = self._count_json_items(items)
+            print(f"    → 현재: 일반 {video_count}개, Shorts {shorts_count}개 발견")
+            if video_count >= max_regular and shorts_count >= max_shorts_shelves:
+                print(f"  ✅ 목표 달성! (일반 {max_regular}개, Shorts {max_shorts_shelves}개)")
+                break
+            self.polite_delay()
+            response = fetch_continuation(token, config, MOBILE_USER_AGENT, base_url=self.YOUTUBE_BASE_URL,
+                                          session=session)
+            page_bytes += len(response.content)
+            more_items, token = find_search_items(response.json())
+            items.extend(more_items)
+            pages += 1
+            self.save_snapshot('youtube', keyword, response.text, url=response.url, page=pages,
+                               kind='json', source='json')
+            print(f"  [다음 페이지 {pages}회] {len(more_items)}개 아이템")
+        
+        started = time.perf_counter()
+        results = self._parse_search_items(items, max_regular, max_shorts_shelves, shorts_per_shelf)
+        self.stats.update({
+            'extractor': 'json',
+            'scrolls': pages,
+            'page_bytes': page_bytes,
+            'serialize_seconds': 0,
+            'parse_seconds': round(parse_seconds + time.perf_counter() - started, 3),
+        })
+        print(f"[유튜브 크롤링] 응답 {page_bytes / 1024:.0f}KB, 파싱 {self.stats['parse_seconds']}초")
+        return results
+    
+    def parse_snapshot(self, records, max_regular=15, max_shorts_shelves=2, shorts_per_shelf=5):
+        """
+        저장된 스냅샷(같은 run)으로 다시 파싱 (replay_snapshots.py)
+        DOM 방식: 스크롤 후 페이지 1개, JSON 방식: 첫 페이지 HTML + continuation JSON
+        """
+        records = sorted(records, key=lambda record: record['page'])
+        dom_pages = [record for record in records if record.get('source') == 'dom']
+        if dom_pages:
+            return self.parse_page(dom_pages[-1]['content'], max_regular, max_shorts_shelves, shorts_per_shelf)
+        
+        items = []
+        for record in records:
+            if record['kind'] == 'html':
+                data = extract_initial_data(record['content'])
+            else:
+                data = json.loads(record['content'])
+            items.extend(find_search_items(data or {})[0])
+        return self._parse_search_items(items, max_regular, max_shorts_shelves, shorts_per_shelf)
+    
+    def parse_initial_data(self, data, max_regular=15, max_shorts_shelves=2, shorts_per_shelf=5):
+        """ytInitialData(dict)에서 검색 결과 추출 (JSON 방식, parse_page와 같은 결과 형식)"""
+        items, _ = find_search_items(data)
+        return self._parse_search_items(items, max_regular, max_shorts_shelves, shorts_per_shelf)
+    
+    def _parse_search_items(self, items, max_regular, max_shorts_shelves, shorts_per_shelf):
+        """검색 결과 렌더러 목록을 화면 순서대로 순서 맵으로 만든 뒤 조립"""
+        order_map = []
+        for item in items:
+            for name, renderer in item.items():
+                if name in self.JSON_VIDEO_RENDERERS:
+                    order_map.append(('video', renderer))
+                elif name in self.JSON_SHELF_RENDERERS:
+                    order_map.append(('reel', renderer))
+        print(f"[1단계 완료] 총 {len(order_map)}개 요소 발견 (일반/Shorts 합계)")
+        
+        return self._assemble(order_map, self._parse_video_json, self._parse_shorts_shelf_json,
+                              max_regular, max_shorts_shelves, shorts_per_shelf)
+    
+    def _count_json_items(self, items):
+        """JSON 아이템 중 일반 영상 수, Shorts 구간 수"""
+        video_count = sum(1 for item in items if any(name in self.JSON_VIDEO_RENDERERS for name in item))
+        shorts_count = sum(1 for item in items if any(name in self.JSON_SHELF_RENDERERS for name in item))
+        return video_count, shorts_count
+    
+    def _parse_video_json(self, renderer, processed_video_ids):
+        """일반 영상 파싱 (videoWithContextRenderer / videoRenderer)"""
+        video_id = renderer.get('videoId')
+        if not video_id or video_id in processed_video_ids:
+            return None
+        
+        title = _json_text(renderer.get('headline') or renderer.get('title'))
+        if not title:
+            return None
+        
+        thumbnails = renderer.get('thumbnail', {}).get('thumbnails', [])
+        thumbnail = thumbnails[-1].get('url', '') if thumbnails else ''
+        
+        channel_name = _json_text(renderer.get('shortBylineText') or renderer.get('ownerText') or renderer.get('longBylineText'))
+        
+        view_text = _json_text(renderer.get('shortViewCountText') or renderer.get('viewCountText'))
+        view_count = view_text.replace('조회수 ', '').replace('조회수', '').strip()
+        view_count_numeric = self._parse_view_count(view_text) if view_text else 0
+        
+        upload_date = _json_text(renderer.get('publishedTimeText'))
+        
+        processed_video_ids.add(video_id)
+        
+        return {
+            'title': title,
+            'url': f"https://www.youtube.com/watch?v={video_id}",
+            'video_id': video_id,
+            'thumbnail': thumbnail,
+            'channel_name': channel_name,
+            'view_count': view_count,
+            'view_count_numeric': view_count_numeric,
+            'upload_date': upload_date,
+            'upload_timestamp': None,  # _assemble에서 한 번에 변환
+            'like_count': '',
+            'duration': _json_text(renderer.get('lengthText')),
+            'position': 0,
+            'is_short': False,
+            'short_shelf_index': None,
+            'position_in_shelf': None
+        }
+    
+    def _parse_shorts_shelf_json(self, shelf, processed_video_ids, shorts_per_shelf):
+        """Shorts 구간 파싱 (reelShelfRenderer / gridShelfViewModel)"""
+        shelf_data = []
+        
+        entries = shelf.get('items') or shelf.get('contents') or []
+        lockups = [entry['shortsLockupViewModel'] for entry in entries if 'shortsLockupViewModel' in entry]
+        if not lockups:
+            print(f"    [경고] Shorts 아이템을 찾을 수 없습니다.")
+            return []
+        
+        for lockup in lockups[:shorts_per_shelf]:
+            command = lockup.get('onTap', {}).get('innertubeCommand', {})
+            video_id = command.get('reelWatchEndpoint', {}).get('videoId')
+            if not video_id:
+                entity_id = lockup.get('entityId', '')
+                video_id = entity_id.rsplit('-', 1)[-1] if entity_id.startswith('shorts-shelf-item-') else None
+            if not video_id or video_id in processed_video_ids:
+                continue
             
-            print(f"[2단계 완료] 일반 {len(videos)}개, Shorts 구간 {len(shorts_shelves)}개")
+            metadata = lockup.get('overlayMetadata', {})
+            title = metadata.get('primaryText', {}).get('content', '')
+            if not title:
+                continue
             
-            # 3단계: 순서대로 조립
-            print("[3단계] 결과 조립 중...")
-            video_idx = 0
-            reel_idx = 0
-            overall_position = 1
+            view_text = metadata.get('secondaryText', {}).get('content', '')
+            view_count = view_text.replace('조회수 ', '').replace('조회수', '').strip()
+            view_count_numeric = self._parse_view_count(view_text) if view_text else 0
             
-            for item_type, _ in order_map:
-                if item_type == 'video' and video_idx < len(videos):
-                    video = videos[video_idx]
-                    video['position'] = overall_position
-                    results.append(video)
-                    overall_position += 1
-                    video_idx += 1
-                    
-                elif item_type == 'reel' and reel_idx < len(shorts_shelves):
-                    shelf = shorts_shelves[reel_idx]
-                    reel_idx += 1
-                    
-                    for position_in_shelf, short in enumerate(shelf, 1):
-                        short['position'] = overall_position
-                        short['short_shelf_index'] = reel_idx
-                        short['position_in_shelf'] = position_in_shelf
-                        results.append(short)
-                        overall_position += 1
+            short_url = command.get('commandMetadata', {}).get('webCommandMetadata', {}).get('url') or f"/shorts/{video_id}"
+            sources = lockup.get('thumbnail', {}).get('sources', [])
             
-            print(f"[3단계 완료] 총 {len(results)}개 결과 조립")
-            print(f"[유튜브 크롤링 완료] 일반 {video_idx}개 + Shorts {sum(len(s) for s in shorts_shelves)}개 = 총 {len(results)}개")
+            processed_video_ids.add(video_id)
             
-        except Exception as e:
-            print(f"[유튜브 크롤링 오류] {e}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            pass  # 드라이버를 유지하여 연속 크롤링 가능
+            shelf_data.append({
+                'title': title,
+                'url': f"https://www.youtube.com{short_url}",
+                'video_id': video_id,
+                'thumbnail': sources[0].get('url', '') if sources else '',
+                'channel_name': '',
+                'view_count': view_count,
+                'view_count_numeric': view_count_numeric,
+                'upload_date': '',
+                'upload_timestamp': None,
+                'like_count': '',
+                'duration': '',
+                'position': 0,
+                'is_short': True,
+                'short_shelf_index': 0,
+                'position_in_shelf': 0
+            })
         
-        return results
+        return shelf_data
     
     def _extract_video_id(self, element):
         """비디오 ID 추출"""
@@ -610,51 +1037,12 @@ class YouTubeMobileCrawler(MobileCrawler):
         return None
     
     def _parse_view_count(self, text):
-        """조회수 텍스트를 숫자로 변환"""
-        try:
-            # "조회수 1.5천회" -> 1500
-            text = text.replace('조회수', '').replace('회', '').strip()
-            
-            if '만' in text:
-                num = float(text.replace('만', ''))
-                return int(num * 10000)
-            elif '천' in text:
-                num = float(text.replace('천', ''))
-                return int(num * 1000)
-            else:
-                return int(re.sub(r'[^\d]', '', text))
-        except:
-            return 0
+        """조회수 텍스트를 숫자로 변환 (숫자가 없으면 0, 정렬용)"""
+        return parse_view_count(text) or 0
     
     def _parse_upload_date(self, text):
-        """업로드 날짜 텍스트를 datetime으로 변환"""
-        try:
-            now = datetime.now()
-            
-            # "3일 전", "2주 전", "1개월 전", "1년 전" 등
-            if '초 전' in text or 'second' in text.lower():
-                return now
-            elif '분 전' in text or 'minute' in text.lower():
-                minutes = int(re.search(r'\d+', text).group())
-                return now - timedelta(minutes=minutes)
-            elif '시간 전' in text or 'hour' in text.lower():
-                hours = int(re.search(r'\d+', text).group())
-                return now - timedelta(hours=hours)
-            elif '일 전' in text or 'day' in text.lower():
-                days = int(re.search(r'\d+', text).group())
-                return now - timedelta(days=days)
-            elif '주 전' in text or 'week' in text.lower():
-                weeks = int(re.search(r'\d+', text).group())
-                return now - timedelta(weeks=weeks)
-            elif '개월 전' in text or 'month' in text.lower():
-                months = int(re.search(r'\d+', text).group())
-                return now - timedelta(days=months*30)
-            elif '년 전' in text or 'year' in text.lower():
-                years = int(re.search(r'\d+', text).group())
-                return now - timedelta(days=years*365)
-        except:
-            pass
-        return None
+        """업로드 날짜 텍스트를 datetime으로 변환 (변환할 수 없으면 None)"""
+        return parse_relative_time(text)
     
     def _parse_video(self, element, processed_video_ids):
         """일반 영상 파싱"""
@@ -684,7 +1072,6 @@ class YouTubeMobileCrawler(MobileCrawler):
         view_count = ''
         view_count_numeric = 0
         upload_date = ''
-        upload_timestamp = None
         
         attributed_spans = element.find_all('span', class_='yt-core-attributed-string')
         for span in attributed_spans:
@@ -697,7 +1084,6 @@ class YouTubeMobileCrawler(MobileCrawler):
                 view_count_numeric = self._parse_view_count(view_text)
             elif span.get('role') == 'text' and '전' in text:
                 upload_date = text
-                upload_timestamp = self._parse_upload_date(text)
         
         duration_elem = element.find(['span'], class_=re.compile(r'(time-status|duration)'))
         duration = duration_elem.get_text(strip=True) if duration_elem else ''
@@ -713,7 +1099,7 @@ class YouTubeMobileCrawler(MobileCrawler):
             'view_count': view_count,
             'view_count_numeric': view_count_numeric,
             'upload_date': upload_date,
-            'upload_timestamp': upload_timestamp,
+            'upload_timestamp': None,  # _assemble에서 한 번에 변환
             'like_count': '',
             'duration': duration,
             'position': 0,
@@ -735,7 +1121,8 @@ class YouTubeMobileCrawler(MobileCrawler):
             print(f"    [경고] Shorts 아이템을 찾을 수 없습니다. element: {element.name}")
             return []
         
-        print(f"    [디버그] {len(shorts_in_shelf)}개 Shorts 발견 (최대 {shorts_per_shelf}개 수집)")
+        if self.ITEM_LOGS:
+            print(f"    [디버그] {len(shorts_in_shelf)}개 Shorts 발견 (최대 {shorts_per_shelf}개 수집)")
         
         for short in shorts_in_shelf[:shorts_per_shelf]:
             try:
@@ -793,14 +1180,12 @@ class YouTubeMobileCrawler(MobileCrawler):
                 
                 # 업로드 날짜 추출 (외부 메타데이터)
                 upload_date = ''
-                upload_timestamp = None
                 if outside_metadata:
                     date_div = outside_metadata.find('div', class_='shortsLockupViewModelHostOutsideMetadataSubhead')
                     if date_div:
                         date_span = date_div.find('span', class_='yt-core-attributed-string')
                         if date_span:
                             upload_date = date_span.get_text(strip=True)
-                            upload_timestamp = self._parse_upload_date(upload_date)
                 
                 processed_video_ids.add(video_id)
                 
@@ -813,7 +1198,7 @@ class YouTubeMobileCrawler(MobileCrawler):
                     'view_count': view_count,
                     'view_count_numeric': view_count_numeric,
                     'upload_date': upload_date,
-                    'upload_timestamp': upload_timestamp,
+                    'upload_timestamp': None,  # _assemble에서 한 번에 변환
                     'like_count': '',
                     'duration': '',
                     'position': 0,
@@ -829,25 +1214,117 @@ class YouTubeMobileCrawler(MobileCrawler):
         return shelf_data
 
 
-def crawl_all(keyword):
-    """구글과 유튜브를 동시에 크롤링"""
+CRAWLERS = {
+    'google': GoogleMobileCrawler,
+    'youtube': YouTubeMobileCrawler,
+}
+
+# 유튜브 수집 개수 (일반 15개 + Shorts 2구간x5개)
+YOUTUBE_OPTIONS = {'max_regular': 15, 'max_shorts_shelves': 2, 'shorts_per_shelf': 5}
+
+
+def run_engine(engine, keyword, driver=None):
+    """
+    검색 엔진 하나 크롤링
+    
+    Args:
+        engine: 'google' 또는 'youtube'
+        keyword: 검색 키워드
+        driver: 재사용할 드라이버 또는 드라이버를 돌려주는 함수 (없으면 새로 띄우고 끝나면 종료)
+        
+    Returns:
+        dict: {'results': 결과 리스트, 'stats': 크롤러 통계}
+    """
+    crawler = CRAWLERS[engine](driver=driver)
+    if engine == 'youtube':
+        results = crawler.crawl(keyword, **YOUTUBE_OPTIONS)
+    else:
+        results = crawler.crawl(keyword)
+    return {'results': results, 'stats': crawler.stats}
+
+
+ENGINE_TIMEOUT = 180  # 동시 모드에서 엔진 하나의 최대 대기 시간 (초)
+
+
+def _run_timed(runner, engine, keyword):
+    """엔진 실행 + 소요 시간 측정"""
+    started = time.time()
+    output = runner(engine, keyword)
+    output['elapsed'] = round(time.time() - started, 2)
+    return output
+
+
+def crawl_all(keyword, runner=run_engine, concurrent=False, engine_timeout=ENGINE_TIMEOUT):
+    """
+    구글과 유튜브를 동시에 크롤링
+    
+    Args:
+        keyword: 검색 키워드
+        runner: 엔진별 실행 함수 (기본: 현재 프로세스에서 실행,
+                crawler_worker.run_engine: 워커 프로세스의 상주 브라우저에서 실행)
+        concurrent: True면 두 엔진을 각자의 브라우저에서 병렬 실행
+        engine_timeout: 동시 모드에서 엔진별 최대 대기 시간 (초)
+        
+    Returns:
+        dict: {'google': [...], 'youtube': [...],
+               'timings': {엔진: 초}, 'errors': {엔진: 오류 메시지},
+               'stats': {엔진: 크롤러 통계 (전송 바이트, 파싱 시간 등)}}
+        한 엔진이 실패해도 나머지 엔진 결과는 그대로 반환
+    """
     results = {
         'google': [],
-        'youtube': []
+        'youtube': [],
+        'timings': {},
+        'errors': {},
+        'stats': {}
     }
+    engines = ['google', 'youtube']
     
-    # 구글 크롤링 (화면에 보이는 만큼만)
-    print(f"\n{'='*50}")
-    print(f"구글 검색 시작: {keyword}")
-    print(f"{'='*50}")
-    google_crawler = GoogleMobileCrawler()
-    results['google'] = google_crawler.crawl(keyword)
-    
-    # 유튜브 크롤링 (일반 15개 + Shorts 2구간x5개)
-    print(f"\n{'='*50}")
-    print(f"유튜브 검색 시작: {keyword}")
-    print(f"{'='*50}")
-    youtube_crawler = YouTubeMobileCrawler()
-    results['youtube'] = youtube_crawler.crawl(keyword, max_regular=15, max_shorts_shelves=2, shorts_per_shelf=5)
+    if concurrent:
+        print(f"\n{'='*50}")
+        print(f"구글/유튜브 동시 검색 시작: {keyword}")
+        print(f"{'='*50}")
+        
+        started = time.time()
+        executor = ThreadPoolExecutor(max_workers=len(engines), thread_name_prefix='crawl')
+        # 엔진 스레드도 호출한 쪽의 컨텍스트(크롤링별 로그 등)를 이어받도록 엔진마다 복사해서 실행
+        futures = {engine: executor.submit(contextvars.copy_context().run, _run_timed, runner, engine, keyword)
+                   for engine in engines}
+        try:
+            for engine, future in futures.items():
+                # 엔진별 타임아웃은 동시에 시작했으므로 전체 경과 시간 기준
+                remaining = max(0, engine_timeout - (time.time() - started))
+                try:
+                    output = future.result(timeout=remaining)
+                    results[engine] = output['results']
+                    results['stats'][engine] = output.get('stats', {})
+                    results['timings'][engine] = output['elapsed']
+                except FutureTimeoutError:
+                    results['timings'][engine] = round(time.time() - started, 2)
+                    results['errors'][engine] = f'시간 초과 ({engine_timeout}초)'
+                    print(f"[{engine}] 시간 초과 ({engine_timeout}초), 부분 결과로 진행")
+                except Exception as e:
+                    results['timings'][engine] = round(time.time() - started, 2)
+                    results['errors'][engine] = str(e)
+                    print(f"[{engine}] 크롤링 실패: {e}")
+        finally:
+            # 시간 초과된 엔진은 기다리지 않음 (브라우저는 해당 스레드가 정리)
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+    
+    titles = {'google': '구글', 'youtube': '유튜브'}
+    for engine in engines:
+        print(f"\n{'='*50}")
+        print(f"{titles[engine]} 검색 시작: {keyword}")
+        print(f"{'='*50}")
+        started = time.time()
+        try:
+            output = _run_timed(runner, engine, keyword)
+            results[engine] = output['results']
+            results['stats'][engine] = output.get('stats', {})
+        except Exception as e:
+            results['errors'][engine] = str(e)
+            print(f"[{engine}] 크롤링 실패: {e}")
+        results['timings'][engine] = round(time.time() - started, 2)
     
     return results
@@ -0,0 +1,331 @@
+"""
+크롤러 워커 프로세스
+
+모바일 Chrome 브라우저를 미리 띄워둔 별도 프로세스가 로컬 IPC로 크롤링 작업을 받아
+파싱된 결과를 돌려준다. 검색할 때마다 Chrome을 새로 띄우지 않고, 웹 서버가 종료되거나
+워커가 죽어도 브라우저 프로세스가 쌓이지 않도록 수명을 관리한다.
+"""
+import atexit
+import io
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from multiprocessing.connection import Client, Listener
+
+# 워커 설정 (환경변수로 조정)
+WORKER_BROWSERS = int(os.getenv('CRAWLER_WORKER_BROWSERS', '2'))  # 동시 크롤링 수 = 상주 브라우저 수
+WORKER_MAX_JOBS_PER_BROWSER = int(os.getenv('CRAWLER_WORKER_MAX_JOBS', '20'))  # N회 작업 후 브라우저 재생성
+WORKER_JOB_TIMEOUT = int(os.getenv('CRAWLER_WORKER_JOB_TIMEOUT', '300'))  # 작업 하나의 최대 대기 시간 (초)
+WORKER_STARTUP_TIMEOUT = 30
+SUPERVISOR_INTERVAL = 5
+
+
+# ============================================================================
+# 워커 프로세스 내부
+# ============================================================================
+
+class _ThreadOutput:
+    """스레드별 출력 캡처 (동시에 실행되는 작업의 로그가 섞이지 않도록)"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer):
+        self._local.buffer = buffer
+
+    def release(self):
+        self._local.buffer = None
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        buffer = getattr(self._local, 'buffer', None)
+        (buffer or self._stream).flush()
+
+
+class _BrowserSlot:
+    """워커가 상주시키는 모바일 브라우저 하나"""
+
+    def __init__(self, index):
+        self.index = index
+        self.driver = None
+        self.jobs = 0
+
+    def ensure(self):
+        """브라우저가 없으면 새로 띄움 (크롤러가 브라우저 방식으로 전환할 때 호출)"""
+        if self.driver is None:
+            from crawler import create_mobile_driver
+            started = time.time()
+            self.driver = create_mobile_driver()
+            self.jobs = 0
+            print(f"[워커] 브라우저 {self.index} 준비 완료 ({time.time() - started:.1f}초)")
+        return self.driver
+
+    def is_healthy(self):
+        try:
+            self.driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def after_job(self, max_jobs):
+        """작업 후 정리: 고장났거나 N회 사용한 브라우저는 폐기"""
+        if self.driver is None:
+            return
+        if not self.is_healthy() or (max_jobs and self.jobs >= max_jobs):
+            self.close()
+            return
+        try:
+            self.driver.get('about:blank')
+        except Exception:
+            self.close()
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+
+def _needs_browser():
+    """기본 방식이 브라우저인 엔진이 있는지 (없으면 HTTP/JSON 방식이 실패할 때만 브라우저를 띄움)"""
+    from crawler import GoogleMobileCrawler, YouTubeMobileCrawler
+    return GoogleMobileCrawler.FETCHER != 'http' or YouTubeMobileCrawler.EXTRACTOR != 'json'
+
+
+def _warm_slot(slot, slots):
+    try:
+        slot.ensure()
+    except Exception as e:
+        print(f"[워커] 브라우저 {slot.index} 예열 실패: {e}")
+    slots.put(slot)
+
+
+def _handle_crawl(message, slots, max_jobs):
+    from crawler import run_engine
+
+    # 빈 브라우저가 생길 때까지 대기 (동시 실행 수 제한)
+    slot = slots.get()
+    buffer = io.StringIO()
+    sys.stdout.capture(buffer)
+    sys.stderr.capture(buffer)
+    try:
+        result = run_engine(message['engine'], message['keyword'], driver=slot.ensure)
+        if slot.driver is not None:
+            slot.jobs += 1
+        reply = {'ok': True, 'results': result['results'], 'stats': result['stats']}
+    except Exception as e:
+        traceback.print_exc()
+        slot.close()
+        reply = {'ok': False, 'error': str(e)}
+    finally:
+        sys.stdout.release()
+        sys.stderr.release()
+        slot.after_job(max_jobs)
+        slots.put(slot)
+
+    reply['logs'] = [line for line in buffer.getvalue().split('\n') if line.strip()]
+    return reply
+
+
+def _handle_connection(conn, slots, stop, max_jobs, address, authkey):
+    try:
+        message = conn.recv()
+        if message['type'] == 'ping':
+            conn.send({'ok': True, 'pid': os.getpid(), 'idle_browsers': slots.qsize()})
+        elif message['type'] == 'shutdown':
+            conn.send({'ok': True})
+            stop.set()
+            # accept() 대기 중인 메인 루프를 깨움
+            Client(address, authkey=authkey).close()
+        elif message['type'] == 'crawl':
+            conn.send(_handle_crawl(message, slots, max_jobs))
+    except (EOFError, OSError):
+        pass
+    finally:
+        conn.close()
+
+
+def _worker_main(ready_conn, authkey, browsers, max_jobs):
+    """워커 프로세스 진입점"""
+    sys.stdout = _ThreadOutput(sys.stdout)
+    sys.stderr = _ThreadOutput(sys.stderr)
+
+    slots = queue.Queue()
+    all_slots = [_BrowserSlot(i) for i in range(browsers)]
+    warm = _needs_browser()
+    for slot in all_slots:
+        if warm:
+            threading.Thread(target=_warm_slot, args=(slot, slots), daemon=True).start()
+        else:
+            slots.put(slot)
+
+    listener = Listener(('127.0.0.1', 0), authkey=authkey)
+    ready_conn.send(listener.address)
+    ready_conn.close()
+    print(f"[워커] 시작 (pid {os.getpid()}, 브라우저 {browsers}개, 주소 {listener.address})")
+
+    stop = threading.Event()
+    try:
+        while not stop.is_set():
+            try:
+                conn = listener.accept()
+            except Exception:
+                continue
+            if stop.is_set():
+                conn.close()
+                break
+            threading.Thread(
+                target=_handle_connection,
+                args=(conn, slots, stop, max_jobs, listener.address, authkey),
+                daemon=True
+            ).start()
+    finally:
+        listener.close()
+        for slot in all_slots:
+            slot.close()
+        print("[워커] 종료")
+
+
+# ============================================================================
+# 웹 서버 쪽 (워커 관리 및 작업 제출)
+# ============================================================================
+
+class CrawlerWorker:
+    """워커 프로세스 수명 관리 (지연 시작, 종료, 비정상 종료 시 재시작)"""
+
+    def __init__(self, browsers=WORKER_BROWSERS, max_jobs_per_browser=WORKER_MAX_JOBS_PER_BROWSER,
+                 job_timeout=WORKER_JOB_TIMEOUT):
+        self.browsers = browsers
+        self.max_jobs_per_browser = max_jobs_per_browser
+        self.job_timeout = job_timeout
+        self.restarts = 0
+        self._authkey = os.urandom(16)
+        self._process = None
+        self._address = None
+        self._lock = threading.Lock()
+        self._stopping = False
+        self._supervisor = None
+
+    def is_alive(self):
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        """워커 프로세스 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self.is_alive():
+                return
+            self._stopping = False
+
+            ctx = multiprocessing.get_context('spawn')
+            ready_recv, ready_send = ctx.Pipe(duplex=False)
+            process = ctx.Process(
+                target=_worker_main,
+                args=(ready_send, self._authkey, self.browsers, self.max_jobs_per_browser),
+                name='crawler-worker',
+                daemon=True
+            )
+            process.start()
+            ready_send.close()
+
+            if not ready_recv.poll(WORKER_STARTUP_TIMEOUT):
+                process.terminate()
+                raise RuntimeError('크롤러 워커 시작 시간 초과')
+            self._address = ready_recv.recv()
+            ready_recv.close()
+            self._process = process
+
+            if self._supervisor is None or not self._supervisor.is_alive():
+                self._supervisor = threading.Thread(target=self._supervise, daemon=True)
+                self._supervisor.start()
+
+    def stop(self, timeout=10):
+        """워커 종료 (브라우저 정리 후 종료, 응답 없으면 강제 종료)"""
+        self._stopping = True
+        process = self._process
+        if process is None or not process.is_alive():
+            return
+        try:
+            with Client(self._address, authkey=self._authkey) as conn:
+                conn.send({'type': 'shutdown'})
+                conn.poll(timeout)
+        except Exception:
+            pass
+        process.join(timeout)
+        if process.is_alive():
+            process.terminate()
+            process.join(timeout)
+
+    def ping(self):
+        """워커 상태 확인"""
+        if not self.is_alive():
+            return {'ok': False}
+        with Client(self._address, authkey=self._authkey) as conn:
+            conn.send({'type': 'ping'})
+            return conn.recv()
+
+    def run_engine(self, engine, keyword):
+        """
+        워커에서 검색 엔진 하나 크롤링 (crawler.run_engine과 같은 반환 형식)
+        워커 로그는 현재 스레드의 stdout으로 출력
+        """
+        for attempt in range(2):
+            self.start()
+            process = self._process
+            try:
+                with Client(self._address, authkey=self._authkey) as conn:
+                    conn.send({'type': 'crawl', 'engine': engine, 'keyword': keyword})
+                    if not conn.poll(self.job_timeout):
+                        raise TimeoutError(f'크롤러 워커 응답 시간 초과 ({self.job_timeout}초)')
+                    reply = conn.recv()
+            except TimeoutError:
+                # 워커는 살아 있고 작업이 아직 브라우저를 쓰는 중이므로 다시 보내지 않음
+                # (TimeoutError는 OSError의 하위 클래스라 아래보다 먼저 처리)
+                raise
+            except (EOFError, ConnectionError, OSError) as e:
+                print(f"[워커] 연결 오류: {e}")
+                # 연결이 끊긴 직후에는 아직 종료 중일 수 있으므로 잠시 기다려 확인
+                process.join(1)
+                if attempt or process.is_alive():
+                    raise
+                # 워커가 작업 중 죽은 경우만 재시작 후 한 번 더 시도
+                self._restart_if_dead()
+                continue
+
+            for line in reply.get('logs', []):
+                print(line)
+            if not reply['ok']:
+                raise RuntimeError(reply['error'])
+            return {'results': reply['results'], 'stats': reply['stats']}
+
+    def _restart_if_dead(self):
+        with self._lock:
+            if self._stopping or self._process is None or self._process.is_alive():
+                return
+            print(f"[워커] 비정상 종료 감지 (exit code {self._process.exitcode}), 재시작합니다")
+            self._process = None
+            self.restarts += 1
+        self.start()
+
+    def _supervise(self):
+        """워커가 죽으면 자동 재시작"""
+        while not self._stopping:
+            time.sleep(SUPERVISOR_INTERVAL)
+            try:
+                self._restart_if_dead()
+            except Exception as e:
+                print(f"[워커] 재시작 실패: {e}")
+
+
+# 웹 서버 프로세스 전역 워커 (첫 작업 제출 시 시작)
+crawler_worker = CrawlerWorker()
+atexit.register(crawler_worker.stop)
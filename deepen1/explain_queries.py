@@ -0,0 +1,146 @@
+"""API 쿼리 실행 계획 확인 - 각 쿼리의 EXPLAIN QUERY PLAN과 실행 시간 출력
+
+인덱스(models.py, add_indexes.py)를 타는지 확인한다. 인덱스 없이 테이블 전체를 읽거나(SCAN)
+정렬용 임시 B-트리를 만들면(USE TEMP B-TREE) 경고로 표시한다.
+
+    python explain_queries.py                            # 현재 database.db
+    python explain_queries.py --seed 1000000             # 임시 DB에 결과 100만 건씩 넣고 확인
+    python explain_queries.py --seed 1000000 --no-index  # 인덱스 없는 경우와 비교
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask
+from sqlalchemy import func, select
+
+from models import db, SearchHistory, GoogleResult, YouTubeResult
+from result_query import (ResultFilters, encode_cursor, google_query, page_query, youtube_query,
+                          history_query, HISTORY_SORT)
+from sqlite_tuning import install as install_sqlite_pragmas
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PAGE_SIZE = 50  # limit을 준 /api/results 한 페이지
+
+
+def api_queries(search_id):
+    """(이름, 쿼리) 목록 - 라우트가 실행하는 쿼리 (result_query.py)"""
+    def youtube(sort_by='', **filters):
+        filters = ResultFilters(sort_by=sort_by, **filters)
+        return youtube_query(search_id, filters), filters.youtube_sort
+
+    page = ResultFilters(limit=PAGE_SIZE)
+    date_range = {'date_from': datetime(2025, 1, 1), 'date_to': datetime(2025, 6, 30)}
+    queries = [
+        ('/api/history 첫 페이지 (결과 수 포함)', page_query(history_query(), HISTORY_SORT, PAGE_SIZE + 1)),
+        ('구글 결과 (순위순)', page_query(google_query(search_id, page), page.google_sort)),
+        ('유튜브 결과 (순위순)', page_query(*youtube())),
+    ]
+    for sort_by in ('view_desc', 'view_asc', 'date_desc'):
+        queries.append((f'유튜브 {sort_by} 첫 페이지', page_query(*youtube(sort_by), PAGE_SIZE + 1)))
+    query, sort = youtube('view_desc')
+    cursor = encode_cursor(sort[0], 5_000_000, 1)
+    queries.append(('유튜브 view_desc 다음 페이지 (커서)', page_query(query, sort, PAGE_SIZE + 1, cursor)))
+    queries.append(('유튜브 날짜 범위', page_query(*youtube('date_asc', **date_range))))
+    queries.append(('유튜브 키워드 (전체 수)', select(func.count()).select_from(
+        youtube(keyword='영상 1')[0].subquery())))
+    return queries
+
+
+def explain(conn, stmt):
+    """(실행 계획 줄 목록, 실행 시간 초)"""
+    compiled = stmt.compile(dialect=conn.dialect)
+    params = tuple(_plain(compiled.params[name]) for name in compiled.positiontup)
+    sql = str(compiled)
+    plan = [row[3] for row in conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + sql, params)]
+    started = time.perf_counter()
+    conn.exec_driver_sql(sql, params).fetchall()
+    return plan, time.perf_counter() - started
+
+
+def _plain(value):
+    # exec_driver_sql은 SQLAlchemy 타입 변환을 거치지 않으므로 날짜는 DB에 저장된 문자열 형식으로
+    return value.strftime('%Y-%m-%d %H:%M:%S.%f') if isinstance(value, datetime) else value
+
+
+def is_slow_plan(line):
+    """인덱스 없이 전체를 읽거나 정렬용 임시 B-트리를 만드는 단계"""
+    return ('SCAN' in line and 'INDEX' not in line) or 'TEMP B-TREE' in line
+
+
+def seed(rows, searches):
+    """검색 searches개에 구글/유튜브 결과를 rows건씩 나눠 저장"""
+    started = time.perf_counter()
+    base = datetime(2025, 1, 1)
+    search_table = SearchHistory.__table__
+    db.session.execute(search_table.insert(), [
+        {'keyword': f'키워드 {i}', 'search_date': base + timedelta(minutes=i)} for i in range(searches)])
+    per_search = max(1, rows // searches)
+    chunk = 50000
+    for start in range(0, rows, chunk):
+        count = min(chunk, rows - start)
+        db.session.execute(GoogleResult.__table__.insert(), [{
+            'search_id': (i // per_search) % searches + 1, 'title': f'결과 {i}', 'url': f'https://example.com/{i}',
+            'snippet': '브랜드 신제품 출시 소식', 'position': i % per_search + 1,
+        } for i in range(start, start + count)])
+        db.session.execute(YouTubeResult.__table__.insert(), [{
+            'search_id': (i // per_search) % searches + 1, 'title': f'영상 {i}', 'url': f'https://m.youtube.com/watch?v={i}',
+            'channel_name': '예시 채널', 'view_count_numeric': random.randint(0, 10_000_000),
+            'upload_timestamp': base + timedelta(hours=random.randint(0, 24 * 365)), 'position': i % per_search + 1,
+        } for i in range(start, start + count)])
+    db.session.commit()
+    print(f"임시 DB 생성: 검색 {searches:,}개, 구글/유튜브 결과 {rows:,}건씩 ({time.perf_counter() - started:.1f}초)\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='API 쿼리 실행 계획 확인')
+    parser.add_argument('--db', default=os.path.join(BASE_DIR, 'database.db'), help='확인할 DB 파일')
+    parser.add_argument('--seed', type=int, default=0, help='임시 DB에 엔진별 결과 N건을 넣고 확인')
+    parser.add_argument('--searches', type=int, default=1000, help='--seed 시 검색 기록 수')
+    parser.add_argument('--no-index', action='store_true', help='--seed 시 인덱스 없이 (비교용)')
+    parser.add_argument('--search-id', type=int, help='확인할 검색 ID (기본: 결과가 가장 많은 검색)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'explain.db') if args.seed else args.db
+        if not os.path.exists(path) and not args.seed:
+            parser.error(f'DB 파일이 없습니다: {path}')
+
+        explain_app = Flask(__name__)
+        explain_app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + path
+        db.init_app(explain_app)
+        with explain_app.app_context():
+            install_sqlite_pragmas(db.engine)
+            if args.seed:
+                if args.no_index:
+                    for table in db.metadata.sorted_tables:
+                        table.indexes.clear()
+                db.create_all()
+                seed(args.seed, args.searches)
+                with db.engine.connect() as conn:
+                    conn.exec_driver_sql('ANALYZE')
+                    conn.commit()
+
+            search_id = args.search_id or db.session.execute(
+                select(YouTubeResult.search_id).group_by(YouTubeResult.search_id)
+                .order_by(func.count().desc()).limit(1)).scalar() or 1
+
+            slow = 0
+            with db.engine.connect() as conn:
+                for name, stmt in api_queries(search_id):
+                    plan, elapsed = explain(conn, stmt)
+                    print(f"[{name}] {elapsed * 1000:.2f}ms")
+                    for line in plan:
+                        warning = is_slow_plan(line)
+                        slow += warning
+                        print(f"    {'⚠ ' if warning else ''}{line}")
+            db.engine.dispose()
+
+    print(f"\n검색 ID {search_id} 기준, 인덱스를 타지 않는 단계 {slow}개")
+
+
+if __name__ == '__main__':
+    main()
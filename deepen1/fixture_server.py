@@ -0,0 +1,195 @@
+"""
+로컬 픽스처 서버 - 구글 모바일 검색/유튜브 검색 응답을 흉내 내는 HTTP 서버
+
+실제 구글/유튜브 없이 크롤러를 끝까지 실행해 지연 시간/처리량을 재현 가능하게 측정한다.
+저장된 페이지(fixtures/google_mobile.html, youtube_mobile.html)를 돌려주고,
+응답 지연과 오류 응답을 설정한 비율로 섞을 수 있다.
+
+    python fixture_server.py [--port 8900] [--latency-ms 50] [--jitter-ms 20] [--error-rate 0.05]
+
+크롤러는 환경변수로 이 서버를 가리키게 한다.
+
+    GOOGLE_BASE_URL=http://127.0.0.1:8900 YOUTUBE_BASE_URL=http://127.0.0.1:8900 python app.py
+
+경로:
+    GET  /search               구글 모바일 검색 (start 파라미터로 페이지, --pages 이후는 결과 없는 페이지)
+    GET  /results              유튜브 모바일 검색 (ytInitialData 포함 페이지)
+    POST /youtubei/v1/search   유튜브 continuation (첫 페이지 아이템을 다시 돌려줌, --pages 회까지)
+    GET  /_fixture/stats       경로별 요청 수, 주입한 오류 수
+"""
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from youtube_data import extract_initial_data, find_search_items
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GOOGLE_PAGE = os.path.join(BASE_DIR, 'fixtures', 'google_mobile.html')
+YOUTUBE_PAGE = os.path.join(BASE_DIR, 'youtube_mobile.html')
+
+EMPTY_PAGE = '<!DOCTYPE html><html><head><meta charset="utf-8"></head><body><div id="main"></div></body></html>'
+CONTINUATION_TOKEN = 'fixture-continuation-{}'
+GOOGLE_PAGE_SIZE = 10
+
+
+def _page_links(html, page):
+    """2페이지부터는 결과 링크가 겹치지 않도록 링크 뒤에 페이지 표시를 붙임"""
+    if not page:
+        return html
+    return re.sub(r'(href="[^"]*?https?://[^"&?#]+)', rf'\1-p{page}', html)
+
+
+class FixtureState:
+    """서버 설정 (지연/오류 주입)과 요청 통계 - 요청 처리 스레드끼리 공유"""
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, error_status=503, pages=3, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.pages = pages
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = {}
+        self.errors = 0
+
+        with open(GOOGLE_PAGE, encoding='utf-8') as f:
+            google_page = f.read()
+        self.google_pages = [_page_links(google_page, page).encode('utf-8') for page in range(pages)]
+        with open(YOUTUBE_PAGE, encoding='utf-8') as f:
+            youtube_page = f.read()
+        self.youtube_page = youtube_page.encode('utf-8')
+        items, _ = find_search_items(extract_initial_data(youtube_page) or {})
+        self.youtube_items = items
+
+    def next_response(self, route):
+        """(지연 초, 오류 여부) - 시드가 같으면 같은 순서로 재현"""
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+            delay = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        return delay / 1000, failed
+
+    def continuation(self, index):
+        """continuation 응답 JSON (index번째, 마지막 페이지에는 다음 토큰 없음)"""
+        sections = [{'itemSectionRenderer': {'contents': self.youtube_items}}]
+        if index + 1 < self.pages:
+            sections.append({'continuationItemRenderer': {'continuationEndpoint': {
+                'continuationCommand': {'token': CONTINUATION_TOKEN.format(index + 1)}}}})
+        data = {'onResponseReceivedCommands': [{'appendContinuationItemsAction': {'continuationItems': sections}}]}
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+    def stats(self):
+        with self._lock:
+            return {'requests': dict(self.requests), 'errors': self.errors}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """구글/유튜브 경로별 응답"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == '/_fixture/stats':
+            self._send(200, json.dumps(self.server.state.stats()).encode('utf-8'), 'application/json')
+        elif url.path == '/search':
+            page = int(query.get('start', ['0'])[0]) // GOOGLE_PAGE_SIZE
+            pages = self.server.state.google_pages
+            body = pages[page] if page < len(pages) else EMPTY_PAGE.encode('utf-8')
+            self._respond('google', body, 'text/html; charset=UTF-8')
+        elif url.path == '/results':
+            self._respond('youtube', self.server.state.youtube_page, 'text/html; charset=utf-8')
+        else:
+            self._send(404, b'not found', 'text/plain')
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = self.rfile.read(length) if length else b''
+        if url.path != '/youtubei/v1/search':
+            self._send(404, b'not found', 'text/plain')
+            return
+        try:
+            token = json.loads(payload or b'{}').get('continuation') or ''
+            index = int(token.rsplit('-', 1)[-1])
+        except ValueError:
+            index = 0
+        self._respond('youtube_continuation', self.server.state.continuation(index), 'application/json')
+
+    def _respond(self, route, body, content_type):
+        delay, failed = self.server.state.next_response(route)
+        if delay:
+            time.sleep(delay)
+        if failed:
+            self._send(self.server.state.error_status, b'injected error', 'text/plain')
+        else:
+            self._send(200, body, content_type)
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 출력하지 않음 (벤치마크 출력이 묻힘)
+
+
+def start_server(host='127.0.0.1', port=0, **options):
+    """
+    백그라운드 스레드에서 서버 시작 (벤치마크 스크립트용)
+
+    Args:
+        port: 0이면 빈 포트 자동 선택
+        options: FixtureState 설정 (latency_ms, jitter_ms, error_rate, error_status, pages, seed)
+
+    Returns:
+        tuple: (server, base_url) - 끝나면 server.shutdown()
+    """
+    server = ThreadingHTTPServer((host, port), FixtureHandler)
+    server.daemon_threads = True
+    server.state = FixtureState(**options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='구글/유튜브 로컬 픽스처 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--latency-ms', type=float, default=0, help='응답 지연 (밀리초)')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='지연에 더할 무작위 시간 최대값 (밀리초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    parser.add_argument('--error-status', type=int, default=503, help='오류 응답 상태 코드')
+    parser.add_argument('--pages', type=int, default=3, help='구글 결과 페이지 수 / 유튜브 continuation 수')
+    parser.add_argument('--seed', type=int, default=1, help='지연/오류 난수 시드')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), FixtureHandler)
+    server.daemon_threads = True
+    server.state = FixtureState(args.latency_ms, args.jitter_ms, args.error_rate, args.error_status,
+                                args.pages, args.seed)
+    print(f"[픽스처 서버] http://{args.host}:{args.port} "
+          f"(지연 {args.latency_ms}+{args.jitter_ms}ms, 오류 {args.error_rate:.0%} → {args.error_status})")
+    print(f"  GOOGLE_BASE_URL=http://{args.host}:{args.port} YOUTUBE_BASE_URL=http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+"""
+크롤링 작업 큐 (SQLite crawl_jobs 테이블 + 고정 크기 워커 스레드)
+
+/search 요청은 작업을 crawl_jobs 테이블에 넣기만 하고, 워커 스레드 N개가 우선순위 순서로 꺼내 실행한다.
+동시에 실행되는 크롤링(= 브라우저) 수가 워커 수로 제한되고, 작업 상태가 DB에 남으므로
+서버를 재시작해도 대기 중인 작업은 그대로 실행되고 실행 중이던 작업은 다시 대기열로 돌아간다.
+
+작업 상태: queued → running → done / failed (실패 시 시도 횟수가 남았으면 다시 queued)
+"""
+import json
+import os
+import threading
+import traceback
+import uuid
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+from models import db, CrawlJob
+
+# 작업 큐 설정 (환경변수로 조정)
+JOB_WORKERS = int(os.getenv('CRAWL_JOB_WORKERS', '2'))  # 동시에 실행할 크롤링 수
+JOB_MAX_ATTEMPTS = int(os.getenv('CRAWL_JOB_MAX_ATTEMPTS', '2'))  # 작업 하나의 최대 실행 횟수
+POLL_INTERVAL = 2  # 대기 중인 작업이 없을 때 다시 확인하는 주기 (초)
+ETA_SAMPLE = 20  # 예상 시간 계산에 쓰는 최근 완료 작업 수
+DEFAULT_JOB_SECONDS = 60  # 완료된 작업이 없을 때 가정하는 작업 하나의 소요 시간 (초)
+
+
+class CrawlJobQueue:
+    """DB에 저장되는 크롤링 작업 큐와 워커 스레드 풀"""
+
+    def __init__(self, app, handler, workers=JOB_WORKERS, max_attempts=JOB_MAX_ATTEMPTS, listener=None,
+                 on_idle=None):
+        """
+        Args:
+            app: Flask 앱 (워커 스레드에서 app_context 사용)
+            handler: handler(keyword, crawl_id) -> search_id, 예외를 던지면 실패로 처리
+            workers: 워커 스레드 수
+            max_attempts: 작업 하나의 최대 실행 횟수 (실패/중단 시 재시도)
+            listener: listener(crawl_id, status) - 작업 상태/진행률이 바뀔 때마다 status()의 결과로 호출
+            on_idle: on_idle() - 대기 중인 작업이 없어 POLL_INTERVAL초 기다리기 전에 호출 (메모리 정리 등)
+        """
+        self.app = app
+        self.handler = handler
+        self.listener = listener
+        self.on_idle = on_idle
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self._wakeup = threading.Condition()
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def start(self):
+        """중단된 작업 복구 후 워커 스레드 시작 (이미 시작했으면 무시)"""
+        with self._lock:
+            if self._threads:
+                return
+            recovered = self.recover()
+            if recovered:
+                print(f"[작업 큐] 중단된 작업 {recovered}개 복구")
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f'crawl-job-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            print(f"[작업 큐] 워커 {self.workers}개 시작")
+
+    def submit(self, keyword, priority=0):
+        """작업 추가, crawl_id 반환"""
+        with self.app.app_context():
+            job = CrawlJob(crawl_id=uuid.uuid4().hex[:16], keyword=keyword, priority=priority)
+            db.session.add(job)
+            db.session.commit()
+            crawl_id = job.crawl_id
+        self._notify(crawl_id)
+        self.start()
+        with self._wakeup:
+            self._wakeup.notify()
+        return crawl_id
+
+    def update(self, crawl_id, **fields):
+        """실행 중인 작업의 진행 상태 저장 (progress=60, details={...} 등)"""
+        if 'details' in fields:
+            fields['details'] = json.dumps(fields['details'], ensure_ascii=False, default=str)
+        with self.app.app_context():
+            CrawlJob.query.filter_by(crawl_id=crawl_id).update(fields, synchronize_session=False)
+            db.session.commit()
+        self._notify(crawl_id)
+
+    def status(self, crawl_id):
+        """작업 상태 (대기 중이면 대기 순서 queue_position, 예상 남은 시간 eta_seconds 포함), 없으면 None"""
+        with self.app.app_context():
+            job = CrawlJob.query.filter_by(crawl_id=crawl_id).first()
+            if job is None:
+                return None
+            status = job.to_dict()
+            average = self._average_seconds()
+
+            if job.status == 'queued':
+                ahead = CrawlJob.query.filter(
+                    CrawlJob.status == 'queued',
+                    or_(CrawlJob.priority > job.priority,
+                        and_(CrawlJob.priority == job.priority, CrawlJob.id < job.id))
+                ).count()
+                running = CrawlJob.query.filter_by(status='running').count()
+                status['queue_position'] = ahead + 1
+                # 앞선 작업(실행 중 포함)이 워커 수만큼씩 나뉘어 끝난 뒤 이 작업 실행
+                status['eta_seconds'] = round((ahead + running) / self.workers * average + average)
+            elif job.status == 'running':
+                elapsed = (datetime.utcnow() - job.started_at).total_seconds() if job.started_at else 0
+                status['queue_position'] = 0
+                status['eta_seconds'] = round(max(average - elapsed, 0))
+            else:
+                status['queue_position'] = 0
+                status['eta_seconds'] = 0
+            return status
+
+    def recover(self):
+        """
+        실행 중 상태로 남은 작업(서버 재시작으로 중단) 정리
+        시도 횟수가 남았으면 다시 대기열로, 아니면 실패 처리
+        """
+        with self.app.app_context():
+            jobs = CrawlJob.query.filter_by(status='running').all()
+            for job in jobs:
+                if job.attempts < self.max_attempts:
+                    job.status = 'queued'
+                    job.progress = 0
+                else:
+                    job.status = 'failed'
+                    job.error = '서버 재시작으로 중단됨'
+                    job.finished_at = datetime.utcnow()
+            db.session.commit()
+            return len(jobs)
+
+    def _average_seconds(self):
+        """최근 완료된 작업의 평균 소요 시간 (초)"""
+        recent = (CrawlJob.query
+                  .filter(CrawlJob.status == 'done', CrawlJob.started_at.isnot(None), CrawlJob.finished_at.isnot(None))
+                  .order_by(CrawlJob.finished_at.desc())
+                  .limit(ETA_SAMPLE)
+                  .with_entities(CrawlJob.started_at, CrawlJob.finished_at)
+                  .all())
+        if not recent:
+            return DEFAULT_JOB_SECONDS
+        return sum((finished - started).total_seconds() for started, finished in recent) / len(recent)
+
+    def _claim(self):
+        """대기 중인 작업 하나를 실행 상태로 바꾸고 (crawl_id, keyword) 반환 (우선순위 높은 순, 같으면 먼저 들어온 순)"""
+        with self.app.app_context():
+            while True:
+                job = (CrawlJob.query.filter_by(status='queued')
+                       .order_by(CrawlJob.priority.desc(), CrawlJob.id)
+                       .first())
+                if job is None:
+                    return None
+                # 상태 조건을 건 UPDATE로 가져감 (다른 워커가 먼저 가져갔으면 다음 작업)
+                claimed = CrawlJob.query.filter_by(id=job.id, status='queued').update({
+                    'status': 'running',
+                    'attempts': CrawlJob.attempts + 1,
+                    'progress': 0,
+                    'error': None,
+                    'started_at': datetime.utcnow(),
+                }, synchronize_session=False)
+                db.session.commit()
+                if claimed:
+                    crawl_id, keyword = job.crawl_id, job.keyword
+                    break
+        self._notify(crawl_id)
+        return crawl_id, keyword
+
+    def _finish(self, crawl_id, search_id):
+        with self.app.app_context():
+            CrawlJob.query.filter_by(crawl_id=crawl_id).update({
+                'status': 'done',
+                'progress': 100,
+                'search_id': search_id,
+                'finished_at': datetime.utcnow(),
+            }, synchronize_session=False)
+            db.session.commit()
+        self._notify(crawl_id)
+
+    def _fail(self, crawl_id, error):
+        """실패 처리: 시도 횟수가 남았으면 다시 대기열로"""
+        with self.app.app_context():
+            job = CrawlJob.query.filter_by(crawl_id=crawl_id).first()
+            if job.attempts < self.max_attempts:
+                job.status = 'queued'
+                job.progress = 0
+                print(f"[작업 큐] {crawl_id} 실패, 재시도 대기 ({job.attempts}/{self.max_attempts}): {error}")
+            else:
+                job.status = 'failed'
+                job.finished_at = datetime.utcnow()
+                print(f"[작업 큐] {crawl_id} 실패 ({job.attempts}/{self.max_attempts}): {error}")
+            job.error = str(error)
+            db.session.commit()
+        self._notify(crawl_id)
+
+    def _notify(self, crawl_id):
+        if self.listener is None:
+            return
+        try:
+            self.listener(crawl_id, self.status(crawl_id))
+        except Exception as e:
+            print(f"[작업 큐] 상태 알림 오류 ({crawl_id}): {e}")
+
+    def _idle(self):
+        if self.on_idle is None:
+            return
+        try:
+            self.on_idle()
+        except Exception as e:
+            print(f"[작업 큐] 대기 중 정리 오류: {e}")
+
+    def _worker(self):
+        while True:
+            try:
+                claimed = self._claim()
+            except Exception as e:
+                print(f"[작업 큐] 작업 가져오기 오류: {e}")
+                claimed = None
+            if claimed is None:
+                self._idle()
+                with self._wakeup:
+                    self._wakeup.wait(POLL_INTERVAL)
+                continue
+
+            crawl_id, keyword = claimed
+            try:
+                search_id = self.handler(keyword, crawl_id)
+            except Exception as e:
+                traceback.print_exc()
+                self._fail(crawl_id, e)
+            else:
+                self._finish(crawl_id, search_id)
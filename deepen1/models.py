@@ -1,4 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func, select
 from datetime import datetime
 import json
 
@@ -8,6 +9,9 @@ db = SQLAlchemy()
 class SearchHistory(db.Model):
     """검색 기록 모델"""
     __tablename__ = 'search_history'
+    __table_args__ = (
+        db.Index('ix_search_history_search_date', 'search_date'),  # /history, /api/history 최신순
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     keyword = db.Column(db.String(200), nullable=False)
@@ -16,20 +20,25 @@ class SearchHistory(db.Model):
     # 관계 설정
     google_results = db.relationship('GoogleResult', backref='search', lazy=True, cascade='all, delete-orphan')
     youtube_results = db.relationship('YouTubeResult', backref='search', lazy=True, cascade='all, delete-orphan')
+    payload = db.relationship('SearchPayload', uselist=False, lazy=True, cascade='all, delete-orphan')
+    snapshot_runs = db.relationship('SearchSnapshotRun', lazy=True, cascade='all, delete-orphan')
     
     def to_dict(self):
         return {
             'id': self.id,
             'keyword': self.keyword,
             'search_date': self.search_date.strftime('%Y-%m-%d %H:%M:%S'),
-            'google_count': len(self.google_results),
-            'youtube_count': len(self.youtube_results)
+            'google_count': self.google_count,
+            'youtube_count': self.youtube_count
         }
 
 
 class GoogleResult(db.Model):
     """구글 검색 결과 모델"""
     __tablename__ = 'google_results'
+    __table_args__ = (
+        db.Index('ix_google_results_search_id_position', 'search_id', 'position'),  # 검색별 결과 (순위순)
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     search_id = db.Column(db.Integer, db.ForeignKey('search_history.id'), nullable=False)
@@ -62,6 +71,12 @@ class GoogleResult(db.Model):
 class YouTubeResult(db.Model):
     """유튜브 검색 결과 모델"""
     __tablename__ = 'youtube_results'
+    __table_args__ = (
+        # 검색별 결과 (순위순 / 조회수순 / 날짜순 정렬, 날짜 범위 필터)
+        db.Index('ix_youtube_results_search_id_position', 'search_id', 'position'),
+        db.Index('ix_youtube_results_search_id_view_count', 'search_id', 'view_count_numeric'),
+        db.Index('ix_youtube_results_search_id_upload_timestamp', 'search_id', 'upload_timestamp'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     search_id = db.Column(db.Integer, db.ForeignKey('search_history.id'), nullable=False)
@@ -103,3 +118,68 @@ class YouTubeResult(db.Model):
         }
 
 
+class SearchPayload(db.Model):
+    """필터 없는 /api/results 응답 본문 (크롤링 저장 시 한 번 직렬화, 키워드 수정/결과 교체 시 다시 생성)"""
+    __tablename__ = 'search_payloads'
+    
+    search_id = db.Column(db.Integer, db.ForeignKey('search_history.id'), primary_key=True)
+    etag = db.Column(db.String(64), nullable=False)  # 본문 해시 (강한 ETag)
+    body = db.Column(db.LargeBinary, nullable=False)  # JSON (UTF-8)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class SearchSnapshotRun(db.Model):
+    """검색 기록을 만든 엔진별 크롤링의 스냅샷 run ID (replay_snapshots.py가 같은 크롤링의 페이지로 재파싱)"""
+    __tablename__ = 'search_snapshot_runs'
+    
+    search_id = db.Column(db.Integer, db.ForeignKey('search_history.id'), primary_key=True)
+    engine = db.Column(db.String(20), primary_key=True)  # google / youtube
+    run = db.Column(db.String(64), nullable=False)
+
+
+# 검색별 결과 수 (결과 행을 읽지 않고 인덱스로 셈, 목록 쿼리에서는 undefer로 한 번에 조회)
+SearchHistory.google_count = db.column_property(
+    select(func.count()).where(GoogleResult.search_id == SearchHistory.id)
+    .correlate_except(GoogleResult).scalar_subquery(),
+    deferred=True
+)
+SearchHistory.youtube_count = db.column_property(
+    select(func.count()).where(YouTubeResult.search_id == SearchHistory.id)
+    .correlate_except(YouTubeResult).scalar_subquery(),
+    deferred=True
+)
+
+
+class CrawlJob(db.Model):
+    """크롤링 작업 (job_queue.py의 워커 스레드가 우선순위 순서로 실행)"""
+    __tablename__ = 'crawl_jobs'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    crawl_id = db.Column(db.String(32), unique=True, nullable=False)  # API에서 쓰는 작업 ID
+    keyword = db.Column(db.String(200), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='queued', index=True)  # queued/running/done/failed
+    priority = db.Column(db.Integer, nullable=False, default=0)  # 높을수록 먼저 실행
+    progress = db.Column(db.Integer, nullable=False, default=0)  # 진행률 (%)
+    attempts = db.Column(db.Integer, nullable=False, default=0)  # 실행 시도 횟수
+    error = db.Column(db.Text)
+    details = db.Column(db.Text)  # 엔진별 소요 시간/통계/오류 (JSON)
+    search_id = db.Column(db.Integer)  # 완료 시 생성된 검색 기록
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    
+    def to_dict(self):
+        return {
+            'crawl_id': self.crawl_id,
+            'keyword': self.keyword,
+            'state': self.status,
+            'priority': self.priority,
+            'progress': self.progress,
+            'attempts': self.attempts,
+            'error': self.error,
+            'search_id': self.search_id,
+            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None,
+            'started_at': self.started_at.strftime('%Y-%m-%d %H:%M:%S') if self.started_at else None,
+            'finished_at': self.finished_at.strftime('%Y-%m-%d %H:%M:%S') if self.finished_at else None,
+            **(json.loads(self.details) if self.details else {})
+        }
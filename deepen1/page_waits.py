@@ -0,0 +1,95 @@
+"""
+이벤트 기반 페이지 대기
+
+고정된 sleep 대신 document.readyState, MutationObserver, 결과 개수 변화 같은
+페이지 신호를 WebDriverWait로 기다린다. 빠른 페이지는 바로 다음 단계로 넘어가고,
+느린 페이지는 timeout까지 기다린다.
+
+모든 대기 함수는 시간 초과 시 예외 대신 False를 반환한다 (크롤링은 계속 진행).
+"""
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# DOM 변경을 감시하는 MutationObserver 설치 (페이지 이동 시 다시 설치 필요)
+_OBSERVER_JS = """
+if (!window.__crawlerWatch) {
+    window.__crawlerWatch = {mutations: 0, last: Date.now()};
+    new MutationObserver(function (records) {
+        window.__crawlerWatch.mutations += records.length;
+        window.__crawlerWatch.last = Date.now();
+    }).observe(document.documentElement, {childList: true, subtree: true});
+}
+return true;
+"""
+
+# 마지막 DOM 변경 이후 경과 시간 (ms)
+_QUIET_MS_JS = "var w = window.__crawlerWatch; return w ? Date.now() - w.last : null;"
+
+
+class PageWaiter:
+    """드라이버 하나에 대한 대기 도우미"""
+
+    def __init__(self, driver, poll_frequency=0.1):
+        self.driver = driver
+        self.poll_frequency = poll_frequency
+
+    def until(self, predicate, timeout=10):
+        """predicate(driver)가 참이 될 때까지 대기"""
+        try:
+            WebDriverWait(
+                self.driver, timeout,
+                poll_frequency=self.poll_frequency,
+                ignored_exceptions=(WebDriverException,)
+            ).until(predicate)
+            return True
+        except TimeoutException:
+            return False
+
+    def ready(self, timeout=10):
+        """document.readyState == 'complete' 대기"""
+        return self.until(
+            lambda d: d.execute_script('return document.readyState') == 'complete',
+            timeout
+        )
+
+    def selector(self, css, timeout=10):
+        """CSS 선택자에 맞는 요소가 나타날 때까지 대기 (페이지별 준비 조건)"""
+        script = f"return document.querySelector({css!r}) !== null;"
+        return self.until(lambda d: d.execute_script(script), timeout)
+
+    def observe(self):
+        """MutationObserver 설치"""
+        try:
+            self.driver.execute_script(_OBSERVER_JS)
+        except WebDriverException:
+            pass
+
+    def dom_quiet(self, quiet_ms=500, timeout=5):
+        """quiet_ms 동안 DOM 변경이 없을 때까지 대기"""
+        self.observe()
+
+        def is_quiet(d):
+            elapsed = d.execute_script(_QUIET_MS_JS)
+            if elapsed is None:
+                # 페이지가 바뀌어 감시가 사라진 경우 다시 설치
+                d.execute_script(_OBSERVER_JS)
+                return False
+            return elapsed >= quiet_ms
+
+        return self.until(is_quiet, timeout)
+
+    def count_increase(self, count_script, previous, timeout=5):
+        """
+        count_script(JS, 숫자 반환) 결과가 previous보다 커질 때까지 대기
+
+        Returns:
+            int: 마지막으로 확인한 개수 (시간 초과 시 previous 이하일 수 있음)
+        """
+        latest = {'count': previous}
+
+        def increased(d):
+            latest['count'] = d.execute_script(count_script) or 0
+            return latest['count'] > previous
+
+        self.until(increased, timeout)
+        return latest['count']
@@ -0,0 +1,126 @@
+"""저장된 스냅샷으로 다시 파싱 (네트워크/브라우저 없이)
+
+선택자 수정 후 이미 가져온 페이지로 결과를 다시 만들거나, 기존 검색 기록의 결과를 교체한다.
+
+    python replay_snapshots.py list [--keyword 키워드]
+    python replay_snapshots.py replay --keyword 키워드             # 최근 크롤링 재파싱 (저장 안 함)
+    python replay_snapshots.py replay --search-id 3 --write         # 검색 기록 3의 결과 교체
+    python replay_snapshots.py replay --all --write                 # 스냅샷이 있는 모든 검색 기록 교체
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from app import app, add_google_results, add_youtube_results, store_results_payload
+from crawler import CRAWLERS, YOUTUBE_OPTIONS
+from models import db, SearchHistory, GoogleResult, YouTubeResult
+from snapshot_store import snapshot_store
+
+ENGINES = ('google', 'youtube')
+
+
+def parse_run(engine, snapshots):
+    """스냅샷 묶음(run 하나)을 현재 파서로 파싱"""
+    records = [snapshot.load() for snapshot in snapshots]
+    crawler = CRAWLERS[engine]()
+    options = YOUTUBE_OPTIONS if engine == 'youtube' else {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        return crawler.parse_snapshot(records, **options)
+
+
+def list_snapshots(keyword=None):
+    for engine in ENGINES:
+        runs = snapshot_store.runs(engine, keyword)
+        print(f"[{engine}] 크롤링 {len(runs)}회")
+        for run, pages in runs.items():
+            record = pages[0].load()
+            print(f"  {pages[0].fetched_at:%Y-%m-%d %H:%M:%S} UTC  run={run}  "
+                  f"{len(pages)}페이지  {record.get('source', '')}  '{record['keyword']}'")
+    print(f"\n전체 {snapshot_store.usage() / 1024 / 1024:.1f}MB (한도 {snapshot_store.max_bytes / 1024 / 1024:.0f}MB)")
+
+
+def replay_search(search, write=False):
+    """검색 기록 하나를 해당 시점의 스냅샷으로 다시 파싱 (write=True면 결과 교체)"""
+    replaced = {}
+    runs = {snapshot_run.engine: snapshot_run.run for snapshot_run in search.snapshot_runs}
+    for engine in ENGINES:
+        if runs:
+            # 검색 기록을 만든 크롤링의 스냅샷 (키워드 수정, 같은 키워드 동시 크롤링, 재시도와 무관)
+            snapshots = snapshot_store.run_pages(engine, runs[engine]) if engine in runs else []
+        else:
+            # run ID를 저장하기 전의 검색 기록: 크롤링이 끝난 뒤 생성되므로 그 이전에 시작한 가장 최근 크롤링
+            snapshots = snapshot_store.latest_run(engine, search.keyword, before=search.search_date)
+        if not snapshots:
+            print(f"  [{engine}] 스냅샷 없음, 건너뜀")
+            continue
+        started = time.perf_counter()
+        results = parse_run(engine, snapshots)
+        print(f"  [{engine}] run={snapshots[0].run} {len(snapshots)}페이지 → {len(results)}개 결과 "
+              f"({time.perf_counter() - started:.2f}초)")
+        replaced[engine] = results
+
+    if write and replaced:
+        if 'google' in replaced:
+            GoogleResult.query.filter_by(search_id=search.id).delete()
+            add_google_results(search.id, replaced['google'])
+        if 'youtube' in replaced:
+            YouTubeResult.query.filter_by(search_id=search.id).delete()
+            add_youtube_results(search.id, replaced['youtube'])
+        store_results_payload(search)
+        db.session.commit()
+        print(f"  → 검색 기록 {search.id} 결과 교체 완료")
+    return replaced
+
+
+def replay_keyword(keyword):
+    """키워드의 가장 최근 크롤링을 다시 파싱해 요약 출력 (저장 안 함)"""
+    for engine in ENGINES:
+        snapshots = snapshot_store.latest_run(engine, keyword)
+        if not snapshots:
+            print(f"[{engine}] 스냅샷 없음")
+            continue
+        results = parse_run(engine, snapshots)
+        print(f"[{engine}] run={snapshots[0].run} {len(snapshots)}페이지 → {len(results)}개 결과")
+        for result in results[:5]:
+            print(f"  {result['position']:>3}. {result['title'][:60]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스냅샷 재파싱')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = sub.add_parser('list', help='저장된 스냅샷 목록')
+    list_parser.add_argument('--keyword')
+
+    replay_parser = sub.add_parser('replay', help='스냅샷으로 다시 파싱')
+    target = replay_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--keyword')
+    target.add_argument('--search-id', type=int)
+    target.add_argument('--all', action='store_true')
+    replay_parser.add_argument('--write', action='store_true', help='검색 기록의 결과를 교체')
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        list_snapshots(args.keyword)
+        return
+
+    if args.keyword:
+        replay_keyword(args.keyword)
+        return
+
+    with app.app_context():
+        if args.search_id:
+            search = db.session.get(SearchHistory, args.search_id)
+            if search is None:
+                parser.error(f'검색 기록 {args.search_id}이 없습니다')
+            searches = [search]
+        else:
+            searches = SearchHistory.query.order_by(SearchHistory.search_date).all()
+        for search in searches:
+            print(f"[검색 기록 {search.id}] '{search.keyword}' ({search.search_date:%Y-%m-%d %H:%M:%S})")
+            replay_search(search, write=args.write)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+검색 결과/기록 조회 (/api/results 필터링, 정렬, 페이지 / /api/history 페이지)
+
+키워드/업로드 날짜 필터와 정렬을 SQL WHERE/ORDER BY로 만들어 필요한 행만 ORM 객체로 읽는다.
+limit을 주면 한 페이지만 읽고, 다음 페이지는 커서(마지막 행의 정렬 값 + id) 다음부터 읽는다
+(OFFSET처럼 앞 페이지 행을 다시 건너뛰며 읽지 않음, 인덱스는 models.py).
+
+    filters = ResultFilters.from_args(request.args)
+    page = fetch_page(youtube_query(search_id, filters), filters.youtube_sort, filters.limit, cursor)
+"""
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import DateTime, and_, func, or_, select
+from sqlalchemy.orm import undefer
+
+from models import db, SearchHistory, GoogleResult, YouTubeResult
+
+MAX_LIMIT = 1000  # 한 페이지 최대 행 수
+HISTORY_PAGE_SIZE = 50  # /api/history 기본 한 페이지 검색 기록 수
+
+# 정렬 이름 -> (정렬 컬럼, 내림차순 여부), 같은 값은 id 순서로 (커서 위치가 하나로 정해지도록)
+GOOGLE_SORTS = {
+    '': (GoogleResult.position, False),
+}
+YOUTUBE_SORTS = {
+    '': (YouTubeResult.position, False),
+    'view_asc': (YouTubeResult.view_count_numeric, False),
+    'view_desc': (YouTubeResult.view_count_numeric, True),
+    'date_asc': (YouTubeResult.upload_timestamp, False),
+    'date_desc': (YouTubeResult.upload_timestamp, True),
+}
+
+
+HISTORY_SORT = (SearchHistory.search_date, True)  # 최신순
+
+
+class ResultFilters:
+    """/api/results 쿼리 파라미터 (잘못된 값이면 from_args에서 ValueError)"""
+
+    def __init__(self, keyword='', date_from=None, date_to=None, sort_by='', limit=None, count=False):
+        self.keyword = keyword
+        self.date_from = date_from
+        self.date_to = date_to
+        self.sort_by = sort_by
+        self.limit = limit
+        self.count = count
+
+    @classmethod
+    def from_args(cls, args):
+        sort_by = args.get('sort_by', '')
+        if sort_by not in YOUTUBE_SORTS:
+            raise ValueError(f'지원하지 않는 정렬입니다: {sort_by}')
+        return cls(
+            keyword=args.get('keyword', '').strip().lower(),
+            date_from=_parse_date(args.get('date_from', '')),
+            date_to=_parse_date(args.get('date_to', '')),
+            sort_by=sort_by,
+            limit=parse_limit(args.get('limit', ''), None),
+            count=args.get('count', '') in ('1', 'true'),
+        )
+
+    def key(self):
+        """정규화한 필터 값 (캐시 키)"""
+        return (self.keyword,
+                self.date_from.date().isoformat() if self.date_from else '',
+                self.date_to.date().isoformat() if self.date_to else '',
+                self.sort_by, self.limit, self.count)
+
+    @property
+    def google_sort(self):
+        return GOOGLE_SORTS['']  # 구글 결과는 순위순만
+
+    @property
+    def youtube_sort(self):
+        return YOUTUBE_SORTS[self.sort_by]
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f'날짜 형식이 올바르지 않습니다 (YYYY-MM-DD): {value}')
+
+
+def google_query(search_id, filters):
+    """구글 결과 쿼리 (키워드: 제목/스니펫에 포함)"""
+    query = select(GoogleResult).where(GoogleResult.search_id == search_id)
+    if filters.keyword:
+        query = query.where(or_(GoogleResult.title.icontains(filters.keyword, autoescape=True),
+                                GoogleResult.snippet.icontains(filters.keyword, autoescape=True)))
+    return query
+
+
+def youtube_query(search_id, filters):
+    """유튜브 결과 쿼리 (키워드: 제목/채널명에 포함, 날짜 범위를 주면 업로드 날짜 없는 영상은 제외)"""
+    query = select(YouTubeResult).where(YouTubeResult.search_id == search_id)
+    if filters.keyword:
+        query = query.where(or_(YouTubeResult.title.icontains(filters.keyword, autoescape=True),
+                                YouTubeResult.channel_name.icontains(filters.keyword, autoescape=True)))
+    if filters.date_from:
+        query = query.where(YouTubeResult.upload_timestamp >= filters.date_from)
+    if filters.date_to:
+        query = query.where(YouTubeResult.upload_timestamp <= filters.date_to)
+    return query
+
+
+def history_query():
+    """검색 기록 쿼리 (결과 수를 같은 SELECT의 서브쿼리로, 검색마다 결과를 읽지 않음)"""
+    return select(SearchHistory).options(undefer(SearchHistory.google_count), undefer(SearchHistory.youtube_count))
+
+
+def parse_limit(value, default):
+    """limit 파라미터 (빈 값이면 default, 1~MAX_LIMIT가 아니면 ValueError)"""
+    if not value:
+        return default
+    if not value.isdigit() or not 1 <= int(value) <= MAX_LIMIT:
+        raise ValueError(f'limit은 1~{MAX_LIMIT} 사이 숫자여야 합니다')
+    return int(value)
+
+
+def fetch_page(query, sort, limit=None, cursor=None):
+    """
+    정렬한 결과 한 페이지
+
+    Returns:
+        (ORM 객체 목록, 다음 페이지 커서 - 마지막 페이지이거나 limit이 없으면 None)
+    """
+    column = sort[0]
+    if limit is None:
+        return db.session.scalars(page_query(query, sort, cursor=cursor)).all(), None
+
+    rows = db.session.scalars(page_query(query, sort, limit + 1, cursor)).all()  # 다음 페이지 유무 확인용 1행 더
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(column, getattr(last, column.key), last.id)
+
+
+def page_query(query, sort, limit=None, cursor=None):
+    """정렬/커서/limit을 적용한 쿼리 (fetch_page, explain_queries.py에서 사용)"""
+    column, descending = sort
+    model = column.class_
+    if cursor:
+        value, last_id = decode_cursor(cursor, column)
+        query = query.where(_after(column, model.id, descending, value, last_id))
+    # SQLite에서 NULL은 가장 작은 값 (오름차순이면 맨 앞, 내림차순이면 맨 뒤)
+    if descending:
+        query = query.order_by(column.desc(), model.id.desc())
+    else:
+        query = query.order_by(column, model.id)
+    return query.limit(limit) if limit is not None else query
+
+
+def count_rows(query):
+    """필터를 적용한 전체 행 수"""
+    return db.session.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+
+
+def _after(column, id_column, descending, value, last_id):
+    """정렬 순서에서 (value, last_id) 다음 행 조건"""
+    if descending:
+        if value is None:
+            return and_(column.is_(None), id_column < last_id)
+        return or_(column < value, and_(column == value, id_column < last_id), column.is_(None))
+    if value is None:
+        return or_(and_(column.is_(None), id_column > last_id), column.isnot(None))
+    return or_(column > value, and_(column == value, id_column > last_id))
+
+
+def encode_cursor(column, value, last_id):
+    """다음 페이지 커서 (정렬 컬럼, 마지막 값, 마지막 id를 담은 불투명한 문자열)"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([column.key, value, last_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, column):
+    """커서 -> (마지막 값, 마지막 id), 다른 정렬의 커서이거나 깨졌으면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        key, value, last_id = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError('잘못된 커서입니다')
+    if key != column.key or not isinstance(last_id, int):
+        raise ValueError('정렬이 바뀌어 커서를 쓸 수 없습니다')
+    if value is not None and isinstance(column.type, DateTime):
+        try:
+            value = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            raise ValueError('잘못된 커서입니다')
+    return value, last_id
@@ -0,0 +1,16 @@
+"""
+원본 페이지 스냅샷 저장소 (deepen1)
+
+저장/조회/정리는 web2와 함께 쓰는 common/snapshots.py의 SnapshotStore이고,
+여기서는 이 앱의 저장 폴더로 프로세스 전역 저장소를 만든다.
+"""
+import os
+
+import common_path  # noqa: F401
+from snapshots import SnapshotStore, new_run_id  # noqa: F401 - 크롤러 코드는 여기서 import
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', os.path.join(BASE_DIR, 'snapshots'))
+
+# 프로세스 전역 저장소 (웹 서버, 크롤러 워커 각각)
+snapshot_store = SnapshotStore(SNAPSHOT_DIR)
@@ -0,0 +1,16 @@
+"""
+SQLite 연결 설정 - SQLAlchemy 엔진의 모든 연결에 같은 PRAGMA 적용
+
+PRAGMA 목록과 설정은 web2와 함께 쓰는 common/sqlite_pragmas.py (WAL, synchronous, 캐시, busy_timeout, 외래 키)
+
+    install(db.engine)  # SQLAlchemy 엔진의 새 연결마다 적용
+"""
+from sqlalchemy import event
+
+import common_path  # noqa: F401
+from sqlite_pragmas import PRAGMAS, apply_pragmas  # noqa: F401
+
+
+def install(engine):
+    """SQLAlchemy 엔진이 새 연결을 만들 때마다 PRAGMA 적용"""
+    event.listen(engine, 'connect', lambda dbapi_connection, connection_record: apply_pragmas(dbapi_connection))
@@ -250,6 +250,35 @@ function renderYoutubeResults(data) {
     }
 }
 
+// 크롤링 진행 스트림 구독 (Server-Sent Events)
+// handlers.onStatus(statusData): 상태/진행률이 바뀔 때마다, handlers.onLog(line): 로그 한 줄마다
+// 작업이 끝나면(completed/error/not_found) 연결을 닫음 (끊기면 브라우저가 Last-Event-ID로 자동 재연결)
+function watchCrawl(crawlId, handlers = {}) {
+    const source = new EventSource(`/crawl-events/${crawlId}`);
+    
+    source.addEventListener('status', (event) => {
+        const statusData = JSON.parse(event.data);
+        if (['completed', 'error', 'not_found'].includes(statusData.status)) {
+            source.close();
+        }
+        if (handlers.onStatus) {
+            handlers.onStatus(statusData);
+        }
+    });
+    
+    source.addEventListener('log', (event) => {
+        if (handlers.onLog) {
+            handlers.onLog(JSON.parse(event.data).line);
+        }
+    });
+    
+    source.onerror = () => {
+        console.error('진행 스트림 연결 오류 (재연결 시도)');
+    };
+    
+    return source;
+}
+
 // 검색 기능
 async function performSearch(keyword) {
     const progressContainer = document.getElementById('progress-container');
@@ -282,19 +311,15 @@ async function performSearch(keyword) {
         
         const crawlId = data.crawl_id;
         
-        // 진행 상태 확인
-        const checkStatus = setInterval(async () => {
-            try {
-                const statusResponse = await fetch(`/crawl-status/${crawlId}`);
-                const statusData = await statusResponse.json();
-                
+        // 진행 상태 수신
+        watchCrawl(crawlId, {
+            onStatus: (statusData) => {
                 // 진행률 업데이트
                 const progress = statusData.progress || 0;
                 progressFill.style.width = `${progress}%`;
                 progressFill.textContent = `${progress}%`;
                 
                 if (statusData.status === 'completed') {
-                    clearInterval(checkStatus);
                     statusMessage.textContent = '크롤링이 완료되었습니다!';
                     showAlert('검색이 완료되었습니다!', 'success');
                     
@@ -303,12 +328,14 @@ async function performSearch(keyword) {
                         window.location.href = `/results/${statusData.search_id}`;
                     }, 1000);
                     
-                } else if (statusData.status === 'error') {
-                    clearInterval(checkStatus);
+                } else if (statusData.status === 'error' || statusData.status === 'not_found') {
                     statusMessage.textContent = '오류가 발생했습니다.';
                     showAlert(statusData.error || '크롤링 중 오류가 발생했습니다.', 'error');
                     searchBtn.disabled = false;
                     
+                } else if (statusData.status === 'queued') {
+                    statusMessage.textContent = `대기 중... (${statusData.queue_position}번째, 약 ${statusData.eta_seconds}초 후 완료 예상)`;
+                    
                 } else if (statusData.status === 'running') {
                     if (progress < 30) {
                         statusMessage.textContent = '구글 검색 중...';
@@ -318,11 +345,8 @@ async function performSearch(keyword) {
                         statusMessage.textContent = '결과를 저장하는 중...';
                     }
                 }
-                
-            } catch (error) {
-                console.error('상태 확인 오류:', error);
             }
-        }, 1000);
+        });
         
     } catch (error) {
         showAlert(error.message, 'error');
@@ -403,18 +427,22 @@ async function loadResults(searchId, filters = {}) {
     }
 }
 
-// 검색 기록 로드
-async function loadHistory() {
+// 검색 기록 로드 (cursor를 주면 다음 페이지를 목록 뒤에 추가)
+async function loadHistory(cursor = null) {
     const historyList = document.getElementById('history-list');
     
-    historyList.innerHTML = '<div class="loading"><div class="spinner"></div><p>로딩 중...</p></div>';
+    if (cursor) {
+        document.getElementById('history-more')?.remove();
+    } else {
+        historyList.innerHTML = '<div class="loading"><div class="spinner"></div><p>로딩 중...</p></div>';
+    }
     
     try {
-        const response = await fetch('/api/history');
+        const params = new URLSearchParams(cursor ? { cursor } : {});
+        const response = await fetch(`/api/history?${params}`);
         const data = await response.json();
         
-        if (data.length > 0) {
-            historyList.innerHTML = data.map(search => `
+        const items = data.searches.map(search => `
                 <div class="history-item">
                     <div class="history-info">
                         <div class="history-keyword">${search.keyword}</div>
@@ -436,6 +464,18 @@ async function loadHistory() {
                     </div>
                 </div>
             `).join('');
+        
+        // 다음 페이지가 있으면 더 보기 버튼
+        const more = data.next_cursor
+            ? `<div id="history-more" class="history-more">
+                    <button class="btn btn-primary btn-small" onclick="loadHistory('${data.next_cursor}')">더 보기</button>
+                </div>`
+            : '';
+        
+        if (cursor) {
+            historyList.insertAdjacentHTML('beforeend', items + more);
+        } else if (data.searches.length > 0) {
+            historyList.innerHTML = items + more;
         } else {
             historyList.innerHTML = '<div class="empty-state"><div class="empty-state-icon">📋</div><div class="empty-state-text">검색 기록이 없습니다.</div></div>';
         }
@@ -0,0 +1,116 @@
+"""
+개수/시간 제한이 있는 메모리 저장소
+
+항목을 마지막으로 쓰거나 읽은 뒤 ttl초가 지나면 만료되고, max_entries를 넘으면
+가장 오래 쓰지 않은 항목부터 버린다 (LRU). 버리는 항목은 on_evict(key, value)로 넘겨
+디스크 등에 남길 수 있다. 서버를 오래 켜 두어도 메모리 사용량이 늘어나지 않도록
+크롤링별 진행 이벤트/로그 보관에 사용한다 (crawl_events.py).
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLStore:
+    """만료 시간 + 최대 개수(LRU) 딕셔너리 (스레드 안전)"""
+
+    def __init__(self, max_entries=1000, ttl=3600, on_evict=None):
+        """
+        Args:
+            max_entries: 최대 항목 수 (넘으면 가장 오래 쓰지 않은 항목부터 버림)
+            ttl: 마지막으로 쓰거나 읽은 뒤 만료까지의 시간 (초, None이면 만료 없음)
+            on_evict: on_evict(key, value) - 만료/교체로 버리는 항목마다 호출 (잠금 밖에서)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._lock = threading.Lock()
+        self._items = OrderedDict()  # key -> (value, 만료 시각), 오래 쓰지 않은 순서
+
+    def get(self, key, default=None):
+        """값 조회 (조회한 항목은 만료 시간 연장)"""
+        with self._lock:
+            evicted = self._expire(time.monotonic())
+            item = self._items.get(key)
+            if item is not None:
+                self._touch(key, item[0])
+        self._notify(evicted)
+        return default if item is None else item[0]
+
+    def peek(self, key, default=None):
+        """값 조회 (만료 시간/순서는 그대로)"""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or (item[1] is not None and item[1] <= time.monotonic()):
+                return default
+            return item[0]
+
+    def set(self, key, value):
+        with self._lock:
+            self._touch(key, value)
+            evicted = self._expire(time.monotonic()) + self._trim()
+        self._notify(evicted)
+
+    def setdefault(self, key, factory):
+        """값이 없으면 factory()로 만들어 저장, 값 반환"""
+        with self._lock:
+            evicted = self._expire(time.monotonic())
+            item = self._items.get(key)
+            value = factory() if item is None else item[0]
+            self._touch(key, value)
+            evicted += self._trim()
+        self._notify(evicted)
+        return value
+
+    def pop(self, key, default=None):
+        """값을 꺼내고 삭제 (on_evict 호출 안 함)"""
+        with self._lock:
+            item = self._items.pop(key, None)
+        return default if item is None else item[0]
+
+    def prune(self):
+        """만료된 항목 정리, 정리한 수 반환"""
+        with self._lock:
+            evicted = self._expire(time.monotonic())
+        self._notify(evicted)
+        return len(evicted)
+
+    def __contains__(self, key):
+        return self.peek(key, _MISSING) is not _MISSING
+
+    def __len__(self):
+        return len(self._items)
+
+    def _touch(self, key, value):
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._items[key] = (value, expires)
+        self._items.move_to_end(key)
+
+    def _expire(self, now):
+        # 쓰거나 읽을 때마다 맨 뒤로 옮기므로 앞쪽부터 만료 시각 순서
+        evicted = []
+        while self._items:
+            key, (value, expires) = next(iter(self._items.items()))
+            if expires is None or expires > now:
+                break
+            del self._items[key]
+            evicted.append((key, value))
+        return evicted
+
+    def _trim(self):
+        evicted = []
+        while len(self._items) > self.max_entries:
+            evicted.append(self._items.popitem(last=False))
+        return [(key, value) for key, (value, _) in evicted]
+
+    def _notify(self, evicted):
+        if not self.on_evict:
+            return
+        for key, value in evicted:
+            try:
+                self.on_evict(key, value)
+            except Exception as e:
+                print(f"[저장소] 항목 정리 오류 ({key}): {e}")
+
+
+_MISSING = object()
@@ -0,0 +1,139 @@
+"""
+유튜브 검색 페이지에 포함된 ytInitialData JSON 추출 및 continuation 요청
+
+브라우저 렌더링/스크롤 없이 HTTP 응답만으로 검색 결과 데이터를 얻는다.
+결과 dict로의 변환은 YouTubeMobileCrawler.parse_initial_data가 담당한다.
+"""
+import json
+import os
+import re
+
+import requests
+
+YOUTUBE_BASE_URL = os.getenv('YOUTUBE_BASE_URL', 'https://m.youtube.com')  # 로컬 픽스처 서버로 바꿀 때 (fixture_server.py)
+
+# 모바일: var ytInitialData = '\x7b...\x7d';  데스크톱: var ytInitialData = {...};
+_STRING_DATA_PATTERN = re.compile(r"""ytInitialData\s*=\s*'((?:[^'\\]|\\.)*)'""")
+_OBJECT_DATA_PATTERN = re.compile(r"""ytInitialData"?\]?\s*=\s*(\{)""")
+_JS_ESCAPE_PATTERN = re.compile(r'\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|.)', re.DOTALL)
+_JS_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_CONFIG_PATTERNS = {
+    'api_key': re.compile(r'"INNERTUBE_API_KEY":"([^"]+)"'),
+    'client_name': re.compile(r'"INNERTUBE_CLIENT_NAME":"([^"]+)"'),
+    'client_version': re.compile(r'"INNERTUBE_CLIENT_VERSION":"([^"]+)"'),
+}
+
+
+def _unescape_js_string(literal):
+    """JS 문자열 리터럴 이스케이프 해제 (\\xNN, \\uNNNN, \\' 등)"""
+    def replace(match):
+        escape = match.group(1)
+        if escape[0] in 'xu' and len(escape) > 1:
+            return chr(int(escape[1:], 16))
+        return _JS_SIMPLE_ESCAPES.get(escape, escape)
+    return _JS_ESCAPE_PATTERN.sub(replace, literal)
+
+
+def extract_initial_data(html):
+    """
+    HTML에서 ytInitialData 추출
+
+    Returns:
+        dict: ytInitialData (없으면 None)
+    """
+    match = _STRING_DATA_PATTERN.search(html)
+    if match:
+        try:
+            return json.loads(_unescape_js_string(match.group(1)))
+        except ValueError:
+            pass
+
+    match = _OBJECT_DATA_PATTERN.search(html)
+    if match:
+        try:
+            data, _ = json.JSONDecoder().raw_decode(html, match.start(1))
+            return data
+        except ValueError:
+            pass
+    return None
+
+
+def extract_innertube_config(html):
+    """continuation 요청에 필요한 API 키와 클라이언트 정보 추출"""
+    config = {}
+    for key, pattern in _CONFIG_PATTERNS.items():
+        match = pattern.search(html)
+        if match:
+            config[key] = match.group(1)
+    return config
+
+
+def find_search_items(data):
+    """
+    검색 결과 아이템 목록과 다음 continuation 토큰 추출
+    (첫 페이지 ytInitialData와 continuation 응답 모두 지원)
+
+    Returns:
+        tuple: ([{렌더러 이름: 데이터}, ...], continuation 토큰 또는 None)
+    """
+    sections = []
+    contents = data.get('contents', {})
+    for renderer in ('sectionListRenderer', 'twoColumnSearchResultsRenderer'):
+        if renderer in contents:
+            section_list = contents[renderer]
+            if renderer == 'twoColumnSearchResultsRenderer':
+                section_list = section_list.get('primaryContents', {}).get('sectionListRenderer', {})
+            sections = section_list.get('contents', [])
+            break
+
+    for command in data.get('onResponseReceivedCommands', []):
+        action = command.get('appendContinuationItemsAction') or command.get('reloadContinuationItemsCommand') or {}
+        sections.extend(action.get('continuationItems', []))
+
+    items = []
+    token = None
+    for section in sections:
+        if 'itemSectionRenderer' in section:
+            items.extend(section['itemSectionRenderer'].get('contents', []))
+        elif 'continuationItemRenderer' in section:
+            endpoint = section['continuationItemRenderer'].get('continuationEndpoint', {})
+            token = endpoint.get('continuationCommand', {}).get('token') or token
+    return items, token
+
+
+def fetch_search_page(keyword, user_agent, base_url=YOUTUBE_BASE_URL, session=None, timeout=10):
+    """모바일 검색 페이지 HTML 요청"""
+    session = session or requests.Session()
+    response = session.get(
+        f"{base_url}/results",
+        params={'search_query': keyword},
+        headers={'User-Agent': user_agent, 'Accept-Language': 'ko-KR,ko;q=0.9'},
+        timeout=timeout
+    )
+    response.raise_for_status()
+    return response
+
+
+def fetch_continuation(token, config, user_agent, base_url=YOUTUBE_BASE_URL, session=None, timeout=10):
+    """다음 검색 결과 페이지 (스크롤로 불러오던 부분) 요청"""
+    session = session or requests.Session()
+    payload = {
+        'context': {
+            'client': {
+                'clientName': config.get('client_name', 'MWEB'),
+                'clientVersion': config.get('client_version', '2.20240101.00.00'),
+                'hl': 'ko',
+                'gl': 'KR',
+            }
+        },
+        'continuation': token,
+    }
+    response = session.post(
+        f"{base_url}/youtubei/v1/search",
+        params={'key': config['api_key']} if config.get('api_key') else None,
+        json=payload,
+        headers={'User-Agent': user_agent},
+        timeout=timeout
+    )
+    response.raise_for_status()
+    return response
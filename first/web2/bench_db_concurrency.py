@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""DB 동시 접근 확인 - 읽기/쓰기 스레드를 섞어 실행하고 잠금 오류 수를 센다
+
+라우트와 같이 작업마다 연결을 열고 닫으며, 쓰기 스레드는 뉴스 저장(insert_news)과
+조회 후 갱신(클리핑 설정 변경), 읽기 스레드는 뉴스 목록/저장 목록 조회를 반복한다.
+connect_db (sqlite_tuning.py 설정)와 설정 없는 sqlite3.connect를 비교하고,
+foreign_keys 설정으로 저장 목록 삭제 시 항목이 함께 삭제되는지도 확인한다.
+
+    python bench_db_concurrency.py [--seconds 5] [--readers 8] [--writers 4]
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('SNAPSHOTS', '0')
+
+import web2_app  # noqa: E402
+import sqlite_tuning  # noqa: E402
+
+
+def plain_connect():
+    """설정 없는 연결 (기존 방식, 잠금 대기 기본값 5초)"""
+    return sqlite3.connect(web2_app.DB_PATH)
+
+
+def tuned_connect():
+    return web2_app.connect_db()
+
+
+def seed(connect):
+    conn = connect()
+    c = conn.cursor()
+    c.execute("INSERT INTO clippings (name, keywords) VALUES ('벤치마크', '브랜드')")
+    c.execute("INSERT INTO saved_lists (name) VALUES ('벤치마크')")
+    conn.commit()
+    conn.close()
+
+
+def write_news(connect, worker, counter):
+    conn = connect()
+    try:
+        c = conn.cursor()
+        news_list = [{'title': f'기사 {worker}-{counter}-{i}', 'link': f'https://example.com/{worker}/{counter}/{i}',
+                      'source': '예시뉴스', 'published_time': '1시간 전'} for i in range(20)]
+        web2_app.insert_news(c, news_list, '브랜드')
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def update_clipping(connect, worker, counter):
+    """조회 후 갱신 (스케줄러의 클리핑 확인/갱신과 같은 형태)"""
+    conn = connect()
+    try:
+        c = conn.cursor()
+        c.execute('SELECT id, max_articles FROM clippings WHERE is_active = 1')
+        rows = c.fetchall()
+        time.sleep(0.002)
+        for clipping_id, max_articles in rows:
+            c.execute('UPDATE clippings SET max_articles = ? WHERE id = ?', ((max_articles % 20) + 1, clipping_id))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def read_news(connect, worker, counter):
+    conn = connect()
+    try:
+        c = conn.cursor()
+        c.execute('''
+            SELECT id, title, link, source, published_time, created_at, published_date
+            FROM news ORDER BY published_date DESC, created_at DESC LIMIT 200
+        ''')
+        c.fetchall()
+        c.execute('SELECT l.id, COUNT(i.id) FROM saved_lists l LEFT JOIN saved_list_items i ON i.list_id = l.id '
+                  'GROUP BY l.id')
+        c.fetchall()
+    finally:
+        conn.close()
+
+
+def run_mixed(connect, seconds, readers, writers):
+    """{'reads', 'writes', 'locked', 'other_errors'}"""
+    stats = {'reads': 0, 'writes': 0, 'locked': 0, 'other_errors': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def loop(worker, operations, counted):
+        counter = 0
+        while time.perf_counter() < deadline:
+            operation = operations[counter % len(operations)]
+            counter += 1
+            try:
+                operation(connect, worker, counter)
+                key = counted
+            except sqlite3.OperationalError as e:
+                key = 'locked' if 'locked' in str(e) or 'busy' in str(e) else 'other_errors'
+            except sqlite3.Error:
+                key = 'other_errors'
+            with lock:
+                stats[key] += 1
+
+    threads = [threading.Thread(target=loop, args=(i, (write_news, update_clipping), 'writes'))
+               for i in range(writers)]
+    threads += [threading.Thread(target=loop, args=(writers + i, (read_news,), 'reads')) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return stats
+
+
+def check_cascade():
+    """저장 목록 삭제 시 항목도 삭제되는지 (foreign_keys=ON)"""
+    conn = web2_app.connect_db()
+    c = conn.cursor()
+    c.execute("INSERT INTO saved_lists (name) VALUES ('삭제 확인')")
+    list_id = c.lastrowid
+    c.execute("INSERT INTO saved_list_items (list_id, title, link) VALUES (?, '항목', 'https://example.com')",
+              (list_id,))
+    c.execute('DELETE FROM saved_lists WHERE id = ?', (list_id,))
+    c.execute('SELECT COUNT(*) FROM saved_list_items WHERE list_id = ?', (list_id,))
+    remaining = c.fetchone()[0]
+    conn.commit()
+    conn.close()
+    return remaining == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DB 동시 접근 확인 (읽기/쓰기 혼합)')
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=4)
+    args = parser.parse_args()
+
+    db_path = web2_app.DB_PATH
+    print(f"읽기 스레드 {args.readers}개, 쓰기 스레드 {args.writers}개, {args.seconds}초")
+    print(f"PRAGMA: {', '.join(pragma.split(' ', 1)[1] for pragma in sqlite_tuning.PRAGMAS)}\n")
+    try:
+        for name, connect in (('sqlite3.connect (설정 없음)', plain_connect), ('connect_db', tuned_connect)):
+            with tempfile.TemporaryDirectory() as directory:
+                web2_app.DB_PATH = os.path.join(directory, 'bench.db')
+                web2_app.init_db()
+                if connect is plain_connect:
+                    # init_db가 WAL로 바꿔 두므로 기본 저널 방식으로 되돌림
+                    conn = plain_connect()
+                    conn.execute('PRAGMA journal_mode=DELETE')
+                    conn.close()
+                seed(connect)
+                stats = run_mixed(connect, args.seconds, args.readers, args.writers)
+                print(f"[{name}] 읽기 {stats['reads'] / args.seconds:,.0f}회/초, "
+                      f"쓰기 {stats['writes'] / args.seconds:,.0f}회/초, "
+                      f"잠금 오류 {stats['locked']}회, 기타 오류 {stats['other_errors']}회")
+                if connect is tuned_connect:
+                    print(f"[{name}] 저장 목록 삭제 시 항목 삭제 (ON DELETE CASCADE): "
+                          f"{'예' if check_cascade() else '아니오'}")
+    finally:
+        web2_app.DB_PATH = db_path
+
+
+if __name__ == '__main__':
+    main()
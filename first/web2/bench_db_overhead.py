@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""요청당 DB 오버헤드 측정 - 요청마다 새 연결 vs 연결 풀 (db_pool.py)
+
+임시 DB에 저장 목록/클리핑을 넣고 Flask 테스트 클라이언트로 조회 라우트를 반복 호출해
+요청당 지연 시간을 비교한다. 라우트 밖의 DB 비용(연결 대여 + 조회 1회 + 반납)도 따로 잰다.
+풀을 끈 경우(max_idle=0)가 기존 방식(요청마다 sqlite3.connect 후 close)과 같다.
+
+    python bench_db_overhead.py [--requests 2000] [--threads 1]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('SNAPSHOTS', '0')
+
+import web2_app  # noqa: E402
+
+ROUTES = ('/api/saved-lists', '/api/clipping/list', '/api/clipping/1', '/api/saved-lists/1')
+
+
+def seed():
+    conn = web2_app.connect_db()
+    c = conn.cursor()
+    for i in range(20):
+        c.execute("INSERT INTO clippings (name, keywords) VALUES (?, '브랜드,신제품')", (f'클리핑 {i}',))
+        c.execute('INSERT INTO saved_lists (name) VALUES (?)', (f'목록 {i}',))
+    c.executemany('INSERT INTO saved_list_items (list_id, title, link) VALUES (1, ?, ?)',
+                  [(f'기사 {i}', f'https://example.com/{i}') for i in range(50)])
+    conn.commit()
+    conn.close()
+
+
+def time_requests(count, threads):
+    """라우트를 돌아가며 호출, 요청당 지연 시간 목록 (밀리초)"""
+    timings = []
+    lock = threading.Lock()
+
+    def worker(n):
+        client = web2_app.app.test_client()
+        local = []
+        for i in range(n):
+            started = time.perf_counter()
+            response = client.get(ROUTES[i % len(ROUTES)])
+            local.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.get_data(as_text=True)
+        with lock:
+            timings.extend(local)
+
+    workers = [threading.Thread(target=worker, args=(count // threads,)) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return timings
+
+
+def time_db_only(count):
+    """연결 대여 + 조회 1회 + 반납, 호출당 지연 시간 목록 (밀리초)"""
+    timings = []
+    for _ in range(count):
+        started = time.perf_counter()
+        with web2_app.db_pool.connection() as conn:
+            conn.execute('SELECT id, name, created_at FROM saved_lists ORDER BY created_at DESC').fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def describe(timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    return f"평균 {statistics.mean(timings):.3f}ms, 중앙값 {statistics.median(timings):.3f}ms, p95 {p95:.3f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='요청당 DB 오버헤드 측정')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=1)
+    args = parser.parse_args()
+
+    db_path = web2_app.DB_PATH
+    max_idle = web2_app.db_pool.max_idle
+    print(f"요청 {args.requests}회, 스레드 {args.threads}개, 라우트: {', '.join(ROUTES)}\n")
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            web2_app.DB_PATH = os.path.join(directory, 'bench.db')
+            web2_app.init_db()
+            seed()
+            for name, idle in (('요청마다 새 연결', 0), ('연결 풀', max(max_idle, args.threads))):
+                web2_app.db_pool.reset()
+                web2_app.db_pool.max_idle = idle
+                time_requests(min(200, args.requests), args.threads)  # 예열
+                request_timings = time_requests(args.requests, args.threads)
+                db_timings = time_db_only(args.requests)
+                print(f"[{name}] 요청: {describe(request_timings)}")
+                print(f"[{name}] DB만: {describe(db_timings)}")
+            print(f"\n[DB 연결 풀] {web2_app.db_pool.summary()}")
+            web2_app.db_pool.reset()
+    finally:
+        web2_app.db_pool.max_idle = max_idle
+        web2_app.DB_PATH = db_path
+
+
+if __name__ == '__main__':
+    main()
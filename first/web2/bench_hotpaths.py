@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""결과 1건마다 실행되는 함수(핫패스) 마이크로 벤치마크
+
+저장된 페이지(fixtures/*.html)로 다음 함수를 반복 실행해 초당 실행 횟수, 호출당 지연 백분위,
+호출당 최대 메모리 할당을 측정하고 기준값(bench_baseline.json)과 비교한다.
+
+    parse_published_time, parse_relative_times (배치), extract_google_news (crawl_news의 구글 SoaBEf 루프),
+    extract_naver_news (네이버 카드 루프), extract_article_content, summarize_with_ai
+
+    python bench_hotpaths.py                 # 측정 후 기준값과 비교
+    python bench_hotpaths.py --save          # 현재 결과를 기준값으로 저장
+    python bench_hotpaths.py --check         # 기준값보다 --tolerance 배 이상 느려진 항목이 있으면 종료 코드 1
+
+기준값은 측정한 장비에 따라 다르므로 같은 장비에서 비교한다 (파일에 측정 환경 기록).
+메모리는 tracemalloc 기준 (lxml 등 C 라이브러리 내부 할당은 포함되지 않음).
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('SNAPSHOTS', '0')  # 벤치마크 중 스냅샷 저장 안 함
+
+import web2_app  # noqa: E402
+import common_path  # noqa: E402,F401
+from html_parser import PARSER, make_soup  # noqa: E402
+from text_parsers import parse_relative_times  # noqa: E402
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BASE_DIR, 'fixtures')
+BASELINE_PATH = os.path.join(BASE_DIR, 'bench_baseline.json')
+
+PUBLISHED_TIMES = [
+    '5분 전', '3시간 전', '1일 전', '2주 전', '4개월 전', '1년 전', '10분전', '2025. 7. 2.',
+    '2024.12.31.', '시간 정보 없음', '어제', '방금 전',
+]
+
+
+def _read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def cases():
+    """{이름: 인자 없는 호출 함수} - 입력 준비(파싱 등)는 측정에서 제외"""
+    google_articles = make_soup(_read_fixture('google_news.html')).find_all('div', class_=web2_app.GOOGLE_NEWS_CLASS)
+    naver_items = make_soup(_read_fixture('naver_news.html')).select(web2_app.NAVER_NEWS_SELECTOR)
+    article_html = _read_fixture('naver_article.html')
+    article_url = 'https://n.news.naver.com/article/100/0000000000'
+    article_content = web2_app.extract_article_content(article_html, article_url)
+
+    published_times = itertools.cycle(PUBLISHED_TIMES)
+    return {
+        'parse_published_time': lambda: web2_app.parse_published_time(next(published_times)),
+        f'parse_relative_times ({len(PUBLISHED_TIMES)}개 배치)': lambda: parse_relative_times(PUBLISHED_TIMES),
+        f'extract_google_news ({len(google_articles)}건)': lambda: web2_app.extract_google_news(google_articles, '브랜드'),
+        f'extract_naver_news ({len(naver_items)}건)': lambda: web2_app.extract_naver_news(naver_items),
+        'extract_article_content': lambda: web2_app.extract_article_content(article_html, article_url),
+        'summarize_with_ai': lambda: web2_app.summarize_with_ai(article_content, '브랜드 기사'),
+    }
+
+
+def measure(func, min_seconds, min_calls):
+    """호출 하나씩 시간 측정 (min_seconds 이상, min_calls회 이상), 이후 tracemalloc으로 할당 측정"""
+    for _ in range(min(min_calls, 10)):
+        func()  # 워밍업
+
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < min_calls or time.perf_counter() - started < min_seconds:
+        call_started = time.perf_counter_ns()
+        func()
+        timings.append(time.perf_counter_ns() - call_started)
+    total = sum(timings) / 1e9
+
+    peaks = []
+    tracemalloc.start()
+    for _ in range(min(len(timings), 50)):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'calls': len(timings),
+        'ops_per_sec': round(len(timings) / total, 1),
+        'p50_us': round(_percentile(timings, 50) / 1000, 2),
+        'p95_us': round(_percentile(timings, 95) / 1000, 2),
+        'p99_us': round(_percentile(timings, 99) / 1000, 2),
+        'peak_alloc_bytes': int(sum(peaks) / len(peaks)),
+    }
+
+
+def _percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))]
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'html_parser': PARSER,
+    }
+
+
+def load_baseline():
+    try:
+        with open(BASELINE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='핫패스 마이크로 벤치마크')
+    parser.add_argument('--seconds', type=float, default=1.0, help='항목당 최소 측정 시간 (초)')
+    parser.add_argument('--calls', type=int, default=200, help='항목당 최소 호출 수')
+    parser.add_argument('--save', action='store_true', help='결과를 기준값 파일로 저장')
+    parser.add_argument('--check', action='store_true', help='느려진 항목이 있으면 종료 코드 1')
+    parser.add_argument('--tolerance', type=float, default=1.5, help='느려짐 판정 배수 (p50 기준)')
+    parser.add_argument('--filter', default='', help='이름에 이 문자열이 있는 항목만')
+    args = parser.parse_args()
+
+    baseline = load_baseline()
+    base_results = (baseline or {}).get('results', {})
+    results = {}
+    regressions = []
+
+    print(f"HTML 파서: {PARSER}, 기준값: {'있음' if baseline else '없음'} ({os.path.basename(BASELINE_PATH)})")
+    print(f"{'항목':<34} {'ops/s':>10} {'p50 µs':>9} {'p95 µs':>9} {'p99 µs':>9} {'할당 KB':>9}  기준 대비")
+    for name, func in cases().items():
+        if args.filter not in name:
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = measure(func, args.seconds, args.calls)
+        results[name] = result
+
+        compared = ''
+        base = base_results.get(name)
+        if base:
+            ratio = result['p50_us'] / base['p50_us'] if base['p50_us'] else 1.0
+            compared = f"{ratio:.2f}배"
+            if ratio > args.tolerance:
+                compared += ' (느려짐)'
+                regressions.append(name)
+        print(f"{name:<34} {result['ops_per_sec']:>10.0f} {result['p50_us']:>9.1f} {result['p95_us']:>9.1f} "
+              f"{result['p99_us']:>9.1f} {result['peak_alloc_bytes'] / 1024:>9.1f}  {compared}")
+
+    if args.save:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            # --filter로 일부만 측정한 경우 나머지 항목의 기준값은 유지
+            json.dump({'environment': environment(), 'results': dict(base_results, **results)},
+                      f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"\n기준값 저장: {BASELINE_PATH}")
+
+    if regressions:
+        print(f"\n기준값보다 {args.tolerance}배 이상 느려진 항목: {', '.join(regressions)}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
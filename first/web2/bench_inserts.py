@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""뉴스 저장 벤치마크 - 행마다 INSERT vs insert_news (executemany + INSERT OR IGNORE)
+
+임시 DB에 기사 N건(일부는 이미 있는 링크)을 저장하며 초당 저장 행 수를 비교한다.
+
+    python bench_inserts.py                       # 1,000건 / 100,000건
+    python bench_inserts.py --sizes 5000 --duplicates 0.3
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+os.environ.setdefault('SNAPSHOTS', '0')
+
+import web2_app  # noqa: E402
+
+
+def make_news(count, duplicates):
+    """기사 count건, 그중 duplicates 비율만큼은 앞 기사와 같은 링크"""
+    unique = max(1, int(count * (1 - duplicates)))
+    return [{
+        'title': f'벤치마크 기사 {i} - 브랜드 신제품 출시 소식',
+        'link': f'https://news.example.com/article/{i % unique}',
+        'source': '예시뉴스',
+        'published_time': f'{i % 23 + 1}시간 전',
+        'published_date': '2025-07-02 10:00:00',
+    } for i in range(count)]
+
+
+def insert_each(c, news_list, keyword):
+    """기존 방식: 기사마다 execute, 중복은 IntegrityError로 건너뜀"""
+    inserted = 0
+    for news in news_list:
+        try:
+            c.execute('''
+                INSERT INTO news (title, link, source, published_time, published_date, keyword)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (news['title'], news['link'], news['source'], news['published_time'],
+                  news.get('published_date'), keyword))
+            inserted += 1
+        except sqlite3.IntegrityError:
+            pass
+    return inserted, len(news_list) - inserted
+
+
+def run(method, news_list):
+    """빈 DB에 저장, (초, 저장 수, 건너뛴 수)"""
+    with tempfile.TemporaryDirectory() as directory:
+        web2_app.DB_PATH = os.path.join(directory, 'bench.db')
+        web2_app.init_db()
+        conn = web2_app.connect_db()
+        c = conn.cursor()
+        started = time.perf_counter()
+        inserted, skipped = method(c, news_list, '벤치마크')
+        conn.commit()
+        elapsed = time.perf_counter() - started
+        conn.close()
+    return elapsed, inserted, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 저장 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000])
+    parser.add_argument('--duplicates', type=float, default=0.1, help='이미 있는 링크 비율 (0~1)')
+    args = parser.parse_args()
+
+    db_path = web2_app.DB_PATH
+    try:
+        print(f"{'건수':>8} {'방식':<14} {'초':>8} {'행/초':>12} {'저장':>8} {'건너뜀':>8}")
+        for size in args.sizes:
+            news_list = make_news(size, args.duplicates)
+            for name, method in (('행마다 INSERT', insert_each), ('insert_news', web2_app.insert_news)):
+                elapsed, inserted, skipped = run(method, news_list)
+                print(f"{size:>8} {name:<14} {elapsed:>8.3f} {size / elapsed:>12,.0f} {inserted:>8} {skipped:>8}")
+    finally:
+        web2_app.DB_PATH = db_path
+
+
+if __name__ == '__main__':
+    main()
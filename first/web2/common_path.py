@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+저장소 최상위 common/ (deepen1과 first/web2가 함께 쓰는 모듈)을 import 경로에 추가
+
+common/의 모듈(html_parser, json_response 등)을 import하는 파일은 그보다 먼저 import한다.
+
+    import common_path  # noqa: F401
+    from html_parser import make_soup
+"""
+import os
+import sys
+
+COMMON_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+
+if COMMON_DIR not in sys.path:
+    sys.path.append(COMMON_DIR)
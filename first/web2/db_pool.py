@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 연결 풀
+라우트(요청마다 get_db), 스케줄러 자동 전송이 함께 사용
+
+- 스레드마다 연결 하나: 같은 스레드에서 다시 acquire하면 같은 연결 (중첩 횟수만 셈)
+- 반납한 연결은 닫지 않고 대기 목록에 두었다가 다음 요청 스레드가 재사용
+  (연결마다 PRAGMA 적용, 스키마 읽기, 페이지 캐시, 준비된 SQL 문 캐시를 다시 만들지 않음)
+- 반납 시 커밋하지 않은 트랜잭션은 롤백 (오류로 중간에 끝난 요청이 잠금을 쥔 채 풀에 돌아가지 않음)
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# 풀 설정 (환경변수로 조정)
+DB_POOL_MAX_IDLE = int(os.getenv('DB_POOL_MAX_IDLE', '4'))  # 보관할 유휴 연결 수, 0이면 요청마다 연결을 새로 열고 닫음
+
+
+class SQLitePool:
+    """
+    스레드별로 빌려 주는 SQLite 연결 풀
+
+    - connection(): with 문으로 연결을 빌리고 끝나면 (오류가 나도) 자동 반납
+    - 반납 시 롤백에 실패한 연결은 폐기
+    - max_idle 개까지만 보관, 0이면 반납할 때마다 닫음 (풀 사용 안 함)
+    """
+
+    def __init__(self, factory, max_idle=DB_POOL_MAX_IDLE):
+        self.max_idle = max_idle
+        self._factory = factory  # 인자 없이 호출하면 새 연결 (check_same_thread=False 필요)
+        self._idle = []  # 마지막에 반납한 연결부터 재사용 (캐시가 따뜻함)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {
+            'hits': 0,          # 대기 중인 연결 재사용
+            'misses': 0,        # 새 연결 생성
+            'nested': 0,        # 이미 빌린 스레드가 다시 요청
+            'rollbacks': 0,     # 반납 시 커밋하지 않은 트랜잭션 롤백
+            'discarded': 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 대여 / 반납
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def connection(self):
+        """연결 대여 (with pool.connection() as conn:)"""
+        conn = self.acquire()
+        try:
+            yield conn
+        except Exception:
+            self._rollback(conn)
+            raise
+        finally:
+            self.release()
+
+    def acquire(self):
+        """현재 스레드의 연결 (없으면 대기 목록에서 꺼내거나 생성, 직접 release 호출 필요)"""
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            self._local.depth += 1
+            self._count('nested')
+            return held
+
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+            self._stats['hits' if conn is not None else 'misses'] += 1
+        if conn is None:
+            conn = self._factory()
+        self._local.conn = conn
+        self._local.depth = 1
+        return conn
+
+    def release(self):
+        """현재 스레드의 연결 반납 (중첩 대여는 가장 바깥 반납에서만 풀로 돌아감)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+        self._local.conn = None
+
+        if not self._rollback(conn):
+            self._discard(conn)
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        self._discard(conn, count=False)
+
+    # ------------------------------------------------------------------
+    # 수명 관리
+    # ------------------------------------------------------------------
+
+    def reset(self):
+        """대기 중인 연결 모두 닫기 (DB 파일을 바꿨을 때, 종료 시)"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def stats(self):
+        """풀 사용 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['idle'] = len(self._idle)
+        stats['max_idle'] = self.max_idle
+        return stats
+
+    def summary(self):
+        """로그용 한 줄 요약"""
+        stats = self.stats()
+        return (f"hit {stats['hits']} / miss {stats['misses']} / 중첩 {stats['nested']}, "
+                f"롤백 {stats['rollbacks']} / 폐기 {stats['discarded']}, 대기 {stats['idle']}/{stats['max_idle']}")
+
+    # ------------------------------------------------------------------
+    # 내부 함수
+    # ------------------------------------------------------------------
+
+    def _rollback(self, conn):
+        """커밋하지 않은 트랜잭션 롤백, 연결을 계속 쓸 수 있으면 True"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+                self._count('rollbacks')
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn, count=True):
+        if count:
+            self._count('discarded')
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""
+헤드리스 Chrome 드라이버 풀
+/api/crawl, /api/clipping/<id>/send, 스케줄러 자동 전송이 함께 사용
+"""
+
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+CHROME_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+def create_headless_driver():
+    """헤드리스 Chrome 드라이버 생성 (기존 크롤링과 동일한 옵션)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # 브라우저 창 숨김
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_argument(f'user-agent={CHROME_USER_AGENT}')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+
+    service = Service(_chromedriver_path())
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def _chromedriver_path():
+    """ChromeDriverManager().install()은 느리므로 한 번만 실행"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+class PooledDriver:
+    """풀에서 대여한 드라이버 (get 호출 횟수를 세어 재활용 시점 판단)"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.page_loads = 0
+        self.lease_wait = 0.0  # 마지막 대여 시 대기 시간 (초)
+        self.created_at = time.time()
+
+    def get(self, url):
+        self.page_loads += 1
+        return self.driver.get(url)
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+
+class DriverPool:
+    """
+    미리 띄워둔 헤드리스 Chrome 드라이버 풀
+
+    - lease(): with 문으로 드라이버를 대여하고 끝나면 자동 반납
+    - 대여 시 헬스 체크, 실패한 드라이버는 폐기 후 새로 생성
+    - max_page_loads 회 페이지 로드 후 드라이버 재생성 (메모리 누수 방지)
+    - 반납 시 쿠키/저장소를 지우고 빈 페이지로 이동 (다음 대여는 새 브라우저와 같은 상태), 실패하면 폐기
+    """
+
+    def __init__(self, size=2, max_page_loads=50, lease_timeout=300, factory=create_headless_driver):
+        self.size = size
+        self.max_page_loads = max_page_loads
+        self.lease_timeout = lease_timeout
+        self._factory = factory
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._total = 0  # 생성되어 있는 드라이버 수 (대여 중 포함)
+        self._closed = False
+        self._stats = {
+            'hits': 0,          # 대기 중인 드라이버를 바로 대여
+            'misses': 0,        # 새 드라이버 생성 필요
+            'waits': 0,         # 풀이 가득 차 반납을 기다린 횟수
+            'created': 0,
+            'recycled': 0,
+            'unhealthy': 0,
+            'leases': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # 대여 / 반납
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """드라이버 대여 (with pool.lease() as driver:)"""
+        pooled = self.acquire(timeout)
+        broken = False
+        try:
+            yield pooled
+        except Exception:
+            broken = not self._is_healthy(pooled)
+            raise
+        finally:
+            self.release(pooled, broken=broken)
+
+    def acquire(self, timeout=None):
+        """드라이버 대여 (직접 release 호출 필요)"""
+        if self._closed:
+            raise RuntimeError('드라이버 풀이 종료되었습니다')
+
+        timeout = self.lease_timeout if timeout is None else timeout
+        started = time.perf_counter()
+        waited = False
+
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                # 여유가 있으면 새로 생성
+                with self._lock:
+                    can_create = self._total < self.size
+                    if can_create:
+                        self._total += 1
+                if can_create:
+                    try:
+                        pooled = self._create()
+                    except Exception:
+                        with self._lock:
+                            self._total -= 1
+                        raise
+                    self._record_lease('misses', started, pooled)
+                    return pooled
+
+                # 풀이 가득 찬 경우 반납 대기
+                waited = True
+                remaining = timeout - (time.perf_counter() - started)
+                if remaining <= 0:
+                    raise TimeoutError(f'드라이버 대여 대기 시간 초과 ({timeout}초)')
+                try:
+                    pooled = self._idle.get(timeout=min(remaining, 1.0))
+                except queue.Empty:
+                    continue
+
+            if self._is_healthy(pooled):
+                self._record_lease('waits' if waited else 'hits', started, pooled)
+                return pooled
+            self._count('unhealthy')
+            self._discard(pooled)
+
+    def release(self, pooled, broken=False):
+        """드라이버 반납 (고장났거나 재활용 한도를 넘거나 초기화에 실패하면 폐기)"""
+        if broken:
+            self._count('unhealthy')
+            self._discard(pooled)
+            return
+        if self._closed:
+            self._discard(pooled)
+            return
+        if self.max_page_loads and pooled.page_loads >= self.max_page_loads:
+            self._count('recycled')
+            self._discard(pooled)
+            return
+        if not self._reset(pooled):
+            self._count('unhealthy')
+            self._discard(pooled)
+            return
+        self._idle.put(pooled)
+
+    def is_broken(self, pooled, error):
+        """크롤링 중 오류가 드라이버 세션 자체의 문제인지 (True면 release(broken=True)로 폐기)"""
+        from selenium.common.exceptions import WebDriverException
+        return isinstance(error, WebDriverException) and not self._is_healthy(pooled)
+
+    # ------------------------------------------------------------------
+    # 수명 관리
+    # ------------------------------------------------------------------
+
+    def warmup(self, count=None):
+        """드라이버를 미리 띄워둠 (서버 시작 시 백그라운드에서 호출)"""
+        count = self.size if count is None else min(count, self.size)
+        for _ in range(count):
+            with self._lock:
+                if self._total >= self.size:
+                    break
+                self._total += 1
+            try:
+                self._idle.put(self._create())
+            except Exception as e:
+                with self._lock:
+                    self._total -= 1
+                print(f"[드라이버 풀] 예열 실패: {str(e)}")
+                break
+
+    def shutdown(self):
+        """대기 중인 드라이버 모두 종료"""
+        self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(pooled)
+
+    def stats(self):
+        """풀 사용 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = self.size
+            stats['total'] = self._total
+        stats['idle'] = self._idle.qsize()
+        stats['in_use'] = stats['total'] - stats['idle']
+        leases = stats['leases']
+        stats['wait_time_avg'] = round(stats['wait_time_total'] / leases, 4) if leases else 0.0
+        stats['wait_time_total'] = round(stats['wait_time_total'], 4)
+        stats['wait_time_max'] = round(stats['wait_time_max'], 4)
+        return stats
+
+    def summary(self):
+        """로그용 한 줄 요약"""
+        stats = self.stats()
+        return (f"hit {stats['hits']} / miss {stats['misses']} / 대기 {stats['waits']}, "
+                f"사용 중 {stats['in_use']}/{stats['size']}, "
+                f"평균 대기 {stats['wait_time_avg']:.2f}초 (최대 {stats['wait_time_max']:.2f}초)")
+
+    # ------------------------------------------------------------------
+    # 내부 함수
+    # ------------------------------------------------------------------
+
+    def _create(self):
+        started = time.perf_counter()
+        pooled = PooledDriver(self._factory())
+        self._count('created')
+        print(f"[드라이버 풀] 새 드라이버 생성 ({time.perf_counter() - started:.1f}초)")
+        return pooled
+
+    def _discard(self, pooled):
+        with self._lock:
+            self._total -= 1
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    def _reset(self, pooled):
+        """이전 대여의 세션 상태 제거 (구글 동의/네이버 세션 쿠키, 저장소, 열린 페이지)"""
+        driver = pooled.driver
+        try:
+            # 저장소는 현재 페이지의 출처 기준이므로 빈 페이지로 이동하기 전에 지움
+            driver.execute_script('try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}')
+            if hasattr(driver, 'execute_cdp_cmd'):
+                # delete_all_cookies()는 현재 도메인 쿠키만 지우므로 Chrome에서는 전체 삭제
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            else:
+                driver.delete_all_cookies()
+            driver.get('about:blank')  # 재활용 한도(page_loads)에는 세지 않음
+            return True
+        except Exception as e:
+            print(f"[드라이버 풀] 드라이버 초기화 실패, 폐기: {str(e)}")
+            return False
+
+    def _is_healthy(self, pooled):
+        try:
+            pooled.driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
+    def _record_lease(self, key, started, pooled):
+        wait_time = time.perf_counter() - started
+        pooled.lease_wait = wait_time
+        with self._lock:
+            self._stats[key] += 1
+            self._stats['leases'] += 1
+            self._stats['wait_time_total'] += wait_time
+            self._stats['wait_time_max'] = max(self._stats['wait_time_max'], wait_time)
+
+
+# 프로세스 전역 풀 (환경변수로 크기 조정)
+driver_pool = DriverPool(
+    size=int(os.getenv('DRIVER_POOL_SIZE', '2')),
+    max_page_loads=int(os.getenv('DRIVER_POOL_MAX_PAGE_LOADS', '50')),
+    lease_timeout=int(os.getenv('DRIVER_POOL_LEASE_TIMEOUT', '300')),
+)
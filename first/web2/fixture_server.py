@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 픽스처 서버 - 구글 뉴스 검색/네이버 뉴스 검색/기사 페이지를 흉내 내는 HTTP 서버
+
+실제 구글/네이버 없이 crawl_news, 클리핑 발송(기사 본문 크롤링)을 끝까지 실행해
+지연 시간/처리량을 재현 가능하게 측정한다. 저장된 페이지(fixtures/*.html)를 돌려주고,
+응답 지연과 오류 응답을 설정한 비율로 섞을 수 있다.
+
+    python fixture_server.py [--port 8901] [--latency-ms 50] [--jitter-ms 20] [--error-rate 0.05]
+
+앱은 환경변수로 이 서버를 가리키게 한다.
+
+    GOOGLE_BASE_URL=http://127.0.0.1:8901 NAVER_SEARCH_BASE_URL=http://127.0.0.1:8901 python web2_app.py
+
+경로:
+    GET /search          구글 뉴스 검색 (start 파라미터로 페이지, --pages 이후는 결과 없는 페이지)
+    GET /search.naver    네이버 뉴스 검색 (start 파라미터로 페이지)
+    GET /article/...     기사 페이지 (검색 결과의 기사 링크는 모두 이 서버의 /article/ 로 바뀜)
+    GET /_fixture/stats  경로별 요청 수, 주입한 오류 수
+"""
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BASE_DIR, 'fixtures')
+
+EMPTY_PAGE = '<!DOCTYPE html><html><head><meta charset="utf-8"></head><body><div id="search"></div></body></html>'
+PAGE_SIZE = 10
+
+_LINK_PATTERN = re.compile(r'href="https?://([^"]+)"')
+
+
+def _read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _local_links(html, page):
+    """기사 링크를 이 서버의 /article/ 로 바꿈 (2페이지부터는 링크가 겹치지 않도록 페이지 표시 추가)"""
+    suffix = f'-p{page}' if page else ''
+    return _LINK_PATTERN.sub(lambda match: f'href="{{base}}/article/{match.group(1)}{suffix}"', html)
+
+
+class FixtureState:
+    """서버 설정 (지연/오류 주입)과 요청 통계 - 요청 처리 스레드끼리 공유"""
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, error_status=503, pages=3, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.pages = pages
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = {}
+        self.errors = 0
+
+        # 링크의 {base} 자리는 요청의 Host로 채움 (페이지 CSS에 중괄호가 있어 format 대신 replace)
+        self.google_pages = [_local_links(_read_fixture('google_news.html'), page) for page in range(pages)]
+        self.naver_pages = [_local_links(_read_fixture('naver_news.html'), page) for page in range(pages)]
+        self.article_page = _read_fixture('naver_article.html').encode('utf-8')
+
+    def next_response(self, route):
+        """(지연 초, 오류 여부) - 시드가 같으면 같은 순서로 재현"""
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+            delay = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        return delay / 1000, failed
+
+    def stats(self):
+        with self._lock:
+            return {'requests': dict(self.requests), 'errors': self.errors}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """구글 뉴스/네이버 뉴스/기사 경로별 응답"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        state = self.server.state
+        start = int(query.get('start', ['0'])[0] or 0)
+        if url.path == '/_fixture/stats':
+            self._send(200, json.dumps(state.stats()).encode('utf-8'), 'application/json')
+        elif url.path == '/search':
+            self._respond('google_news', self._search_page(state.google_pages, start // PAGE_SIZE))
+        elif url.path == '/search.naver':
+            # 네이버 start는 1, 11, 21, ...
+            self._respond('naver_news', self._search_page(state.naver_pages, max(start - 1, 0) // PAGE_SIZE))
+        elif url.path.startswith('/article/'):
+            self._respond('article', state.article_page)
+        else:
+            self._send(404, b'not found', 'text/plain')
+
+    def _search_page(self, pages, page):
+        if page >= len(pages):
+            return EMPTY_PAGE.encode('utf-8')
+        base = f"http://{self.headers.get('Host') or '%s:%d' % self.server.server_address}"
+        return pages[page].replace('{base}', base).encode('utf-8')
+
+    def _respond(self, route, body):
+        delay, failed = self.server.state.next_response(route)
+        if delay:
+            time.sleep(delay)
+        if failed:
+            self._send(self.server.state.error_status, b'injected error', 'text/plain')
+        else:
+            self._send(200, body, 'text/html; charset=UTF-8')
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 출력하지 않음 (벤치마크 출력이 묻힘)
+
+
+def start_server(host='127.0.0.1', port=0, **options):
+    """
+    백그라운드 스레드에서 서버 시작 (벤치마크 스크립트용)
+
+    Args:
+        port: 0이면 빈 포트 자동 선택
+        options: FixtureState 설정 (latency_ms, jitter_ms, error_rate, error_status, pages, seed)
+
+    Returns:
+        tuple: (server, base_url) - 끝나면 server.shutdown()
+    """
+    server = ThreadingHTTPServer((host, port), FixtureHandler)
+    server.daemon_threads = True
+    server.state = FixtureState(**options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='구글 뉴스/네이버 뉴스 로컬 픽스처 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8901)
+    parser.add_argument('--latency-ms', type=float, default=0, help='응답 지연 (밀리초)')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='지연에 더할 무작위 시간 최대값 (밀리초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    parser.add_argument('--error-status', type=int, default=503, help='오류 응답 상태 코드')
+    parser.add_argument('--pages', type=int, default=3, help='검색 결과 페이지 수')
+    parser.add_argument('--seed', type=int, default=1, help='지연/오류 난수 시드')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), FixtureHandler)
+    server.daemon_threads = True
+    server.state = FixtureState(args.latency_ms, args.jitter_ms, args.error_rate, args.error_status,
+                                args.pages, args.seed)
+    print(f"[픽스처 서버] http://{args.host}:{args.port} "
+          f"(지연 {args.latency_ms}+{args.jitter_ms}ms, 오류 {args.error_rate:.0%} → {args.error_status})")
+    print(f"  GOOGLE_BASE_URL=http://{args.host}:{args.port} NAVER_SEARCH_BASE_URL=http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
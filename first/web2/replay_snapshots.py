@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""저장된 스냅샷으로 뉴스 검색 결과 다시 파싱 (네트워크/브라우저 없이)
+
+선택자 수정 후 crawl_news가 가져온 페이지로 결과를 다시 만들고, --write면 news 테이블을 교체한다.
+
+    python replay_snapshots.py list [--keyword 키워드]
+    python replay_snapshots.py replay --keyword 키워드            # 최근 크롤링 재파싱 (저장 안 함)
+    python replay_snapshots.py replay --keyword 키워드 --write    # news 테이블 교체
+"""
+import argparse
+import time
+
+from web2_app import (GOOGLE_NEWS_CLASS, NAVER_NEWS_SELECTOR, connect_db,
+                      extract_google_news, extract_naver_news, insert_news)
+import common_path  # noqa: F401
+from html_parser import make_soup
+from snapshot_store import snapshot_store
+
+PROVIDERS = ('google_news', 'naver_news')
+
+
+def latest_crawl_run(keyword):
+    """crawl_news가 저장한 가장 최근 크롤링 (클리핑 발송 때 저장한 페이지는 제외)"""
+    latest = []
+    for provider in PROVIDERS:
+        for pages in snapshot_store.runs(provider, keyword).values():
+            if pages[0].load().get('source') != 'crawl':
+                continue
+            if not latest or pages[0].fetched_at >= latest[0].fetched_at:
+                latest = pages
+    if not latest:
+        return []
+    # 같은 run의 구글/네이버 페이지 모두
+    return [snapshot for provider in PROVIDERS
+            for snapshot in snapshot_store.list(provider, keyword, run=latest[0].run)]
+
+
+def parse_snapshot(record, keyword):
+    """스냅샷 한 페이지를 현재 추출 코드로 파싱"""
+    soup = make_soup(record['content'])
+    if record['provider'] == 'google_news':
+        return extract_google_news(soup.find_all('div', class_=GOOGLE_NEWS_CLASS), keyword)
+    return extract_naver_news(soup.select(NAVER_NEWS_SELECTOR))
+
+
+def list_snapshots(keyword=None):
+    for provider in PROVIDERS + ('article',):
+        runs = snapshot_store.runs(provider, keyword)
+        print(f"[{provider}] {len(runs)}회")
+        for run, pages in runs.items():
+            record = pages[0].load()
+            print(f"  {pages[0].fetched_at:%Y-%m-%d %H:%M:%S} UTC  run={run}  "
+                  f"{len(pages)}페이지  {record.get('source', '')}  '{record['keyword']}'")
+    print(f"\n전체 {snapshot_store.usage() / 1024 / 1024:.1f}MB (한도 {snapshot_store.max_bytes / 1024 / 1024:.0f}MB)")
+
+
+def replay_keyword(keyword, write=False):
+    snapshots = latest_crawl_run(keyword)
+    if not snapshots:
+        print(f"'{keyword}' 크롤링 스냅샷 없음")
+        return []
+
+    started = time.perf_counter()
+    news_list = []
+    seen = set()
+    for snapshot in snapshots:
+        record = snapshot.load()
+        page_news = parse_snapshot(record, keyword)
+        print(f"  [{snapshot.provider}] page={snapshot.page} → {len(page_news)}개")
+        for news in page_news:
+            if news['link'] not in seen:
+                seen.add(news['link'])
+                news_list.append(news)
+    print(f"run={snapshots[0].run} {len(snapshots)}페이지 → {len(news_list)}개 기사 "
+          f"({time.perf_counter() - started:.2f}초)")
+
+    if write:
+        # crawl_news와 같이 기존 뉴스를 지우고 새로 저장
+        conn = connect_db()
+        c = conn.cursor()
+        c.execute('DELETE FROM news')
+        saved, skipped = insert_news(c, news_list, keyword)
+        conn.commit()
+        conn.close()
+        print(f"→ news 테이블 교체 완료 ({saved}개 저장, 중복 {skipped}개 제외)")
+    else:
+        for news in news_list[:5]:
+            print(f"  {news['source']} | {news['title'][:60]}")
+    return news_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 스냅샷 재파싱')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = sub.add_parser('list', help='저장된 스냅샷 목록')
+    list_parser.add_argument('--keyword')
+
+    replay_parser = sub.add_parser('replay', help='스냅샷으로 다시 파싱')
+    replay_parser.add_argument('--keyword', required=True)
+    replay_parser.add_argument('--write', action='store_true', help='news 테이블 교체')
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        list_snapshots(args.keyword)
+    else:
+        replay_keyword(args.keyword, write=args.write)
+
+
+if __name__ == '__main__':
+    main()
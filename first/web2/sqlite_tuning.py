@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 연결 설정 - 모든 sqlite3 연결에 같은 PRAGMA 적용
+
+PRAGMA 목록과 설정은 deepen1과 함께 쓰는 common/sqlite_pragmas.py (WAL, synchronous, 캐시, busy_timeout, 외래 키)
+
+    cached_statements  연결당 준비된 SQL 문 캐시 (같은 SQL은 다시 컴파일하지 않음, 연결을 재사용할 때 효과)
+
+    conn = connect(DB_PATH)
+"""
+import os
+import sqlite3
+
+import common_path  # noqa: F401
+from sqlite_pragmas import PRAGMAS, SQLITE_BUSY_TIMEOUT_MS, apply_pragmas  # noqa: F401
+
+SQLITE_STATEMENT_CACHE = int(os.getenv('SQLITE_STATEMENT_CACHE', '256'))  # 연결당 준비된 SQL 문 캐시 수
+
+
+def connect(path, **kwargs):
+    """PRAGMA를 적용한 sqlite3 연결"""
+    kwargs.setdefault('timeout', SQLITE_BUSY_TIMEOUT_MS / 1000)
+    kwargs.setdefault('cached_statements', SQLITE_STATEMENT_CACHE)
+    conn = sqlite3.connect(path, **kwargs)
+    apply_pragmas(conn)
+    return conn
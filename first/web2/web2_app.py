@@ -9,12 +9,11 @@ Naver News: Selenium 크롤링
 # 앱 버전
 APP_VERSION = "1.0.8"
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, g
 from flask_cors import CORS
 import sqlite3
 import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 import re
 import sys
@@ -25,6 +24,16 @@ from dotenv import load_dotenv
 import json
 from apscheduler.schedulers.background import BackgroundScheduler
 import atexit
+import threading
+import common_path  # noqa: F401 - 저장소 최상위 common/ 모듈 경로 (html_parser, json_response 등)
+from driver_pool import driver_pool
+from html_parser import make_soup, PARSER as HTML_PARSER
+from snapshot_store import snapshot_store, new_run_id
+from text_parsers import parse_relative_time, parse_relative_times
+from sqlite_tuning import connect as sqlite_connect
+from db_pool import SQLitePool
+from json_response import (json_response, requested_fields, stats as response_stats,
+                           ENCODER as JSON_ENCODER, ENCODINGS as JSON_ENCODINGS)
 
 # 환경변수 로드
 load_dotenv()
@@ -37,9 +46,32 @@ DB_PATH = os.path.join(application_path, 'database.db')
 template_folder = os.path.join(application_path, 'public')
 static_folder = os.path.join(application_path, 'static')
 
+# 검색 요청 주소 (로컬 픽스처 서버로 바꿀 때, fixture_server.py)
+GOOGLE_BASE_URL = os.getenv('GOOGLE_BASE_URL', 'https://www.google.com')
+NAVER_SEARCH_BASE_URL = os.getenv('NAVER_SEARCH_BASE_URL', 'https://search.naver.com')
+
 app = Flask(__name__, template_folder=template_folder, static_folder=static_folder)
 CORS(app)
 
+def connect_db(**kwargs):
+    """새 DB 연결 (WAL, busy_timeout, foreign_keys 등 적용, sqlite_tuning.py)"""
+    return sqlite_connect(DB_PATH, **kwargs)
+
+# 라우트/스케줄러용 연결 풀 (스레드 간에 넘겨 쓰므로 check_same_thread=False)
+db_pool = SQLitePool(lambda: connect_db(check_same_thread=False))
+
+def get_db():
+    """요청의 DB 연결 (풀에서 빌려 요청이 끝나면 close_db에서 반납)"""
+    if 'db' not in g:
+        g.db = db_pool.acquire()
+    return g.db
+
+@app.teardown_appcontext
+def close_db(exception):
+    """요청 종료 시 연결 반납 (커밋하지 않은 트랜잭션은 롤백)"""
+    if g.pop('db', None) is not None:
+        db_pool.release()
+
 # ============================================================================
 # 뉴스 본문 크롤링 및 요약 함수
 # ============================================================================
@@ -54,8 +86,20 @@ def crawl_article_content(url):
         }
         response = requests.get(url, headers=headers, timeout=10)
         response.raise_for_status()
+        snapshot_store.save('article', url, response.text, url=url)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        return extract_article_content(response.content, url)
+    
+    except Exception as e:
+        print(f"[본문 크롤링 오류] {url}: {str(e)}")
+        return "본문을 가져올 수 없습니다."
+
+def extract_article_content(html, url):
+    """
+    기사 HTML에서 본문 추출 (crawl_article_content, 벤치마크에서 사용)
+    """
+    try:
+        soup = make_soup(html)
         
         # 본문 추출 (여러 패턴 시도)
         content = None
@@ -93,7 +137,7 @@ def crawl_article_content(url):
         return content or "본문을 가져올 수 없습니다."
     
     except Exception as e:
-        print(f"[본문 크롤링 오류] {url}: {str(e)}")
+        print(f"[본문 추출 오류] {url}: {str(e)}")
         return "본문을 가져올 수 없습니다."
 
 def summarize_with_ai(content, title=""):
@@ -160,63 +204,153 @@ def send_to_slack(webhook_url, message):
 def parse_published_time(time_str):
     """
     published_time 문자열을 실제 datetime 객체로 변환
-    예: "1시간 전" -> datetime 객체
+    예: "1시간 전" -> datetime 객체 (변환할 수 없으면 None)
+    """
+    return parse_relative_time(time_str)
+
+def add_published_dates(news_list):
+    """
+    기사 목록의 published_time을 한 번에 published_date로 변환 (같은 기준 시각)
+    """
+    published_dates = parse_relative_times([news['published_time'] for news in news_list])
+    for news, published_date in zip(news_list, published_dates):
+        news['published_date'] = published_date
+    return news_list
+
+# ============================================================================
+# 뉴스 검색 결과 추출 (크롤링과 스냅샷 재파싱이 같은 코드 사용)
+# ============================================================================
+
+GOOGLE_NEWS_CLASS = 'SoaBEf'  # 구글 뉴스 검색 결과 블록
+NAVER_NEWS_SELECTOR = 'a[data-heatmap-target=".tit"]'  # 네이버 뉴스 제목 링크
+
+def extract_google_news(articles, keyword):
     """
-    if not time_str or time_str == '시간 정보 없음':
-        return None
+    구글 뉴스 결과 블록(div.SoaBEf)에서 기사 정보 추출 (제목에 키워드가 있는 기사만)
     
-    now = datetime.now()
-    time_str = time_str.strip()
+    Returns:
+        list: [{'title', 'link', 'source', 'published_time', 'published_date'}, ...]
+    """
+    news_list = []
+    for article in articles:
+        try:
+            # 제목 찾기 (div[role="heading"])
+            title_elem = article.find('div', {'role': 'heading'})
+            if not title_elem:
+                continue
+            
+            title = title_elem.get_text(strip=True)
+            if not title or len(title) < 5:
+                continue
+            
+            # 키워드 필터
+            if keyword.lower() not in title.lower():
+                continue
+            
+            # 링크 찾기 (a href)
+            link_elem = article.find('a', href=True)
+            if not link_elem:
+                continue
+            
+            link = link_elem.get('href', '')
+            if not link or not link.startswith('http'):
+                continue
+            
+            # 출처 찾기 (span 첫 번째)
+            source = '구글뉴스'
+            spans = article.find_all('span')
+            if spans and len(spans) > 0:
+                source_text = spans[0].get_text(strip=True)
+                if source_text:
+                    source = source_text
+            
+            # 시간 찾기 (span 세 번째, 마지막)
+            published_time = '시간 정보 없음'
+            if spans and len(spans) >= 3:
+                time_text = spans[-1].get_text(strip=True)
+                if time_text:
+                    published_time = time_text
+            
+            news_list.append({'title': title, 'link': link, 'source': source, 'published_time': published_time})
+        except Exception as e:
+            continue
+    return add_published_dates(news_list)
+
+def extract_naver_news(news_items):
+    """
+    네이버 뉴스 제목 링크(a[data-heatmap-target=".tit"])에서 기사 정보 추출
     
-    try:
-        # "N분 전"
-        if '분 전' in time_str or '분전' in time_str:
-            minutes = int(re.search(r'(\d+)', time_str).group(1))
-            return now - timedelta(minutes=minutes)
-        
-        # "N시간 전"
-        elif '시간 전' in time_str or '시간전' in time_str:
-            hours = int(re.search(r'(\d+)', time_str).group(1))
-            return now - timedelta(hours=hours)
-        
-        # "N일 전"
-        elif '일 전' in time_str or '일전' in time_str:
-            days = int(re.search(r'(\d+)', time_str).group(1))
-            return now - timedelta(days=days)
-        
-        # "N주 전"
-        elif '주 전' in time_str or '주전' in time_str:
-            weeks = int(re.search(r'(\d+)', time_str).group(1))
-            return now - timedelta(weeks=weeks)
-        
-        # "N개월 전"
-        elif '개월 전' in time_str or '개월전' in time_str:
-            months = int(re.search(r'(\d+)', time_str).group(1))
-            return now - timedelta(days=months * 30)
-        
-        # "N년 전"
-        elif '년 전' in time_str or '년전' in time_str:
-            years = int(re.search(r'(\d+)', time_str).group(1))
-            return now - timedelta(days=years * 365)
-        
-        # "YYYY. M. D." 형식
-        elif re.match(r'\d{4}\.\s*\d{1,2}\.\s*\d{1,2}\.?', time_str):
-            # "2025. 7. 2." -> "2025-07-02"
-            date_match = re.search(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?', time_str)
-            if date_match:
-                year, month, day = date_match.groups()
-                return datetime(int(year), int(month), int(day))
-        
-        # 파싱 실패 시 현재 시간 반환
-        return now
+    Returns:
+        list: [{'title', 'link', 'source', 'published_time', 'published_date'}, ...]
+    """
+    news_list = []
+    for news_item in news_items:
+        try:
+            # 제목
+            title = news_item.get_text(strip=True)
+            if not title or len(title) < 5:
+                continue
+            
+            # 링크
+            link = news_item.get('href', '')
+            if not link or not link.startswith('http'):
+                continue
+            
+            # 출처 (Naver는 항상 "네이버뉴스"로 통일)
+            source = '네이버뉴스'
+            parent = news_item
+            for _ in range(10):
+                parent = parent.parent
+                if parent is None:
+                    break
+                source_span = parent.select_one('span.sds-comps-profile-info-title-text')
+                if source_span:
+                    source_text = source_span.get_text(strip=True)
+                    if source_text:
+                        source = f"네이버뉴스 ({source_text})"
+                    break
+            # 출처를 못 찾으면 기본값 '네이버뉴스' 유지
+            
+            # 시간
+            published_time = '시간 정보 없음'
+            parent = news_item
+            for _ in range(10):
+                parent = parent.parent
+                if parent is None:
+                    break
+                time_elem = parent.select_one('.sds-comps-profile-info-subtext')
+                if time_elem:
+                    published_time = time_elem.get_text(strip=True)
+                    break
+            
+            news_list.append({'title': title, 'link': link, 'source': source, 'published_time': published_time})
+        except Exception as e:
+            continue
+    return add_published_dates(news_list)
+
+def insert_news(c, news_list, keyword):
+    """
+    news 테이블에 기사 목록을 한 번에 저장 (extract_* 함수가 변환한 published_date 포함)
+    executemany + INSERT OR IGNORE: 이미 있는 링크(news.link UNIQUE)는 건너뜀
     
-    except Exception as e:
-        print(f"[파싱 오류] {time_str}: {str(e)}")
-        return now
+    Returns:
+        tuple: (저장한 수, 건너뛴 수)
+    """
+    rows = [(news['title'], news['link'], news['source'], news['published_time'],
+             news.get('published_date'), keyword) for news in news_list]
+    if not rows:
+        return 0, 0
+    c.executemany('''
+        INSERT OR IGNORE INTO news (title, link, source, published_time, published_date, keyword)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', rows)
+    # executemany의 rowcount는 실제로 추가된 행 수의 합 (무시된 행은 0)
+    inserted = c.rowcount
+    return inserted, len(rows) - inserted
 
 # 데이터베이스 초기화
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
+    conn = connect_db()
     c = conn.cursor()
     
     # 뉴스 테이블
@@ -314,14 +448,14 @@ def test_slack_webhook():
         webhook_url = data.get('webhook_url', '')
         
         if not webhook_url:
-            return jsonify({'valid': False, 'error': 'URL이 비어있습니다'}), 400
+            return json_response({'valid': False, 'error': 'URL이 비어있습니다'}), 400
         
         # Slack 웹훅 URL 형식 검증
         import re
         slack_pattern = r'^https://hooks\.slack\.com/services/[A-Z0-9]+/[A-Z0-9]+/[A-Za-z0-9]+$'
         
         if not re.match(slack_pattern, webhook_url):
-            return jsonify({'valid': False, 'error': 'Slack 웹훅 URL 형식이 올바르지 않습니다'})
+            return json_response({'valid': False, 'error': 'Slack 웹훅 URL 형식이 올바르지 않습니다'})
         
         # HEAD 요청으로 연결만 확인 (메시지 전송 없음)
         try:
@@ -342,21 +476,21 @@ def test_slack_webhook():
             # 200: OK → 정상
             # 404: Not Found → 잘못된 URL
             if response.status_code in [200, 400, 405]:
-                return jsonify({'valid': True, 'message': '웹훅 URL이 정상적으로 작동합니다'})
+                return json_response({'valid': True, 'message': '웹훅 URL이 정상적으로 작동합니다'})
             elif response.status_code == 404:
-                return jsonify({'valid': False, 'error': 'URL을 찾을 수 없습니다 (404)'})
+                return json_response({'valid': False, 'error': 'URL을 찾을 수 없습니다 (404)'})
             else:
-                return jsonify({'valid': False, 'error': f'Slack 응답 오류 (코드: {response.status_code})'})
+                return json_response({'valid': False, 'error': f'Slack 응답 오류 (코드: {response.status_code})'})
         except requests.exceptions.ConnectionError as e:
             print(f"[Slack 검증 디버그] ConnectionError: {str(e)}")
-            return jsonify({'valid': False, 'error': '연결 실패: URL이 올바르지 않습니다'})
+            return json_response({'valid': False, 'error': '연결 실패: URL이 올바르지 않습니다'})
     
     except requests.exceptions.Timeout:
-        return jsonify({'valid': False, 'error': '연결 시간 초과'})
+        return json_response({'valid': False, 'error': '연결 시간 초과'})
     except requests.exceptions.RequestException as e:
-        return jsonify({'valid': False, 'error': f'연결 실패: {str(e)}'})
+        return json_response({'valid': False, 'error': f'연결 실패: {str(e)}'})
     except Exception as e:
-        return jsonify({'valid': False, 'error': str(e)})
+        return json_response({'valid': False, 'error': str(e)})
 
 @app.route('/clipping-detail')
 def clipping_detail():
@@ -385,14 +519,14 @@ def crawl_news():
         log(f"{'='*80}")
         
         # 기존 뉴스 삭제
-        conn_clear = sqlite3.connect(DB_PATH)
+        conn_clear = get_db()
         c_clear = conn_clear.cursor()
         c_clear.execute('DELETE FROM news')
         conn_clear.commit()
-        conn_clear.close()
         
         google_news = []
         naver_news = []
+        snapshot_run = new_run_id()  # 이번 크롤링에서 가져온 페이지 묶음 (스냅샷 재파싱용)
         
         # ================================================================
         # 1. Google Search (requests + BeautifulSoup)
@@ -406,7 +540,7 @@ def crawl_news():
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             }
             
-            conn = sqlite3.connect(DB_PATH)
+            conn = get_db()
             c = conn.cursor()
             
             saved_count = 0
@@ -416,7 +550,7 @@ def crawl_news():
                 try:
                     # start 파라미터: 0, 10, 20, 30, ...
                     start = page * 10
-                    google_url = f"https://www.google.com/search?q={encoded_keyword}&tbm=nws&hl=ko&gl=KR&start={start}"
+                    google_url = f"{GOOGLE_BASE_URL}/search?q={encoded_keyword}&tbm=nws&hl=ko&gl=KR&start={start}"
                     
                     log(f"[Google] {page + 1}페이지 요청: start={start}")
                     response = requests.get(google_url, headers=headers, timeout=10)
@@ -424,9 +558,12 @@ def crawl_news():
                     
                     log(f"[Google] {page + 1}페이지 응답: 200 OK ({len(response.content)} bytes)")
                     
+                    snapshot_store.save('google_news', keyword, response.text, url=google_url,
+                                        run=snapshot_run, page=page, source='crawl')
+                    
                     # BeautifulSoup 파싱
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    articles = soup.find_all('div', class_='SoaBEf')
+                    soup = make_soup(response.content)
+                    articles = soup.find_all('div', class_=GOOGLE_NEWS_CLASS)
                     
                     log(f"[Google] {page + 1}페이지 발견: {len(articles)}개 항목")
                     
@@ -434,66 +571,13 @@ def crawl_news():
                         log(f"[Google] {page + 1}페이지에 기사 없음, 중단")
                         break
                     
-                    page_saved = 0
-                    for article in articles:
-                        try:
-                            # 제목 찾기 (div[role="heading"])
-                            title_elem = article.find('div', {'role': 'heading'})
-                            if not title_elem:
-                                continue
-                            
-                            title = title_elem.get_text(strip=True)
-                            if not title or len(title) < 5:
-                                continue
-                            
-                            # 키워드 필터
-                            if keyword.lower() not in title.lower():
-                                continue
-                            
-                            # 링크 찾기 (a href)
-                            link_elem = article.find('a', href=True)
-                            if not link_elem:
-                                continue
-                            
-                            link = link_elem.get('href', '')
-                            if not link or not link.startswith('http'):
-                                continue
-                            
-                            # 출처 찾기 (span 첫 번째)
-                            source = '구글뉴스'
-                            spans = article.find_all('span')
-                            if spans and len(spans) > 0:
-                                source_text = spans[0].get_text(strip=True)
-                                if source_text:
-                                    source = source_text
-                            
-                            # 시간 찾기 (span 세 번째, 마지막)
-                            published_time = '시간 정보 없음'
-                            if spans and len(spans) >= 3:
-                                time_text = spans[-1].get_text(strip=True)
-                                if time_text:
-                                    published_time = time_text
-                            
-                            # 시간 파싱
-                            published_date = parse_published_time(published_time)
-                            
-                            # 저장
-                            c.execute('''
-                                INSERT INTO news (title, link, source, published_time, published_date, keyword)
-                                VALUES (?, ?, ?, ?, ?, ?)
-                            ''', (title, link, source, published_time, published_date, keyword))
-                            saved_count += 1
-                            page_saved += 1
-                            
-                            if saved_count <= 3:
-                                log(f"[Google] ✓ {saved_count}: {title[:40]}...")
-                            
-                        except sqlite3.IntegrityError:
-                            pass
-                        except Exception as e:
-                            continue
+                    page_news = extract_google_news(articles, keyword)
+                    for index, news in enumerate(page_news[:max(0, 3 - saved_count)], saved_count + 1):
+                        log(f"[Google] ✓ {index}: {news['title'][:40]}...")
+                    page_saved, page_skipped = insert_news(c, page_news, keyword)
+                    saved_count += page_saved
                     
-                    log(f"[Google] {page + 1}페이지에서 {page_saved}개 저장")
+                    log(f"[Google] {page + 1}페이지에서 {page_saved}개 저장 (중복 {page_skipped}개 제외)")
                     
                     # 페이지 간 딜레이 (봇 감지 방지)
                     import time
@@ -504,7 +588,6 @@ def crawl_news():
                     continue
             
             conn.commit()
-            conn.close()
             
             log(f"[Google] 완료: 총 {saved_count}개 저장")
             
@@ -517,28 +600,17 @@ def crawl_news():
         try:
             log(f"\n[Naver] Selenium 크롤링 시작...")
             
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.chrome.service import Service
-            from webdriver_manager.chrome import ChromeDriverManager
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
             from selenium.webdriver.common.by import By
             
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')  # 브라우저 창 숨김
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            conn = sqlite3.connect(DB_PATH)
+            conn = get_db()
             c = conn.cursor()
             
+            # 드라이버 풀에서 대여 (매번 Chrome을 새로 띄우지 않음, 대여 후 바로 try로 반납 보장)
+            driver = driver_pool.acquire()
+            log(f"[Naver] 드라이버 대여 (대기 {driver.lease_wait:.2f}초)")
+            broken = False  # 세션이 죽은 드라이버는 풀로 돌려보내지 않고 폐기
             try:
                 saved_count = 0
                 
@@ -549,7 +621,7 @@ def crawl_news():
                     
                     while retry_count < max_retries and not success:
                         try:
-                            search_url = f"https://search.naver.com/search.naver?where=news&ssc=tab.news.all&query={quote(keyword)}&start={(page-1)*10+1}"
+                            search_url = f"{NAVER_SEARCH_BASE_URL}/search.naver?where=news&ssc=tab.news.all&query={quote(keyword)}&start={(page-1)*10+1}"
                             log(f"[Naver] {page}페이지 시도 (재시도: {retry_count})")
                             
                             driver.get(search_url)
@@ -562,92 +634,48 @@ def crawl_news():
                             import time
                             time.sleep(5)
                             
-                            soup = BeautifulSoup(driver.page_source, 'html.parser')
-                            news_items = soup.select('a[data-heatmap-target=".tit"]')
+                            snapshot_store.save('naver_news', keyword, driver.page_source, url=search_url,
+                                                run=snapshot_run, page=page, source='crawl')
+                            soup = make_soup(driver.page_source)
+                            news_items = soup.select(NAVER_NEWS_SELECTOR)
                             
                             log(f"[Naver] {page}페이지: {len(news_items)}개 발견")
                             
                             if len(news_items) > 0:
                                 success = True
                             
-                            for news_item in news_items:
-                                try:
-                                    # 제목
-                                    title = news_item.get_text(strip=True)
-                                    if not title or len(title) < 5:
-                                        continue
-                                    
-                                    # 링크
-                                    link = news_item.get('href', '')
-                                    if not link or not link.startswith('http'):
-                                        continue
-                                    
-                                    # 출처 (Naver는 항상 "네이버뉴스"로 통일)
-                                    source = '네이버뉴스'
-                                    parent = news_item
-                                    source_found = False
-                                    for _ in range(10):
-                                        parent = parent.parent
-                                        if parent is None:
-                                            break
-                                        source_span = parent.select_one('span.sds-comps-profile-info-title-text')
-                                        if source_span:
-                                            source_text = source_span.get_text(strip=True)
-                                            if source_text:
-                                                source = f"네이버뉴스 ({source_text})"
-                                                source_found = True
-                                            break
-                                    # source_found가 False면 기본값 '네이버뉴스' 유지
-                                    
-                                    # 시간
-                                    published_time = '시간 정보 없음'
-                                    parent = news_item
-                                    for _ in range(10):
-                                        parent = parent.parent
-                                        if parent is None:
-                                            break
-                                        time_elem = parent.select_one('.sds-comps-profile-info-subtext')
-                                        if time_elem:
-                                            published_time = time_elem.get_text(strip=True)
-                                            break
-                                    
-                                    # 시간 파싱
-                                    published_date = parse_published_time(published_time)
-                                    
-                                    # 저장
-                                    c.execute('''
-                                        INSERT INTO news (title, link, source, published_time, published_date, keyword)
-                                        VALUES (?, ?, ?, ?, ?, ?)
-                                    ''', (title, link, source, published_time, published_date, keyword))
-                                    saved_count += 1
-                                    
-                                    if saved_count <= 3:
-                                        log(f"[Naver] ✓ {saved_count}: {title[:40]}...")
-                                    
-                                except sqlite3.IntegrityError:
-                                    pass
-                                except Exception as e:
-                                    continue
+                            page_news = extract_naver_news(news_items)
+                            for index, news in enumerate(page_news[:max(0, 3 - saved_count)], saved_count + 1):
+                                log(f"[Naver] ✓ {index}: {news['title'][:40]}...")
+                            page_saved, page_skipped = insert_news(c, page_news, keyword)
+                            saved_count += page_saved
+                            log(f"[Naver] {page}페이지에서 {page_saved}개 저장 (중복 {page_skipped}개 제외)")
                         
                         except Exception as e:
                             log(f"[Naver] {page}페이지 오류 ({retry_count+1}/{max_retries}): {str(e)[:50]}")
+                            if driver_pool.is_broken(driver, e):
+                                log("[Naver] 드라이버 세션 종료, 남은 페이지 건너뜀")
+                                broken = True
+                                break
                             retry_count += 1
                             if retry_count < max_retries:
                                 import time
                                 time.sleep(2)
+                    if broken:
+                        break
                 
                 conn.commit()
                 log(f"[Naver] 완료: {saved_count}개 저장")
                 
             finally:
-                driver.quit()
-                conn.close()
+                driver_pool.release(driver, broken=broken)
+                log(f"[드라이버 풀] {driver_pool.summary()}")
             
         except Exception as e:
             log(f"[Naver] 크롤링 오류: {str(e)}")
         
         # 뉴스 반환 (published_date 기준 최신순 정렬)
-        conn_read = sqlite3.connect(DB_PATH)
+        conn_read = get_db()
         c_read = conn_read.cursor()
         c_read.execute('''
             SELECT id, title, link, source, published_time, created_at, published_date 
@@ -655,7 +683,6 @@ def crawl_news():
             ORDER BY published_date DESC, created_at DESC
         ''')
         rows = c_read.fetchall()
-        conn_read.close()
         
         # Google과 Naver 분리
         google_news = []
@@ -682,26 +709,27 @@ def crawl_news():
         log(f"\n[완료] Google {len(google_news)}개, Naver {len(naver_news)}개 뉴스")
         log(f"{'='*80}\n")
         
-        return jsonify({'success': True, 'google_news': google_news, 'naver_news': naver_news, 'logs': logs})
+        # ?fields=title,link: 기사마다 해당 키만 (화면에 안 쓰는 컬럼 제외)
+        return json_response({'success': True, 'google_news': google_news, 'naver_news': naver_news, 'logs': logs},
+                             fields=requested_fields())
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e), 'logs': logs if 'logs' in locals() else []}), 500
+        return json_response({'success': False, 'error': str(e), 'logs': logs if 'logs' in locals() else []}), 500
 
 # 저장된 목록 API
 @app.route('/api/saved-lists', methods=['GET'])
 def get_saved_lists():
     """저장된 목록 조회"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('SELECT id, name, created_at FROM saved_lists ORDER BY created_at DESC')
         rows = c.fetchall()
-        conn.close()
         
         lists = [{'id': row[0], 'name': row[1], 'created_at': row[2]} for row in rows]
-        return jsonify({'success': True, 'lists': lists})
+        return json_response({'success': True, 'lists': lists})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/saved-lists', methods=['POST'])
 def create_saved_list():
@@ -712,9 +740,9 @@ def create_saved_list():
         articles = data.get('articles', [])
         
         if not name:
-            return jsonify({'success': False, 'error': '목록 이름이 필요합니다'}), 400
+            return json_response({'success': False, 'error': '목록 이름이 필요합니다'}), 400
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         
         # 목록 생성
@@ -734,17 +762,16 @@ def create_saved_list():
             ''', (list_id, title, link, source, published_time))
         
         conn.commit()
-        conn.close()
         
-        return jsonify({'success': True, 'id': list_id, 'saved_count': len(articles)})
+        return json_response({'success': True, 'id': list_id, 'saved_count': len(articles)})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/saved-lists/<int:list_id>', methods=['GET'])
 def get_saved_list_details(list_id):
     """저장된 목록 상세 조회"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         
         # 목록 정보
@@ -752,17 +779,15 @@ def get_saved_list_details(list_id):
         list_row = c.fetchone()
         
         if not list_row:
-            conn.close()
-            return jsonify({'success': False, 'error': '목록을 찾을 수 없습니다'}), 404
+            return json_response({'success': False, 'error': '목록을 찾을 수 없습니다'}), 404
         
         # 항목들
         c.execute('SELECT id, title, link, source, published_time FROM saved_list_items WHERE list_id = ?', (list_id,))
         items = c.fetchall()
-        conn.close()
         
         items_list = [{'id': item[0], 'title': item[1], 'link': item[2], 'source': item[3], 'published_time': item[4]} for item in items]
         
-        return jsonify({
+        return json_response({
             'success': True,
             'list': {
                 'id': list_row[0],
@@ -772,36 +797,34 @@ def get_saved_list_details(list_id):
             }
         })
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/saved-lists/<int:list_id>', methods=['DELETE'])
 def delete_saved_list(list_id):
     """저장된 목록 삭제"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('DELETE FROM saved_lists WHERE id = ?', (list_id,))
         conn.commit()
-        conn.close()
         
-        return jsonify({'success': True})
+        return json_response({'success': True})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/saved-lists/all', methods=['DELETE'])
 def delete_all_saved_lists():
     """모든 저장된 목록 삭제"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('DELETE FROM saved_list_items')
         c.execute('DELETE FROM saved_lists')
         conn.commit()
-        conn.close()
         
-        return jsonify({'success': True})
+        return json_response({'success': True})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/saved-lists/<int:list_id>/items', methods=['POST'])
 def add_to_saved_list(list_id):
@@ -813,32 +836,30 @@ def add_to_saved_list(list_id):
         source = data.get('source', '')
         published_time = data.get('published_time', '')
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('''
             INSERT INTO saved_list_items (list_id, title, link, source, published_time)
             VALUES (?, ?, ?, ?, ?)
         ''', (list_id, title, link, source, published_time))
         conn.commit()
-        conn.close()
         
-        return jsonify({'success': True})
+        return json_response({'success': True})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/saved-lists/<int:list_id>/items/<int:item_id>', methods=['DELETE'])
 def delete_from_saved_list(list_id, item_id):
     """저장된 목록에서 항목 삭제"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('DELETE FROM saved_list_items WHERE id = ? AND list_id = ?', (item_id, list_id))
         conn.commit()
-        conn.close()
         
-        return jsonify({'success': True})
+        return json_response({'success': True})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 # ============================================================================
 # 클리핑 API
@@ -848,7 +869,7 @@ def delete_from_saved_list(list_id, item_id):
 def get_clipping_list():
     """클리핑 목록 조회"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('''
             SELECT id, name, keywords, repeat_type, send_time, is_active, created_at 
@@ -856,7 +877,6 @@ def get_clipping_list():
             ORDER BY created_at DESC
         ''')
         rows = c.fetchall()
-        conn.close()
         
         clippings = []
         for row in rows:
@@ -871,9 +891,9 @@ def get_clipping_list():
                 'created_at': row[6]
             })
         
-        return jsonify({'success': True, 'data': clippings})
+        return json_response({'success': True, 'data': clippings})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/clipping/create', methods=['POST'])
 def create_clipping():
@@ -894,7 +914,7 @@ def create_clipping():
         keywords_str = ','.join(keywords) if isinstance(keywords, list) else keywords
         repeat_days_str = ','.join(map(str, repeat_days)) if isinstance(repeat_days, list) else ''
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('''
             INSERT INTO clippings (
@@ -906,17 +926,16 @@ def create_clipping():
         
         clipping_id = c.lastrowid
         conn.commit()
-        conn.close()
         
-        return jsonify({'success': True, 'id': clipping_id})
+        return json_response({'success': True, 'id': clipping_id})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/clipping/<int:clipping_id>', methods=['GET'])
 def get_clipping_detail(clipping_id):
     """클리핑 상세 조회"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('''
             SELECT id, name, keywords, repeat_type, repeat_days, send_time, 
@@ -926,10 +945,9 @@ def get_clipping_detail(clipping_id):
             WHERE id = ?
         ''', (clipping_id,))
         row = c.fetchone()
-        conn.close()
         
         if not row:
-            return jsonify({'success': False, 'error': '클리핑을 찾을 수 없습니다'}), 404
+            return json_response({'success': False, 'error': '클리핑을 찾을 수 없습니다'}), 404
         
         keywords_list = row[2].split(',') if row[2] else []
         repeat_days_list = [int(d) for d in row[4].split(',') if d] if row[4] else []
@@ -949,9 +967,9 @@ def get_clipping_detail(clipping_id):
             'created_at': row[11]
         }
         
-        return jsonify({'success': True, 'data': clipping})
+        return json_response({'success': True, 'data': clipping})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/clipping/<int:clipping_id>', methods=['PUT'])
 def update_clipping(clipping_id):
@@ -972,7 +990,7 @@ def update_clipping(clipping_id):
         keywords_str = ','.join(keywords) if isinstance(keywords, list) else keywords
         repeat_days_str = ','.join(map(str, repeat_days)) if isinstance(repeat_days, list) else ''
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('''
             UPDATE clippings 
@@ -983,25 +1001,23 @@ def update_clipping(clipping_id):
         ''', (name, keywords_str, repeat_type, repeat_days_str, send_time, 
               max_articles, include_summary, include_links, slack_webhook_url, clipping_id))
         conn.commit()
-        conn.close()
         
-        return jsonify({'success': True})
+        return json_response({'success': True})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/clipping/<int:clipping_id>', methods=['DELETE'])
 def delete_clipping(clipping_id):
     """클리핑 삭제"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('DELETE FROM clippings WHERE id = ?', (clipping_id,))
         conn.commit()
-        conn.close()
         
-        return jsonify({'success': True})
+        return json_response({'success': True})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/clipping/<int:clipping_id>/toggle', methods=['PATCH'])
 def toggle_clipping_active(clipping_id):
@@ -1010,22 +1026,21 @@ def toggle_clipping_active(clipping_id):
         data = request.json
         is_active = data.get('is_active', True)
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('UPDATE clippings SET is_active = ? WHERE id = ?', (is_active, clipping_id))
         conn.commit()
-        conn.close()
         
-        return jsonify({'success': True})
+        return json_response({'success': True})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/clipping/<int:clipping_id>/send', methods=['POST'])
 def send_clipping(clipping_id):
     """클리핑 실행 및 Slack 전송"""
     try:
         # 클리핑 정보 조회
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db()
         c = conn.cursor()
         c.execute('''
             SELECT name, keywords, max_articles, include_summary, include_links, slack_webhook_url
@@ -1033,10 +1048,9 @@ def send_clipping(clipping_id):
             WHERE id = ?
         ''', (clipping_id,))
         row = c.fetchone()
-        conn.close()
         
         if not row:
-            return jsonify({'success': False, 'error': '클리핑을 찾을 수 없습니다'}), 404
+            return json_response({'success': False, 'error': '클리핑을 찾을 수 없습니다'}), 404
         
         name = row[0]
         keywords_str = row[1]
@@ -1046,7 +1060,7 @@ def send_clipping(clipping_id):
         webhook_url = row[5]
         
         if not webhook_url:
-            return jsonify({'success': False, 'error': 'Slack 웹훅 URL이 설정되지 않았습니다'}), 400
+            return json_response({'success': False, 'error': 'Slack 웹훅 URL이 설정되지 않았습니다'}), 400
         
         keywords = keywords_str.split(',') if keywords_str else []
         
@@ -1058,24 +1072,9 @@ def send_clipping(clipping_id):
         
         # Selenium 사용
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.chrome.service import Service
-            from webdriver_manager.chrome import ChromeDriverManager
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.common.by import By
-            
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = driver_pool.acquire()
+            print(f"[드라이버 풀] 드라이버 대여 (대기 {driver.lease_wait:.2f}초)")
+            broken = False  # 세션이 죽은 드라이버는 풀로 돌려보내지 않고 폐기
             
             try:
                 for keyword in keywords:
@@ -1085,7 +1084,7 @@ def send_clipping(clipping_id):
                     # 구글 뉴스 크롤링
                     try:
                         encoded_keyword = quote(keyword)
-                        google_url = f"https://www.google.com/search?q={encoded_keyword}&tbm=nws&hl=ko&gl=KR"
+                        google_url = f"{GOOGLE_BASE_URL}/search?q={encoded_keyword}&tbm=nws&hl=ko&gl=KR"
                         
                         print(f"[Google] '{keyword}' 검색 시작")
                         driver.get(google_url)
@@ -1094,8 +1093,9 @@ def send_clipping(clipping_id):
                         import time
                         time.sleep(2)
                         
-                        soup = BeautifulSoup(driver.page_source, 'html.parser')
-                        articles = soup.find_all('div', class_='SoaBEf')
+                        snapshot_store.save('google_news', keyword, driver.page_source, url=google_url, source='clipping')
+                        soup = make_soup(driver.page_source)
+                        articles = soup.find_all('div', class_=GOOGLE_NEWS_CLASS)
                         print(f"[Google] '{keyword}' 검색 결과: {len(articles)}개 발견")
                         
                         for article in articles[:10]:
@@ -1130,10 +1130,14 @@ def send_clipping(clipping_id):
                                 continue
                     except Exception as e:
                         print(f"[Google] '{keyword}' 검색 오류: {str(e)}")
+                        if driver_pool.is_broken(driver, e):
+                            print("[드라이버 풀] 드라이버 세션 종료, 남은 키워드 건너뜀")
+                            broken = True
+                            break
                     
                     # 네이버 뉴스 크롤링
                     try:
-                        naver_url = f"https://search.naver.com/search.naver?where=news&ssc=tab.news.all&query={quote(keyword)}"
+                        naver_url = f"{NAVER_SEARCH_BASE_URL}/search.naver?where=news&ssc=tab.news.all&query={quote(keyword)}"
                         
                         print(f"[Naver] '{keyword}' 검색 시작")
                         driver.get(naver_url)
@@ -1141,8 +1145,9 @@ def send_clipping(clipping_id):
                         # 페이지 로딩 대기
                         time.sleep(3)
                         
-                        soup = BeautifulSoup(driver.page_source, 'html.parser')
-                        news_items = soup.select('a[data-heatmap-target=".tit"]')
+                        snapshot_store.save('naver_news', keyword, driver.page_source, url=naver_url, source='clipping')
+                        soup = make_soup(driver.page_source)
+                        news_items = soup.select(NAVER_NEWS_SELECTOR)
                         print(f"[Naver] '{keyword}' 검색 결과: {len(news_items)}개 발견")
                         
                         for news_item in news_items[:10]:
@@ -1169,11 +1174,16 @@ def send_clipping(clipping_id):
                                 continue
                     except Exception as e:
                         print(f"[Naver] '{keyword}' 검색 오류: {str(e)}")
+                        if driver_pool.is_broken(driver, e):
+                            print("[드라이버 풀] 드라이버 세션 종료, 남은 키워드 건너뜀")
+                            broken = True
+                            break
             finally:
-                driver.quit()
+                driver_pool.release(driver, broken=broken)
+                print(f"[드라이버 풀] {driver_pool.summary()}")
         except Exception as e:
             print(f"[크롤링] Selenium 초기화 오류: {str(e)}")
-            return jsonify({'success': False, 'error': f'크롤링 초기화 실패: {str(e)}'}), 500
+            return json_response({'success': False, 'error': f'크롤링 초기화 실패: {str(e)}'}), 500
         
         print(f"[크롤링] 총 {len(all_news)}개 뉴스 수집")
         
@@ -1182,7 +1192,7 @@ def send_clipping(clipping_id):
         
         if len(all_news) == 0:
             print("[오류] 뉴스를 찾을 수 없습니다")
-            return jsonify({'success': False, 'error': '뉴스를 찾을 수 없습니다. 키워드를 확인해주세요.'}), 404
+            return json_response({'success': False, 'error': '뉴스를 찾을 수 없습니다. 키워드를 확인해주세요.'}), 404
         
         # Slack 메시지 생성
         today = datetime.now()
@@ -1215,13 +1225,13 @@ def send_clipping(clipping_id):
         success = send_to_slack(webhook_url, message)
         
         if success:
-            return jsonify({'success': True, 'message': f'{len(all_news)}개 뉴스 전송 완료'})
+            return json_response({'success': True, 'message': f'{len(all_news)}개 뉴스 전송 완료'})
         else:
-            return jsonify({'success': False, 'error': 'Slack 전송 실패'}), 500
+            return json_response({'success': False, 'error': 'Slack 전송 실패'}), 500
     
     except Exception as e:
         print(f"[클리핑 전송 오류] {str(e)}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}), 500
 
 # ============================================================================
 # 자동 전송 스케줄러
@@ -1238,17 +1248,16 @@ def check_clipping_schedule():
         
         print(f"[스케줄러] 체크 시작 - {now.strftime('%Y-%m-%d %H:%M:%S')}")
         
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
+        # 활성화된 클리핑 조회 (스케줄러 스레드는 요청 밖이므로 풀에서 직접 대여)
+        with db_pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, name, send_time, repeat_type, repeat_days 
+                FROM clippings 
+                WHERE is_active = 1
+            ''')
+            clippings = cursor.fetchall()
         
-        # 활성화된 클리핑 조회
-        cursor.execute('''
-            SELECT id, name, send_time, repeat_type, repeat_days 
-            FROM clippings 
-            WHERE is_active = 1
-        ''')
-        
-        clippings = cursor.fetchall()
         print(f"[스케줄러] 활성화된 클리핑: {len(clippings)}개")
         
         for row in clippings:
@@ -1281,8 +1290,6 @@ def check_clipping_schedule():
                     except Exception as e:
                         print(f"[자동전송 오류] 클리핑 '{name}' (ID: {clipping_id}): {str(e)}")
         
-        conn.close()
-        
     except Exception as e:
         print(f"[스케줄러 오류] {str(e)}")
 
@@ -1293,15 +1300,14 @@ def send_clipping_internal(clipping_id):
     """
     try:
         # 클리핑 정보 조회
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        c.execute('''
-            SELECT name, keywords, max_articles, include_summary, include_links, slack_webhook_url
-            FROM clippings 
-            WHERE id = ?
-        ''', (clipping_id,))
-        row = c.fetchone()
-        conn.close()
+        with db_pool.connection() as conn:
+            c = conn.cursor()
+            c.execute('''
+                SELECT name, keywords, max_articles, include_summary, include_links, slack_webhook_url
+                FROM clippings 
+                WHERE id = ?
+            ''', (clipping_id,))
+            row = c.fetchone()
         
         if not row:
             raise Exception('클리핑을 찾을 수 없습니다')
@@ -1326,21 +1332,9 @@ def send_clipping_internal(clipping_id):
         
         # Selenium 사용
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.chrome.service import Service
-            from webdriver_manager.chrome import ChromeDriverManager
-            
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = driver_pool.acquire()
+            print(f"[드라이버 풀] 드라이버 대여 (대기 {driver.lease_wait:.2f}초)")
+            broken = False  # 세션이 죽은 드라이버는 풀로 돌려보내지 않고 폐기
             
             try:
                 for keyword in keywords:
@@ -1350,7 +1344,7 @@ def send_clipping_internal(clipping_id):
                     # 구글 뉴스 크롤링
                     try:
                         encoded_keyword = quote(keyword)
-                        google_url = f"https://www.google.com/search?q={encoded_keyword}&tbm=nws&hl=ko&gl=KR"
+                        google_url = f"{GOOGLE_BASE_URL}/search?q={encoded_keyword}&tbm=nws&hl=ko&gl=KR"
                         
                         print(f"[Google] '{keyword}' 검색 시작")
                         driver.get(google_url)
@@ -1359,8 +1353,9 @@ def send_clipping_internal(clipping_id):
                         import time
                         time.sleep(2)
                         
-                        soup = BeautifulSoup(driver.page_source, 'html.parser')
-                        articles = soup.find_all('div', class_='SoaBEf')
+                        snapshot_store.save('google_news', keyword, driver.page_source, url=google_url, source='clipping')
+                        soup = make_soup(driver.page_source)
+                        articles = soup.find_all('div', class_=GOOGLE_NEWS_CLASS)
                         print(f"[Google] '{keyword}' 검색 결과: {len(articles)}개 발견")
                         
                         for article in articles[:10]:
@@ -1395,10 +1390,14 @@ def send_clipping_internal(clipping_id):
                                 continue
                     except Exception as e:
                         print(f"[Google] '{keyword}' 검색 오류: {str(e)}")
+                        if driver_pool.is_broken(driver, e):
+                            print("[드라이버 풀] 드라이버 세션 종료, 남은 키워드 건너뜀")
+                            broken = True
+                            break
                     
                     # 네이버 뉴스 크롤링
                     try:
-                        naver_url = f"https://search.naver.com/search.naver?where=news&ssc=tab.news.all&query={quote(keyword)}"
+                        naver_url = f"{NAVER_SEARCH_BASE_URL}/search.naver?where=news&ssc=tab.news.all&query={quote(keyword)}"
                         
                         print(f"[Naver] '{keyword}' 검색 시작")
                         driver.get(naver_url)
@@ -1406,8 +1405,9 @@ def send_clipping_internal(clipping_id):
                         # 페이지 로딩 대기
                         time.sleep(3)
                         
-                        soup = BeautifulSoup(driver.page_source, 'html.parser')
-                        news_items = soup.select('a[data-heatmap-target=".tit"]')
+                        snapshot_store.save('naver_news', keyword, driver.page_source, url=naver_url, source='clipping')
+                        soup = make_soup(driver.page_source)
+                        news_items = soup.select(NAVER_NEWS_SELECTOR)
                         print(f"[Naver] '{keyword}' 검색 결과: {len(news_items)}개 발견")
                         
                         for news_item in news_items[:10]:
@@ -1434,8 +1434,13 @@ def send_clipping_internal(clipping_id):
                                 continue
                     except Exception as e:
                         print(f"[Naver] '{keyword}' 검색 오류: {str(e)}")
+                        if driver_pool.is_broken(driver, e):
+                            print("[드라이버 풀] 드라이버 세션 종료, 남은 키워드 건너뜀")
+                            broken = True
+                            break
             finally:
-                driver.quit()
+                driver_pool.release(driver, broken=broken)
+                print(f"[드라이버 풀] {driver_pool.summary()}")
         except Exception as e:
             print(f"[크롤링] Selenium 초기화 오류: {str(e)}")
             raise Exception(f'크롤링 초기화 실패: {str(e)}')
@@ -1488,6 +1493,25 @@ def send_clipping_internal(clipping_id):
         print(f"[자동전송 오류] {str(e)}")
         raise
 
+# ============================================================================
+# 드라이버 풀 / DB 연결 풀 / JSON 응답 상태
+# ============================================================================
+
+@app.route('/api/driver-pool/stats', methods=['GET'])
+def get_driver_pool_stats():
+    """드라이버 풀 사용 통계 (hit/miss, 대여 대기 시간)"""
+    return json_response({'success': True, 'data': driver_pool.stats()})
+
+@app.route('/api/db-pool/stats', methods=['GET'])
+def get_db_pool_stats():
+    """DB 연결 풀 사용 통계 (재사용/생성, 반납 시 롤백)"""
+    return json_response({'success': True, 'data': db_pool.stats()})
+
+@app.route('/api/response-stats', methods=['GET'])
+def get_response_stats():
+    """JSON 응답 통계 (엔드포인트별 요청 수, 원본/전송 바이트, 평균 직렬화/압축 시간)"""
+    return json_response({'success': True, 'data': response_stats()})
+
 # 스케줄러 초기화
 scheduler = BackgroundScheduler()
 scheduler.add_job(
@@ -1515,4 +1539,13 @@ if __name__ == '__main__':
     # 앱 종료 시 스케줄러 종료
     atexit.register(lambda: scheduler.shutdown())
     
+    # 드라이버 풀 예열 (백그라운드) 및 종료 시 정리
+    threading.Thread(target=driver_pool.warmup, daemon=True).start()
+    atexit.register(driver_pool.shutdown)
+    atexit.register(db_pool.reset)
+    print(f"[드라이버 풀] 크기 {driver_pool.size}, 드라이버당 최대 {driver_pool.max_page_loads}회 로드 후 재생성")
+    print(f"[HTML 파서] {HTML_PARSER}")
+    print(f"[DB 연결 풀] 유휴 연결 최대 {db_pool.max_idle}개 재사용")
+    print(f"[JSON 응답] 인코더 {JSON_ENCODER}, 압축 {'/'.join(JSON_ENCODINGS)}")
+    
     app.run(host='0.0.0.0', port=8855, debug=False)